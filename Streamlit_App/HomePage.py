@@ -1,10 +1,7 @@
-import warnings
-import sys
 import streamlit as st
 import streamlit.components.v1 as components
-import pandas as pd
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
+
+from assets import image_tag
 
 
 
@@ -21,11 +18,10 @@ components.html("""
 """, height=60)
 
 
-components.html("""
+components.html(f"""
 <div style="max-width:900px; margin:auto; color:#EAEAEA; font-family:sans-serif; line-height:1.6;">
 
-    <img src="data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wCEAAkGBxMTEhUSExMWFRUVGBUVFRcXFxYYFRcXFRcXFhUVFxUYHSggGBolHRUVITEhJSkrLy4uFx8zODMtNygtLisBCgoKDg0OGhAQGy0lHyUtLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLf/AABEIAKMBNgMBEQACEQEDEQH/xAAbAAADAQEBAQEAAAAAAAAAAAACAwQFAQAGB//EADwQAAEDAgQEBAMHAwQBBQAAAAEAAhEDIQQSMUEFUWGBEyJxkTKhsRRCUsHR4fAGFWIHIzOScjRTY4Ki/8QAGwEAAwEBAQEBAAAAAAAAAAAAAAECAwQFBgf/xAA7EQACAgEDAgIJAwIEBQUAAAAAAQIRAxIhMQRBUWEFEyJxgZGhsfAywdFC4RQjYpIVM1JyggZDotLx/9oADAMBAAIRAxEAPwD8lbQW5w6hrcMgnUObhUxahjcGgWoppYKU6JchowKKFqOnCgIoNR1mEJ2ToWoNmAM6IoWosbggBonQrYH2Toig1DRgOiNItQ0YEck9ItYqpgEtI9Qp2FHJFDUhbcGeSVD1IN2CCdC1CXYKEqHqAdhAih6hVbCQlQ1IAYMnZFD1HH4HolQahT8HCB6hRwqB6gXYVAWLdh0Ds59mJ0BPohlLU+EC/CEagj1BSTTKakuUxD6aYKQTaSBagXsSBMAU0F6jppwgWoDKgqwSEDTPZUBZ7KgLFvagpMENQVZ9PTwaZw6imlgk6J1FDcKE6JsezDAp0S5FNLDNCpJEuQVSiEUFhUcK0ppCcmUjDgJ0TbZDj8Y2mCN15+bM9VI+m6HoYRx6pcmA7jbwbLJTkdcumxyXB9HwXFtrNncarvwZNSPnev6Z4pWuDQeWrc87cS+qJhKx0PbRDgqoVixQA2U0OwK1NNoExDKKmirD+zAp0LUTjDjMlRVh1MKihajgoABFD1CX0eiTQ0xL6EpUVqFnASlpDUKrYOEqKUjR4PwAOOepZn1XLnzadlye16P9HPN7eTj7n0DMbhaflDQAN1wuTZ9HHFjxqkjw47hdCwO6x+qSsJKD7GJxjgVGrNTDwObdv2K6cOdraR5HW+joz9vFsz5l+C6LuPnba2ZI/BFA1IF2FIQNSOCid0BZx2GQGoSaPRBVgZUh2cNNA7OeEgeoF1NAKR9VTVo5WUMKZIUJiDIOyYgfCcd0gtFtKna5TIbHBwGidpFKEpcIoaZCmU0kdGHppOas+I4xWJqOHVeW+bPrIbQSIA1Bokbf9OOIcQN1rhnpkcnXdOsmOj6nwJGq7llTPnX0E0TeDeVSaOeeGcdjSw5stUczVA1ghgiepJ2UjO+GmFgwdAEgAOHi+6KHYyjU2KEI86huih2NDbaJ0KyerTCmikxJppUOwsPgc5GbTdTPaLZv00PWZVEVxTHR5AbBeM92foOOKhBJGFVqlxKYmjnhygaiWYHHPY4DY2KEjDItKZRjIzHrdepD9KPiupX+dL3kbmdFRjYr7PKVDs8cGUUGomrUCEikzzKUhMGxNXDAJDUgG00DsW+kgaYr7OUD1GqKyZix1OunYh7cQE7FQ37XyTsVHaFRxRY1GxxI7rKc2d2HBDujzsQVzTyWz1cGBQQTcc6CAFnKTN4Y4XbMWtgsxzE3Nypao2WSLdIjcxrZvolZtaSKMNjWshzVUYuzHPnhpoup8cJPJaaZI5Vmh3LsNxWTZVGUiZRxvdm5hMQCF245Wjw+sgovgc+otzzX5HjUGwQIlynNdIoJz4QAulWzmErsKoLwwCnQWUSmLlhsbKlyRtDDNy4FvpBZOR2rCns0Tlg2UvKhR6KV8HqYdBIGxXPl6haaPT6L0e45FM+brsJcZ5rgPp4hspWQWce2NroGBQMub6pmeVXFmhiQC5enjktKPierwyWVsS5w2WidnG4uPJzS6YgDU5pDone3MUho81oagLF1aJKQ7FvoQEUOyQsMpDsYAmJsQHBAxjaqESxtNyokppEoAobVKTRpjmkEx6lrY2jlV22GWysXjs9CPUxR0MIGql4nZourjKLfAHgQEPE2L/EwxrYRV4WDf3UPGzRdQmrYpnCRJjQq1idGMuqgpUAzg7losUmc8+qgpFFDhLxutI4TlydbeyNfCYZ43W0YUcc87lyatJvNa0c7YbjyTEA5vVKgsE0u6KHZ0NDbgQigsW8OcVLLhG9h7ardCbrOU29kjvxdNjj7c5DWgRYyspY5d2duLq8F1FWFRouOgK5pKK5Z6kPWZP0RHO4ZPILCUvA9LF09r20R42p4LSBdY7m7w6eDBoU80k7o4NYRCe0BFjaoQ+hN5TsVB0KY+JBLca3BxGHF3ArWOR8Hl5Ok31Iia9zdlrHKzjydMnyhza8rojM83N06XCGPpghbI817Mme7KgBFUzdIBzKsC6YBeIN0hi61OdAigJxTIQFkLGBA2xzQEyWxzXIJsYKiYmxlNyYrHB4ToljGPRQa2hocnpFrdUFnT0oUsjYbYOpS0ofrpB5mhVpRnrZ77SihuTfI9j3ETComwqeJhFgVUHF5AEydghulbHGLlJRirbNT+0uEZ3ZQQD5YeYIJBgEctDfouafWY48bnsYPQXU5L1VH3v8AEebgaMXrjaCDTjS9i8EfyyyfXLsvqdkf/Tc69qe9+D4/n6Fw4MwtDm1BBIES0uBIkAixEgEi09E11qrdbkS/9Pv1jSnt5rt33W2wNTgI1za3AJ80ag3AzDqAujDnhkpPZnndd6Lz9NcorVBf1bfXwYJ4LG9l0aUeXGbbpDaXCKOpN1k2+x34sGN/qkXU8FTAsFMsLlydWD0jhxOoR+JNiWFvwrjl0km9j2Y+nMEYW3uZ2KoVHNO3VRLp9L3NYek3mj/lp2YFR7pgguj2UT017KFieZyvJJmNxeu6m4ZN9Qs4w1I1n1MsU1uSt4o8OaxzZDt+Xqo9Wbf413T7jMVxZ7AaYpzOjp07Qlo7mj6uadUM4DiZd52GFWl9jP10JP2z6epwmlUEsfldyn8lLk1yjaOGMleORl4rhLmHWVVoxeKa72QVqJ0iCN1pHyOXIml7SAlzeq6YWeXnUa3Quq7Nqtrfc86UY/0ifCk3NkzOxwaNEBZ6tTCAs8ypaEAA8IGzPDEUTYeVOhagmhAmw2khMmxrXJksa2mTsqoWoY2i5Glk60MFFyrSS5BtwzuSKFqGtwpToNQ5mGnYp0KyuhghyKdCcjSo4IclVE6iqnw5sE5dBJtoBqbKZyjBXI0w4suaahjVt/m5DV4iKchhIBgEAARIvc3afSx+S8PLnlkk3ex+g9L6OxdPjUVHfx7tv9jlPiLC0l73Cx8pzFppn4i0ZpkwDpFvRZUdmtLhEzeNsgObPlMPe4uDgI8uUhxPQwNhonpKjJNvb+PzwG4X+pKzjmYS0AgC7ocNJGxcCZuNQAOSdUZSimqS/PeaGE/qc02spVHBsucZGWDYAOgjyaHSddzKdtF6Iyk3Ncr89/xPocMQ9uZrg4TBIc0iQAZIEFsyCLAXtsvT6fq9VRl8z4/0n6EePVlwcc6fBeTb3r5nQGcl6FHzik1wOZkUu+xrjWPmTOuqAaMWbg3yzrh1eLGvZhuR4sg/dWM+nTZ6HT+l5Ri3svIyMfTEHK0DsofTQTor/i2eWLUqPn8Vw8O+IQscmGnsdPTdW8sW5ciWcOaNddk8mJVZn03VNycWR4nAuJ5IWDUiZ9f6uVWaeCw7Q0AkB06rnnhalsepg6qM8XtPc1qfDw6+UyNwrWFy25RD6nHh9qTqX3Km4BztZ7q10jW7M5emMeR0nuKq8B3K2h0yW6PP6j0nJtwl8zLxPByNlr6pHmvqpPazMrcLPJGkjWSPwJCmilIDwiEqCwX0ygqxTQQgLFOvvCQxDKaqiHIblToiwmxyTEMYAmS2xuUJ7E2MaQmSOptnQpiKqdMpiKqdP1VIQ4M7JiK8LhnO0v0SckuTXHhnkvQrK6NDYiCqVMylFxdMsYwjUJkHz/GeJ+ctBbAJAiTcETdpEG3VeF1OR5Mj8FwfovovpcfTdHCv1SSctu73+hg1Gw3k43Bk3B53ganabLE7dVgMqZSDJloIa4QDfnE7bT3TQkrAwzS3zf8A2ABEGOY58kGnkMfU8oEARJ0A+Lfme+yZPDBqUWuawz5585H4XHlGsnadSkFb8n0HB+Jtp1WMaIp6EmSI0JOTKXEGDJ3HIXpJob3Tit/l9LPt2YcOuHBzTcETcbG9/de7ik5QTZ+bdbhjhzzxxuk+46lQA0Why0xhHRACnk8kCI61EnZKilJ1RBWwY3CTimVHJJcMR9gCWhcFLNJS1dx1Phc7IUaFLI5O2MdwRp5JerXJSzzSq9g2YZ1MQ1CglwVPqJzjUmC3EP0KZiedjB94kIVIuUpS5E1cazmiyaZHXeDoApLSZn1cOD1KlovUT1MIRyU6SlIz6lIhRRakSmnKVFWT1aQSAUKIVUZ6hraQVUTqOuohOhamCMP1RQaxzafWU6IbKaOXkqJK2UWlMBtMRp80AX4ZzjsqRLRZ4TnCMspSko8m2DpsmZ1BHHYIsIe1wEagX/NYym5cRs9HH0kcMt86i/I1XYrNRaQzO6fMRAgfoowyayNNUb+kcccnTRyRam095Ig4nUcykXmW8uUmw+ZW2eenG2eX6Pwet6mEHxdv3Lc+OqVQZ9tSbes/l+i8I/QrbZM66Vmq2POP85pghsSL7X12P8CfYcTz2yh7jSaOeHN/foeapGbXiU4dkFu8mc0DuJ3GkhbRiYydbn6dwatFCm/JIgauc4Ai2jri4Nrjkuvp9TjpT2PB9LQwYsizThqey8vK/F+ZRia1XKbBu+o09NltjSUquzi6uc5YHPRp+K+xn1MU9oBcDB0MWPNdVo8FwnV1ydbWJ+6fYpOcfEtdPmfEX8hT67tA0/RNNMiWOUf1KhZqu+8EEhAN216IA54j9kAMo1nfeQBUKwKABBB5IAXVaN2hJgQ4nD03aiEqKUmZlfC0xpPZS0i1JiqeX8UdkqKsVXYeaVDTM+vTA3UNFpmXUouJsVFFWedhxuZRQ1IS0TsrMWMbSPJOibDDDpCYgxS5JgdFIboAobhQdLj1uigLsNQt8BVIlmlhqI3hvr+iUpVwjbDhU7cpKKXiaNHCj8XpZZyzOKto7sPozHmlphl/+LoKvgHOAfTcSQJIgaek3Uwzwyc7MrqfRvU9Inpbce9bEsWMua0jUHX2WspuOyRyYOkjkjqlNRXmUYCvGVzC2+5Mz0gLCankSaVHp9LPpekck5OS7qtmJ/q/GRhgyId4jDYy2BJsSOcLlzrJFe2ez0U+lyf8l8dmqaX8HwxM9Y6/yFxM9aCrc4RKRe7PZd5TK09xgCB9go/dANbBZNAI9dvdXEiSXY0MwhmVuWC7c5pBAmOU/Vbyl7CM4wuVVZ93wCoBSAk9AAfWWyAYIjXsljm1tvXgZ9ZgjKTapN93/HFoso4VmeS55dY3s3vIXV6+1pUaPFfoqpeuyZHLy2d+VFeSbZ3AbCxHayqCUf1KzPqFll/yZKPk1X1EHh5d99w6j9IhaOePhL5nIsHW1qnkdeW/2C/tbNPO48ybLSMorujjz4cuV1U2/NE9fgZPwuI6GCFoskX3OWXQ54/qiSDgZ3eR6Ktmcri1s0ObwtoFy490yQXUaYtfuUASPwjNfMe8ooDrjlFpA9EATOrk6Gf51SAU+vGyQwDXjYIHRNVq5tWjtdIpbCHUnJUVZDXpjcqGi0zPqjkbKGirJqgb+IpUirYDWuHMrTcw2Y4OIFwQgVBU3jWSmAQqCYiErGkeLTeDP1Q2aRiPwr2yAdT79ktSHob4Nejhz+MDoSAfmUnmguZI2h6P6nIvZxt/AYXmQQGnY6k9iJXPLNC/1NntYOg6qtsEY+DfJ3E12tIJc8GND5RfqTPyUrKv/bgzTJ0km0+rzxSXZF3DeKOzNewsB28rnHlcyPopWCcltSOiXpTpIvTJzkuPL4IsxDGuu+lbm0hzfZ0FvutP8Tkx7ZInLH0H0vVJz6TL8H+WTRRa2WAA/hd5e4Jt80v8WnxsWvQEsVesTl7mlRh/1RxIvApkiGnbc/tK5cueU1TZ6fTdDgwS1RjTfndHz4p2me28LmPRUK3s6Wm4j9uSC6fB0Nm3JA9NqggJ0RY6vgJjZt6J+ZL/AOkKIn0EE9FSZEobj6LXvIGpmzf/ACttqbBXdocU1I/QOFf8LWnKYLwycxLgDDoLgCCHA2nfRVDJKG8djl6npcXUSccitbfD5DSWNaTFQkRmEgDoLX7Lf102qSOD/h2CMm3kpLwfHyKKdUiHNIbmIGUAFw5AEzJ9IWmjM1cnRzxz+joz0wjqb77/ALgVfHc4tLjObS8gcoErn/y3y2d0pdRjWrHCNe+v2HUC4TIcQLenWAnBY0/H37Bmy5pY7a0Py9r6DqTpOjj2AHsbrpi4eC+Z5c/8QlfrJf7A6jnDePUfuuhQ8F9TzsnWaXUsjvzgid2Jb/7kn/xsqjGnx9Tky51OLWtf7aYsvB2zLY806MvKOyABcI0goERYljDq0A80UMw6uIZMEG3SFLZSTAphhPlBHUi3ZIe6Hmuxtt/5yT2J3Fvg7wkVZHiqJP3QRz/ZJoqLEVOHtjcdktI9bIKvCW/iPsFDgWshO2pGqoxKabgmFMfSotN06FZ7EcPDv1E/klKOxpidum695GMO1hjzE9QY+i52pvyPRxz6aO7Tm/kv5O06780BgyiLeb+FZSwW922d+P0pKEWscIRfusvNWsPgEDo0z8lrHFCPCOTL6Q6nI/ayP4Ol9BlKrWF6hMfiIcI+aty0djLFCXUN6slf9zb+S7h1WMdDhVBI2gEe2qxnKUt3S+J39Piw4rjGUnf+hfS2MZiGxALRU0bFgAPivudNBsuXLkd1H6HtdJ00a1Zd2uNVX8UvsW8P408NIJJbPmLYi3Nzh+amEkt5WdOXHK1GEY/F7/KJFxjHSM0mkzYwRUqHmG6gLGTTex6EJz0f5jTfgj5WpVzHpt+/VSSkV0KYOt1JrGCGmhBnpCRek6KYQOgXM5JioH7OTaLn5KomU4jfBMQd/wCfkhjitqZbSwZAuLn5RohujWEL3Zr/ANOVjRqOeaXisc0scwwJmCDcESI5JxkRn6Z5I7PS13Pov7lTcyG2j4aVZ2VgneXBwPoKjeyuM2uNjgydJJ7ZY2ny0rf7fZiqtevRDahzk/cIY0tv+EARA9Vs4tq9Rzes6e9Hq0vPj5kFDiwynMRBMksYWEkm7S6XZo/DFlnF0/H3msoJx3bjfeNv7o0aGMploIaTvD2me2i1c2uYr5GOPApvbNJ/+X7UMGIAcHAuaDtBiOp/dXDfdL5GWd+r9ieRr/uimvnSGeIXny5neoOXs4BdnTyuz570vj0yjpdp+XH32+ILqNR1o9zb6LpPEpnhhajblzbfJFhpDzGJkH0ulZWhEz6jCYzfJOyaR52WPiTJA+zCJN+sKWy1DYnqYSZ0j0QGkhfgKY0aZ6T+qQ9yU8Oebtzfzmih2XCm5oAMBAtKJsQw9ECcWiB7QFJSIadEKqMrZyphnT5SPchFD1LuWUcOY1vHb9U6FqPOYQQMwnXn8oRQakOa+YmL9LfNSbR42OnDtPT0/RKkUrBcwtIEnKd4JHpI0WOWbh2PQ6Tpo5+XXkk23+31Gl9MN/5S6fwDMfSR5R3XLk6h1V/I9/pPRMFNScJf+VJfLclFJmacuaDLc5t/1ZMnrK4nI+hx4dOy2G0sQ14lga4SRDKQcLcnVLFKmU4Qjz/BNjOKPY0kiuGDUgsptG33SE6Yv8lbpE9Kg2tLi17CdDUJzO9xMJrHfczn1OOPCv3GViKWV5ZEmYEbnp7hS406HGakrR9Pwz+m6xAJEHlae6NDIfVwi6HcY4E+izxHREga7nT1UuDRti6mGR0uTAc6CpN2OoiYtrogVobWpFvRFjasmwT2iqwONi5oNtpElVExmu6P0DhzMO8eR9MxuC1/00WsVHuYZZ5V4m1RwlICwHaF0xjCjillzXyQcWoMGVzX6GXMdHnbGgJBIKzyRilszo6fLkbafzXY+drccptcRRp1Gv8A/jzz3yfmufUr2O/1TavK015pFdDHeK0Gq0B25OXN3adfUZR6queTm0xg36vj6fNfvZS91Kp5ZlwGY2JgTEyycoki/VXSXKoxbk700+2zoVhnsaYBNrEEP/N35LRJy4r6fyc85xxbzc798pL7cFbeLsBAmfuwA037ulVreN1KJm8EeqjqxZa9z/ZrYpfxIAhsiXTAcQDps2TK6MWdN7J/c8nrPRc9D1zi/N+y/i6phMc8mMl+dvob/JdqnFnzmXpM+HeS27Nbp/FbCq3Bc1y8tP8AjH5p34GWjvITT4G2Zc5zuRMfogSSsopcIpNvE+unslZelIocwaR7I0j9YS1KbOSKFrRPWozoigbQo1A0RmEjYpOxqq7EVV7zeGx6pkNd0R4nNGw6SlRWttEzq4bbU7mUtwqNGLi3FkHQG3dN7Ga9o5TxRJ6ITE0aGHqDmndAk32CxNVpjQ5dZMQOc80nkguWjaPR9RL9MJfJnm4tv3b9SYHS5v7LF5dX6Ff2/ud2PoVi36ieny5l8u3xYyk4OuXRP4QBPcye4WbU5cyr3HbCXTY1/l49XnJ39F/I5opWzNJPNxLz2JJ+iyeOC5/lnoY+rzSVY9l7lFfz9TlfEDZmmwMkjkTHl9AQsZPwX5+eB6GK3+rI/k6+HF/GyXEupT5mtuJmmHZz/i+oZOXppzss5OPf6GsIz3cG/jXHkkUjjIyhpa6TYEtY5oGwaHNB/wD0EPLarc0j0yjctvhd/QBnD6rmh72w77rqhHkAsIazygxq7U+ijTKuDVSgnzfuMfGY4udDP98g3IzBvZwu7tbqpafdl6Y1sqLeGFxrtfTo+JUNNvhiYpMkkPe8nS4tuZO4RExn+mm6R9OzgnEqo/8AW0qX+NNjmj0z/EtEmYLLhj/TZl8B4C+pxH7LjnPcWU3VP+Rxz3blyvN8pzE2g+WOaIwt0zpy9Rpwa8W29cDf9TeBtwz2VaQDaVTy5Ro17QPqBPqClkhW6J6LqZZIuMuUfaf6d8Mp08HSqgAvqtzudvBJytB2AEfNbY4pRs4eryylkceyM7/VfFZMPSaLF9W53yta4kT6lvspyrY39Gp+sb8EfP4r/Tur4LKlN7XPLQ59M+UgkTDXaHYXj1WTxutjqh10NbjJbeJPwzC0qby3F0XUqsy2u3M2+2dosN/OO/NZ7LZnXJ5K1YmpR8OTWrVn0tctRhGZjzHmHIvaRPRxJHNO6IUIZN42vFeHwf8AbyDq0xVaPic0yRlFxBIgkwWuEQWm4Nj1rnkiGTTuqT8/zjwYqnSgQwFhG4pm8figpxbXAZGpO5O/iRVMNWzFzhkHmBc27T1zH4Tobi0XCak7vgxlHHTjyvD+AaVKrRa5weape3KWv8oIJBOVwtNgQbiy0u1d7nNHEoza0+z5b/NclDGscIAeNcwqZiLfheZv6EKopcyTIySnTWKUW1wr7ft70xf9pw7jL6byIsZHsC1x+cLsxaW65/PA+d66E1HVpcfHuvhL9t/eaWCYWQ2lDQPhLySRO1yVr6mDdpU/I4o+kM6j6vI9cfCW/wBeV8zVNCq4D/dA55Wtn1Bd+yTi/wCrf6MuOfEv+U3B91+qL/f5qQzPU0Mes3+YWsWjjy45L2nVeK4+nHudDGAgXIVMwXFM8+oApNEn4kdTGtE3VJGUpK9yT7SXabbyIVEeYckiRBSY92R1ZNnNEdigVkFVn4SQeW37JUUpGfWZU2I7u/KEhihScB8Id/OqKCzzHSNJB9lRmxGKw9rHsR8gSpaHGu5lMe4Dn6j97LLS3vL5HZ62MNsTr/V3+Hh8N/MPxG1LQABGZ0weoAB7SdPpDSnslt3Z0QnLAlknJuXKXPubv7dzawzaeUkBhjv9VulGtjz3KbdvuU0nAi4Py+myhnZjbfB12BpnZ45w4x7SsXCHY9LFnzSXtSv3h4fhuFGrT7lZaMa7HdHL1D7mgxmFDS3IMu4OncJPQkaxWZyTvczMVxzC0jNOiC4Wa9xt2N3HsO65p5YL9KPUw9Pnkval8DC/uNXFZnV3uFMEgUmeUEDUvP4eklYyyNnbi6eMd+BrnuDS0TSptAJcLBrTplESSYP7qUpFTcOw3gry1xfdubK1rdwxgtPU3KTlvsT6m42zfH9ReCfNVa08iRm/66rRSaOOWBPgHC/1OytxGjWPk8GjUbLgWGqXmIaHRLRJPqVanvZm8TjjcfFnv9U+NNq4am0ESKhfre1N7fq4InK9hdLHRJv85Po/6Y49RpYKg3xGEU6TA8hwhpDRmnlBnVUp7GeTE5Tb8T5L+rOPfb6tHw6NSphaJfnIcymajnCPIX7CNd5PQqJzs6sEPVRe+7A/pz+sKmDmhXbW+zj/AIX1GS6mNqZLJDm8o0jSLBKb4Ly4o5PaXPc3+KcbpPEPNjcSLfO95SbT5Fi1Y3cTHocRpU3TReHNJl1J3wOPQ/dd1U7Lg63/AJq9raXijU4bTpUqQq/8rXF0mo0EgBziGBzRLS0GIiLA+WVrBxSs5ZPLJuF0/FP7r9/uPqcQwrw5zGudkAcfDNwDJBDZvoYgHQra4SW0TCupxySyZEr4vh/t8ySuxoPiNY0lw1GU+Iw3EkQHCLg6jnczDimtvqaetkrc7967fDlfHbyMwiQ4eJUY0kf7cEZDrdoMdwSD1UxjK6+gZc2NxUnz/wBS/n9mHhq7AfjDtAJBbNtbn0W8W4crb6HmZcWPOko5KyR47S93g/hv7ztXHs2IB9r8if1WtJL2d14fx/Y5PWSctOVqM/8AqW1/938NV41yOocXg5SXA6EFpI94surG3SrdfVHhdWo6pRktE12/pfuXZ+Fey/I06PFgPvLVxOKGShzeNNIgke37paS45tLtA1OLCIDh3hUooieVvsRHFvfowu6j8iqM9xVbA4g7CP8AI+b5JCoZOQQ5ggbgST1JBMJF7C/7g28Ejvb5oaDU0TVMSTMGeyZC3EUp+J5ItyUl+4PxwbCT2g+s2QAqpXaNCB3QG5DQdKEJtFYaDYqiLJ8bw9rmwDfr+SmUU1ReObhJSrgiZwqoDABLfUadBspUKKlmcnb5LTRe2ADA7KqMrfiVU6ROrlMlZ14JNcHngN+97G/tquWUorue7gw58kbUH8hT8ZT3cB1dIHvCwlmh2PRw9Dn5e3ltf8Cq1Om+2Zz+cPbTp+hN3dx7rKThLv8AsduOObHvppf7n+fQRjeFsyFodRpTuACb/wCRJcT1USxQrlfA1h1WZypRdeLf2SApgNaGUwS1oBGVhGd/4nl8WGsfoFlwdqbfYCi0ve7xvLlOYAmcxiPEc7Qna1hEWQxRkoyuRHXxrnVMjczWkF0iA8t76TtzWfDOnfIr4Q7hTg1rsgFjBMEvc4idR0O1tfVaxTZxzyRiqYGMreKIfENPwgDMTt5pIB10PO+oTowc99iNnmc4VJcWBsAmQ0OkRffy3KdEOdcErKTDVc0HIAGwAZzE3NiSIFreiCvWbbm3gsY8wwuHJpsNNBGgUNDTUuBHEMcSMj82XMG1APjIvMWkRlvvyTQr8DRwNSQKYeHQP9omMtRu1J4+64DRw1mNg0X+l+TJc/WR49pc190VY3h4yyxuQkAkGRr05rV4lKNxOZdU4T0zfBzhXETTzUnN1aTYkEluhDjOVwEwbg6ERplUocI6ozhn9mUvzwGGg8ZX0nTFwC2DD7lsiAQdYsJAIRUnuW5Rg/Vtrfx/vs/uNwvFWxle3w+dnAzvLY8p6dZ6raMFJXwcWTqZ4pUla7ruvc3yvJ/Oiyvi2ZM7m526B2U+I3/ytJHIiet1WqqjNX5mLWq8nTTS8Y/0v3rt7uPB+EdVrGQ8seAYBs7IZtOwG3vouhNwpS3XjR5GZY+oueN6Zd43z7n+3yYYx9KPKwEjufWSQR6yr06d4fIj1rnGupe3aXdf/ZeT38GGcAK3me517A2BHoGt+pK6Iw7+J5GbO5RjB7pceNeF+Hl2I/7O5rrPz8szsva1ie6qjnsN4foabD/0B90BYyl4X34B5B0D3lVYjRw/EcrYpNLmj8IzfPdS14mkZNKkLfx38QLTycC0+xQiZNs9T4q0zMfJUQgDiWiSBbXeJ9YQNCX42BIGpkATfqICBgVXl2rQJG5g/K8pDE08Kxon7xHMuHoAdPZKg1Nk7qbC68O9QBHylGkdgeV1wY9EiShgH4kBv4HnVwAb+6LDS3yMp4xT61djoXRyrVJqK8/45JsXVLrtieWYKXql3ouLwY+I6n57L5Lf6kn9weBdo5DlKxyRS8/ed/SZ8k5UqglzpSX9/qWYKsADJzF13EixPfbkEQqJfUTllat7Ljf83HVMUz4cocTt+vIJTa4o6OnhP9TlS8TP4VSE1HA5ZcQ2BDYGp9JnsAsI41uz0MvVTTSq/uMfTLX5pbccuR591lLG0zsxdSpRTdnhXOpdJ5Afms3BdzrWaXZEmLxWcim0EkXLrCDsJ+vtus34I1/Um5PY5QoEvc4htwAXGTO8ZdwJ3ga6qowMZZrW7+A6jgg1znFxIcQ4zF3RB0sBEW6LoWJJWefPqJSm4r4eQOKInObBsmIvBEGeth7JJbtsnJkagkmZVKmXEu0LruHLSB2BClQbZUssYQTbAqYIkdZk++x20CtYWYf4+N7I0MJSGZud0RF+9jb6rKcdKaOrBN5GpR4G+DmD3WMgB17h7S0gHmMsweZUqKtJmmSclGUo8NfVcjMPhmDztN2wXN0JBsfQ3ImORW8sWpM4MXVrHkh5un5fnJq4XiVWmQ1zs7QBrykwYMhLBFbq2maekc0qjJxi0/FfZqnuh+Mw1Oq9lQWvcCeWoIuI1i8x6LokpWr3/ODzcc8WmWi4+K5rz81fK5rc0MNSytDRIyi0eeRrruNP4JVKK20/D+GOWduL9arr9a8V2mvPxffbxG/YC+833Dmwf1WsIXutvFHF1WeUFpftL+mXevC/unx2EnCmkQTTJi+anMd2T+yqUE1ujmwdROMri/n38n4ocz/cFi0tOzhr2Tg99Mv/AN/uVmhHT63Fx3XeP9vB/AVVwDAJpOLXcrx2C1UTglklLkzMRgq4Ply3NzIi+tiPzRuSmu4DX16ZBfmcBplIIjq0n8kw27DDxdjrupUiRaS0Zv190JIbvuCzAsqeYsLeUuy/W6GkSBWZUojQlg3aLjqcpJ7pDoQ7ioAvm7/mHGU7DSKbxNojK3W5Ph3npGqLHoYp3E6ZvqfUCO0wlaHpaHsxgMny9xB7QTKdktHfFmRLSdTMyOUQLpiFGiIzF5O8CAPy+aVDsmr4sjYe/wCyV0NKxZsf4FDHwUUsm+b3t7JoHZ3ENpnSQT1IHyRsKzOxFEMIuBJMGSQflZQ0kXqcg6dSBBAPoR8rKrojTYIYHfCC03jeenIbJPc0Tce4+jXIs4G3qD7FLSaetdk1asS+Bm8/xHSAORn+XXPkxu9kel0vWRirnLjhFbKjQNSAB6xH0S0UjddXcrVOycYrM+7pbFr79YWcY6mdmTqFigiiQdTblNlXqDFelN6RLi4LCWQ0gEjmf0CyeBPc7I9fpelu39hnDa4I1mIjloFWLGjLqeqcaS7llXFi0nS/6fP6LVo41ktNkdevmqNB0LTA9DP5rKKbyM6M0oR6dfnJxvxkgbX/AJ2W6j7TZwSy3jUU/Ee2mVaiYPLXcZh6YIcJgmQegG/85rJwTbR3wzyjFSa2VNebfYswFLK1rgfM4g+uY7je30SngUopdy8HXzhmk3+mnfwKMfwYO+Hty9DC0UNUKOLJl9TnvtyvcDgsKR5C4Nm0EfKdCEo4tMr+A5dYsmJ4/DdeXihrsJUpmBlv+E/lC1cOxz4+oSkpb/Evw2Jq2lon119E9LlGmQs0MeXVB2vB+HgzQbUfIOXy73Np20Sjqb35X1Ly6IY3p3hLdf6Zfm3mi6k8naFsedsKxHDabzJlrvxMJa7uRr3Q4qSplY8ssctUH+eHmgK2Ad92pfq2feFSM3u7M/Etq0wT8TeTb/IymSRU+JPcY0A1DhB9NRPsix0HUr0T8bWz0F/dGwbgPdSdZrnegj9JRQWSSJhr3j1Ez0hSMP7FR+I3d10/6GyYtTPOexv3WmeQEfS3dMNzzTmE5GRyIB78kE2TYnGNGoFtLAj9QlsNJkz+JsGpjpaffVFoeiQs4gOO5kWHLlCYgX5BdwMnnEfPsgdvsRnBkOgvt1WNFuV9ivD08vI+5VCsTUxBJIe2I0/a6Q6PVsC512uEcnbFDiwUkJfw6s3zNc2OUlJxZopwfYRWoVYkNNtYKlqQ4uNislR0eR1t5/JG5VxXcOm0AxeeoN06M22ONVuhA7J2u5GmT4FUQCS4D02ACzxRu5PudfWZd1jT2SoN7ullq1ao5Itp2nuJZRZytyhToj4G0uoy3ercLAiM0WbMAeijCuTbrsrbir3pFLiJmFtS8Dh1zqrF05c6R78ljCKc5HfnyuODGr7P7mpRw5W+g4PXp9ituDkW1S9WjRdRIlwvDHOe4TebncbCB2WEcb1tHoZOqTwY2u1pr3F9OjUpuAylzGiMx102G6tQafkjDJ1EXjtct7/sjawWImwkg/VV+mXvC1mw/wCqP2/sXOaDEgLWjjcq4GMpt5BFE6rOVWjcW5pk7gMrFv8AkPn7brOUU/edXT5XG01cXyvzuGzGNcJH7hEZXswzYVFa4O4v8p+YwYkc4VGKQFTFgbymDaRMMXOx9lRkQ4rAB8vbY8jME8+hSZSujIqMDT5wPSXEdgUihrKofYMLWjfLCLEUfZGxp+veboYIzK+DqNMtNuRJv7KdxoSazpu0dQJn31CdgcdiZtlMf4uRYqBApE3Bn/K/5R7o2DcVXFLZjSZ5R8wnSHqkIq1A2QGkc4JIPK6XA+SV1YneB6z+aL8CtJqtLTAJkqTPcMui4ER7JjE4kF9wRI2KTBCaLqo0De8QluX7IynVI1Bn1t2QmJ77IobXOpAj5p2TQzxBqHdiZTEyWq+TsUySGpi4s5sxpIUOS7mixt8MV9rn4R2QpXwP1VfqCDjuLpiaXZhh+wBRZNHhSO0ISBz8SlmE3Ez6qtJk8hRhqcIitNlZcjyaU+yo0KT41EjoqshRLqD27ILSLqTxKBlBqiEWNrYU/DtddpLTzH5hTNWqNMEnCanEJ5dYOInnzTimuScslKTaVIswjgG3y7Zp+KJM5d9Mvzi658rmpbHX08cbx71fe/2+n1CwbwaYc+0l7SSRbK2mRDNXSXkWVTnJSpeQsWKDhql57+6q27jKmDpGQDluy+ZsxL5yw4i/kF9JmAFmsmTZ+82eDAm17t78yd+EpgggT5nSc7Q4AU2EDWCC8u+9oI1Q5SavwHFQg9KunzuvD83HUAA4Tlc2XSc7To5wAgi4ygHNEX7IlOTQsePGpLvv4r5f3Abh6RjNAm/xC0UmOy3jV7nCSRp3VOc1fl/JEcOGVN7X58bXXHjt2KGmlBEti2r6YIGaHQZINup/JRrnd/nc09VipxW/xS7rv5biHVaIaDmnyz8TRJyyRE5gQbRA+itZMjlXBm8OBQu72ffyJ6lWj4fnAccpMZm3Ie1oG+zieyqUpatuPcZRhjULlzu+fCvvf0Ar4GhMNeXXfo9gacviZWmTLQS1gzRHmN7iI9Zkvj88Tb1GHi73fdee305PP4dTe5uaA2GyBUpiPJhx8Uea5qHX7pPMGVkmk6/OS/U45SSe3xXhHv8ANmDVw+oYZdmy3s0jY5i63tHVdFuro4XFW0nvdf3NPFYOjqzI7KwsAD20y9zXNAeXO3LXOd6s6rBSmludc8eJv2d6Vc1bXn82cOCwprud5Iz1fv0wxxLqjQzwz8IDcrg8205iJcp6a/PeaRxYvWX5vv5vavd3IH8Jwwa7zQfL5fEYWMOSm7K5wMvaXOe0lskBvMXrXPghYcKTbe/v44/P7j62AwzpDvCZmyEFhpNdTaazQ69M5Hw1xgwDAJIOqlOS4/NjScccv1V9Nla8Pf8AIy8Xwihkcc5z5Zczx6f+0YfEOj/dnKzyi4zEakEaKcvxcmbhjUW638LW3Pz7beYj+qMDQFdxow5jnVDLSInxHS0NHwNFgOYg7wKwttb8mfUNRl7D2/PsSVxBBVM5kOplUSyYG8KCwKiADoGdU0J7FLaLb2ToVkVQQ79ypG+BpCsyO1KLXNkiUNWNNrgjyhpgCFK2Lbb5OF5hMVKx1JNESHsEFNEPgtpFUSkMZ8SRSLGCyZQ6kUhsc5AIW+oY1QMfgnE6pi7lovqgJcDWtHJBMTk7bXttfX6D2Sou3weqaJGnYUHmEAt0RMqmdUMmPJ6tUPNNCmQGoZ1TJ5KsMwHW6APYui0CwQJktBxEQhguS1zzGqhG0uBI1VmK5JK4ukM49gI02QBNUpCdEAYuOMOgKJGsEhFIyQhFS2RfReQLJmLR/9k="
-         style="width:420px; height:auto; float:left; margin:0 20px 10px 0; border-radius:6px;">
+    {image_tag("krebszelle", style="width:420px; max-width:100%; height:auto; float:left; margin:0 20px 10px 0; border-radius:6px;")}
 
     <div style="text-align:justify; hyphens:auto;">
        Krebserkrankungen gehören weltweit zu den häufigsten chronischen Krankheiten und stellen trotz großer medizinischer Fortschritte weiterhin eine zentrale gesundheitliche Herausforderung dar. Um zu verstehen, welche Faktoren Krebs begünstigen oder verhindern können, ist es zunächst wichtig zu klären, wie Krebs überhaupt entsteht. Krebs ist keine einzelne Krankheit, sondern ein Sammelbegriff für zahlreiche Erkrankungen, bei denen sich Körperzellen unkontrolliert vermehren, in umliegendes Gewebe eindringen und in manchen Fällen Metastasen bilden. Ursache dafür sind Veränderungen im Erbgut (Mutationen), die dazu führen, dass wichtige Regulationsmechanismen der Zellteilung außer Kraft gesetzt werden wodurch diese sich endlos vermehren.
@@ -61,7 +57,7 @@ components.html("""
         Chronische Entzündungsprozesse spielen generell eine bedeutende Rolle bei der Krebsentstehung. Entzündungsmarker im Blut, wie beispielsweise C-reaktives Protein (CRP), können Hinweise auf systemische Entzündungszustände geben. Dauerhafte Entzündungen führen zu einer erhöhten Zellneubildung und steigern damit die Wahrscheinlichkeit von Fehlern bei der DNA-Replikation. Gleichzeitig können entzündliche Botenstoffe das Tumorwachstum direkt fördern.
         Faktoren welche solche Entzündungsprozesse stark begünstigen sind chronischer Stress und anhaltender Schlafmangel. Langfristiger Stress erhöht die Ausschüttung von Stresshormonen und steht mit einer vermehrten Produktion entzündungsfördernder Botenstoffe in Zusammenhang. Schlafmangel wiederum beeinträchtigt die Immunregulation und wird ebenfalls mit erhöhten Entzündungsmarkern assoziiert. Dadurch entsteht ein dauerhaft belastetes biologisches Milieu, das DNA-Schäden begünstigt, Reparaturmechanismen schwächt und somit langfristig das Krebsrisiko erhöhen kann.
  
-        <img src="https://www.wochenblatt-dlv.de/sites/wochenblatt-dlv.de/files/styles/original/public/2021-05/Rauchen.jpg?itok=z6bJ276O"
+        <img loading="lazy" decoding="async" src="https://www.wochenblatt-dlv.de/sites/wochenblatt-dlv.de/files/styles/original/public/2021-05/Rauchen.jpg?itok=z6bJ276O"
              style="width:420px; height:auto; float:right; margin:0 0 10px 20px; border-radius:6px;">
         Rauchen gilt als einer der stärksten vermeidbaren Risikofaktoren. Tabakrauch enthält zahlreiche krebserregende Substanzen, die direkt DNA-Schäden verursachen können. Besonders Lungenkrebs, aber auch viele andere Krebsarten stehen in engem Zusammenhang mit Tabakkonsum. Auch Alkoholkonsum erhöht das Risiko für verschiedene Krebsarten, unter anderem für Krebs der Leber, des Mund-Rachen-Raumes und der Speiseröhre. Alkohol wird im Körper zu Acetaldehyd abgebaut, einer Substanz, die zellschädigend wirkt und genetische Veränderungen begünstigen kann.
         In der jüngeren Vergangenheit hat die Forschung mehr und mehr auch die Rolle psychischer Faktoren auf das Krebsrisiko erkannt. Bisher ist zwar nicht bekannt dass depressive Symptome und chronischer Stress in einem direkten Ursache-Wirkungs-Verhältnis zu Krebs stehen, jedoch können sie indirekt über Verhaltensweisen (z. B. Rauchen, Bewegungsmangel) oder über hormonelle und immunologische Veränderungen Einfluss nehmen. Chronischer Stress kann beispielsweise die Ausschüttung von Stresshormonen wie Cortisol erhöhen, was langfristig das Immunsystem schwächt.
@@ -91,7 +87,7 @@ components.html("""
 components.html("""
 <div style="max-width:900px; margin:auto; color:#EAEAEA; font-family:sans-serif; line-height:1.6;">
 
-    <img src="https://media.gettyimages.com/id/478006770/de/foto/sie-ist-eine-all-wetter-athleten.jpg?s=612x612&w=gi&k=20&c=RzT8TtLLAU-e_GUP5XRkCNs-tk5q9hItJjWczj3XXgk="
+    <img loading="lazy" decoding="async" src="https://media.gettyimages.com/id/478006770/de/foto/sie-ist-eine-all-wetter-athleten.jpg?s=612x612&w=gi&k=20&c=RzT8TtLLAU-e_GUP5XRkCNs-tk5q9hItJjWczj3XXgk="
          style="width:420px; height:auto; float:left; margin:0 20px 10px 0; border-radius:6px;">
 
     <div style="text-align:justify; hyphens:auto;">
@@ -0,0 +1,257 @@
+"""Laufende Aggregate der RKI-Zeitreihen (Trend- und Korrelationssummen).
+
+Gespeichert unter ``Data/store/aggregates.npz``:
+
+    trend/<datensatz>/...        suffiziente Statistiken n, Σx, Σy, Σx², Σy², Σxy je Serie
+    korr/<geschlecht>/...        Summenterme der Korrelation (Krebsarten × Risikofaktoren)
+                                 über die jährlichen Veränderungen + letztes gemeinsames Jahr,
+                                 Permutations-p-Werte
+
+Neue Jahre (siehe rki_ingest.py) werden nur aufaddiert, ohne die Zeitreihen
+komplett neu auszuwerten. Passt die gespeicherte Version nicht mehr zu den
+Daten (z.B. Datei von Hand geändert), wird alles einmal neu aufgebaut.
+
+Die Seite liest Trends und Korrelationen (r, p, n) nur aus dieser Datei.
+r und n kommen aus den Summen. Die Permutations-p-Werte lassen sich nicht
+aufaddieren (jede Permutation mischt alle Jahre), sie werden daher beim
+Einspielen neuer Jahre einmal aus den vollständigen Reihen neu berechnet und
+mit gespeichert.
+"""
+
+import json
+
+import numpy as np
+import pandas as pd
+
+from correlation_engine import align_years, change_matrices, pairwise_sums, pct_change, pearson, permutation_p_values
+from data_store import STORE_DIR, atomic_write, catalog
+from trend_engine import TREND_SOURCES, sufficient_statistics, trend_from_statistics
+
+AGGREGATES_PATH = STORE_DIR / "aggregates.npz"
+
+# erhöhen, wenn sich der Inhalt der Datei ändert (ältere Dateien werden neu aufgebaut)
+AGGREGATES_FORMAT = 2
+
+# Geschlecht -> (Krebsdaten, Risikofaktoren) wie im Bereich Zusammenhang
+KORRELATION_SOURCES = {
+    "w": ("krebs_inzidenz_w", "risikofaktoren_w"),
+    "m": ("krebs_inzidenz_m", "risikofaktoren_m"),
+}
+
+_SUM_KEYS = ("n", "sx", "sxx", "sy", "syy", "sxy")
+
+
+def source_names():
+    return sorted(set(TREND_SOURCES.values()))
+
+
+def current_versions():
+    return {name: catalog.version(name) for name in source_names()}
+
+# -------------------------------------------------
+# TRENDSUMMEN
+# -------------------------------------------------
+
+def merge_trend_statistics(s, s_new):
+    """Summen zweier Zeitabschnitte derselben Serien zusammenführen."""
+    if list(s["serie"]) != list(s_new["serie"]):
+        raise ValueError("Serien stimmen nicht überein")
+
+    merged = {"serie": s["serie"], **{k: s[k] + s_new[k] for k in _SUM_KEYS}}
+    # Basis für die prozentuale Veränderung bleibt der erste vorhandene Wert
+    leer = s["n"] == 0
+    merged["baseline"] = np.where(leer, s_new["baseline"], s["baseline"])
+    merged["baseline_jahr"] = np.where(leer, s_new["baseline_jahr"], s["baseline_jahr"])
+    return merged
+
+# -------------------------------------------------
+# KORRELATIONSSUMMEN
+# -------------------------------------------------
+
+def _change_sums(values_a, values_b):
+    """Summenterme über die jährlichen Veränderungen zweier ausgerichteter Wertematrizen."""
+    A, B = pct_change(values_a), pct_change(values_b)
+    Ma, Mb = ~np.isnan(A), ~np.isnan(B)
+    return pairwise_sums(np.where(Ma, A, 0.0), Ma.astype(np.float64), np.where(Mb, B, 0.0), Mb.astype(np.float64))
+
+
+def korrelation_p(df_cancer, df_rf, sums):
+    """Permutations-p-Werte aus den vollständigen (ausgerichteten) Reihen."""
+    return permutation_p_values(*change_matrices(df_cancer, df_rf), pearson(dict(sums)))
+
+
+def korrelation_sums(df_cancer, df_rf):
+    df_cancer, df_rf = align_years(df_cancer, df_rf)
+    sums = _change_sums(df_cancer.to_numpy(dtype=np.float64), df_rf.to_numpy(dtype=np.float64))
+    return {
+        **sums,
+        "p": korrelation_p(df_cancer, df_rf, sums),
+        "jahre": df_cancer.index.to_numpy(dtype=np.int64),
+        "letzte_a": df_cancer.to_numpy(dtype=np.float64)[-1],
+        "letzte_b": df_rf.to_numpy(dtype=np.float64)[-1],
+        "krebsarten": np.asarray(df_cancer.columns),
+        "risikofaktoren": np.asarray(df_rf.columns),
+    }
+
+# -------------------------------------------------
+# SPEICHER
+# -------------------------------------------------
+
+class Aggregates:
+
+    def __init__(self, trend, korr, versions, format=AGGREGATES_FORMAT):
+        self.trend = trend          # name -> suffiziente Statistiken
+        self.korr = korr            # geschlecht -> Summenterme und p-Werte
+        self.versions = versions    # name -> Datenversion
+        self.format = format
+
+    def trend_table(self, dataset=None):
+        """Wie trend_engine.trend_table, aber aus den gespeicherten Summen."""
+        parts = []
+        for (ds, geschlecht), name in TREND_SOURCES.items():
+            if dataset is not None and ds != dataset:
+                continue
+            part = trend_from_statistics(self.trend[name])
+            part.insert(0, "geschlecht", geschlecht)
+            part.insert(0, "dataset", ds)
+            parts.append(part)
+        return pd.concat(parts, ignore_index=True).set_index(["dataset", "geschlecht", "serie"]).sort_index()
+
+    def korrelation(self, geschlecht):
+        """(r, p, n) als DataFrames Krebsarten × Risikofaktoren, wie correlation_engine.korrelation."""
+        s = self.korr[geschlecht]
+        index, columns = s["krebsarten"], s["risikofaktoren"]
+        return (pd.DataFrame(pearson(dict(s)), index=index, columns=columns),
+                pd.DataFrame(s["p"], index=index, columns=columns),
+                pd.DataFrame(s["n"].astype(int), index=index, columns=columns))
+
+    # ---- inkrementelle Updates ----
+
+    def add_rows(self, name, df_new):
+        """Neue Jahre eines Datensatzes aufaddieren (Trend und betroffene Korrelationen)."""
+        self.trend[name] = merge_trend_statistics(self.trend[name], sufficient_statistics(df_new))
+        for geschlecht, names in KORRELATION_SOURCES.items():
+            if name in names:
+                self._update_korrelation(geschlecht)
+        self.versions[name] = catalog.version(name)
+
+    def _update_korrelation(self, geschlecht):
+        s = self.korr[geschlecht]
+        df_cancer, df_rf = align_years(*(catalog.get(n) for n in KORRELATION_SOURCES[geschlecht]))
+        jahre = df_cancer.index.to_numpy(dtype=np.int64)
+
+        if len(jahre) < len(s["jahre"]) or not np.array_equal(jahre[:len(s["jahre"])], s["jahre"]):
+            # gemeinsame Jahre nicht nur am Ende gewachsen: komplett neu aufbauen
+            self.korr[geschlecht] = korrelation_sums(df_cancer.reset_index(), df_rf.reset_index())
+            return
+
+        neu = slice(len(s["jahre"]), None)
+        if len(jahre[neu]) == 0:
+            return
+
+        # Veränderung vom letzten bekannten Jahr zu den neuen Jahren
+        values_a = np.vstack([s["letzte_a"], df_cancer.to_numpy(dtype=np.float64)[neu]])
+        values_b = np.vstack([s["letzte_b"], df_rf.to_numpy(dtype=np.float64)[neu]])
+        delta = _change_sums(values_a, values_b)
+
+        s = {**s, **{k: s[k] + delta[k] for k in delta}}
+        s["jahre"], s["letzte_a"], s["letzte_b"] = jahre, values_a[-1], values_b[-1]
+        # p-Werte: Permutation über alle Jahre, nicht inkrementell möglich
+        s["p"] = korrelation_p(df_cancer, df_rf, s)
+        self.korr[geschlecht] = s
+
+    # ---- Datei ----
+
+    def save(self, path=AGGREGATES_PATH):
+        arrays = {}
+        for name, s in self.trend.items():
+            arrays.update({f"trend/{name}/{k}": v for k, v in s.items()})
+        for geschlecht, s in self.korr.items():
+            arrays.update({f"korr/{geschlecht}/{k}": v for k, v in s.items()})
+
+        # Spaltennamen als Unicode-Arrays, damit ohne pickle geladen werden kann
+        arrays = {k: v.astype(str) if v.dtype == object else v for k, v in arrays.items()}
+
+        with atomic_write(path) as f:
+            np.savez(f, meta=np.array(json.dumps({"versions": self.versions, "format": self.format})), **arrays)
+        return path
+
+    @classmethod
+    def load(cls, path=AGGREGATES_PATH):
+        trend, korr = {}, {}
+        with np.load(path) as data:
+            meta = json.loads(str(data["meta"]))
+            for key in data.files:
+                if key == "meta":
+                    continue
+                kind, name, field = key.split("/")
+                (trend if kind == "trend" else korr).setdefault(name, {})[field] = data[key]
+        return cls(trend, korr, meta["versions"], meta.get("format", 1))
+
+
+def build_aggregates():
+    """Alle Aggregate vollständig aus den aktuellen Daten."""
+    trend = {name: sufficient_statistics(catalog.get(name)) for name in source_names()}
+    korr = {g: korrelation_sums(catalog.get(c), catalog.get(r)) for g, (c, r) in KORRELATION_SOURCES.items()}
+    return Aggregates(trend, korr, current_versions())
+
+
+def load_aggregates(path=AGGREGATES_PATH, names=None):
+    """Gespeicherte Aggregate, falls sie zur Datenversion passen, sonst neu aufbauen.
+
+    Mit ``names`` werden nur diese Datensätze geprüft (und geladen).
+    """
+    if path.exists():
+        aggregates = Aggregates.load(path)
+        names = names or source_names()
+        if aggregates.format == AGGREGATES_FORMAT and \
+                all(aggregates.versions.get(name) == catalog.version(name) for name in names):
+            return aggregates
+
+    aggregates = build_aggregates()
+    aggregates.save(path)
+    return aggregates
+
+
+def korrelation(geschlecht):
+    """(r, p, n) wie correlation_engine.korrelation, aus der gespeicherten Datei."""
+    return load_aggregates(names=list(KORRELATION_SOURCES[geschlecht])).korrelation(geschlecht)
+
+
+def trend_table(dataset=None):
+    """Trendtabelle wie trend_engine.trend_table, aus den gespeicherten Summen."""
+    names = [name for (ds, _), name in TREND_SOURCES.items() if dataset is None or ds == dataset]
+    return load_aggregates(names=names).trend_table(dataset)
+
+# -------------------------------------------------
+# KONSISTENZPRÜFUNG
+# -------------------------------------------------
+
+def consistency_report(aggregates, tol=1e-9):
+    """Vergleicht die (inkrementell fortgeschriebenen) Aggregate mit einem vollständigen Neuaufbau."""
+    full = build_aggregates()
+    report = {}
+
+    for name in source_names():
+        a = trend_from_statistics(aggregates.trend[name]).set_index("serie")
+        b = trend_from_statistics(full.trend[name]).set_index("serie")
+        report[f"trend/{name}"] = _max_diff(a, b)
+
+    for geschlecht in KORRELATION_SOURCES:
+        r_a, p_a, n_a = aggregates.korrelation(geschlecht)
+        r_b, p_b, n_b = full.korrelation(geschlecht)
+        report[f"korrelation/{geschlecht}"] = max(_max_diff(r_a, r_b), _max_diff(n_a, n_b))
+        report[f"korrelation_p/{geschlecht}"] = _max_diff(p_a, p_b)
+
+    return all(diff <= tol for diff in report.values()), report
+
+
+def _max_diff(a, b):
+    """Größte Abweichung, relativ für Beträge über 1 (NaN an gleicher Stelle zählt als gleich)."""
+    a, b = a.to_numpy(dtype=np.float64), b.to_numpy(dtype=np.float64)
+    if a.shape != b.shape:
+        return float("inf")
+    with np.errstate(invalid="ignore"):
+        diff = np.abs(a - b) / np.maximum(1.0, np.abs(b))
+    diff = np.where(np.isnan(a) & np.isnan(b), 0.0, diff)
+    return float(np.nan_to_num(diff, nan=np.inf).max(initial=0.0))
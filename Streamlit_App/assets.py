@@ -0,0 +1,134 @@
+"""Bild-Pipeline für die HomePage.
+
+Die Originalbilder liegen unter ``assets/``. Daraus werden verkleinerte,
+komprimierte Varianten (JPEG progressiv + WebP) unter ``static/`` erzeugt,
+die Streamlit per ``enableStaticServing`` unter ``app/static/`` ausliefert
+(siehe ``.streamlit/config.toml``).
+
+    python assets.py          # alle Varianten (neu) erzeugen
+
+Die URLs tragen den Inhalts-Hash als ``?v=...``. Für solche URLs setzt der
+Static-Handler ``Cache-Control: max-age`` von 10 Jahren; ändert sich ein
+Bild, ändert sich die URL.
+
+Streamlit liest ``.streamlit/config.toml`` nur aus dem Startverzeichnis. Wird
+die App von woanders gestartet (z.B. ``streamlit run Streamlit_App/...`` aus
+dem Projektordner), ist Static Serving aus; das Bild wird dann wie früher
+direkt als base64 in die Seite eingebettet.
+"""
+
+import base64
+import hashlib
+import json
+import os
+from functools import lru_cache
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent
+SOURCE_DIR = BASE_DIR / "assets"
+STATIC_DIR = BASE_DIR / "static"
+MANIFEST_PATH = STATIC_DIR / "manifest.json"
+STATIC_URL = "app/static"
+
+# name -> (Originaldatei, Zielbreiten in px; nie größer als das Original)
+ASSETS = {
+    "krebszelle": ("krebszelle.jpg", (160, 310)),
+}
+
+# -------------------------------------------------
+# ERZEUGEN DER VARIANTEN
+# -------------------------------------------------
+
+def _sha256(path):
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def build_assets():
+    """Erzeugt alle Varianten und das Manifest (Pillow wird nur hier benötigt)."""
+    from PIL import Image
+
+    STATIC_DIR.mkdir(parents=True, exist_ok=True)
+    manifest = {}
+
+    for name, (filename, widths) in ASSETS.items():
+        source = SOURCE_DIR / filename
+        with Image.open(source) as original:
+            original = original.convert("RGB")
+            variants = []
+            for width in sorted({min(w, original.width) for w in widths}):
+                height = round(original.height * width / original.width)
+                image = original if width == original.width else original.resize((width, height), Image.LANCZOS)
+
+                for fmt, ext, options in (("JPEG", "jpg", {"quality": 82, "optimize": True, "progressive": True}),
+                                          ("WEBP", "webp", {"quality": 80, "method": 6})):
+                    target = STATIC_DIR / f"{name}-{width}.{ext}"
+                    image.save(target, fmt, **options)
+                    variants.append({"file": target.name, "format": ext, "width": width, "height": height,
+                                     "bytes": target.stat().st_size, "sha256": _sha256(target)[:12]})
+
+        manifest[name] = {"source": filename, "source_sha256": _sha256(source), "variants": variants}
+
+    tmp = MANIFEST_PATH.with_suffix(".tmp")
+    tmp.write_text(json.dumps(manifest, indent=2))
+    os.replace(tmp, MANIFEST_PATH)
+    return manifest
+
+
+def _is_stale():
+    if not MANIFEST_PATH.exists():
+        return True
+    manifest = json.loads(MANIFEST_PATH.read_text())
+    return any(name not in manifest or manifest[name]["source_sha256"] != _sha256(SOURCE_DIR / filename)
+               for name, (filename, _) in ASSETS.items())
+
+# -------------------------------------------------
+# HTML
+# -------------------------------------------------
+
+@lru_cache(maxsize=None)
+def load_manifest():
+    """Manifest einmal pro Prozess laden, fehlende/veraltete Varianten vorher erzeugen."""
+    if _is_stale():
+        return build_assets()
+    return json.loads(MANIFEST_PATH.read_text())
+
+
+def _srcset(variants):
+    return ", ".join(f"{STATIC_URL}/{v['file']}?v={v['sha256']} {v['width']}w" for v in variants)
+
+
+def static_serving_enabled():
+    import streamlit as st
+
+    return bool(st.get_option("server.enableStaticServing"))
+
+
+def image_tag(name, style, sizes="420px", alt=""):
+    """<picture> mit WebP/JPEG-Varianten, Lazy Loading und Cache-Busting per Hash."""
+    variants = load_manifest()[name]["variants"]
+    webp = [v for v in variants if v["format"] == "webp"]
+    jpeg = [v for v in variants if v["format"] == "jpg"]
+    largest = jpeg[-1]
+
+    if not static_serving_enabled():
+        # app/static/ wäre 404: größte JPEG-Variante einbetten
+        data = base64.b64encode((STATIC_DIR / largest["file"]).read_bytes()).decode()
+        return (f'<img src="data:image/jpeg;base64,{data}" width="{largest["width"]}" height="{largest["height"]}" '
+                f'alt="{alt}" style="{style}">')
+
+    return (
+        f'<picture>'
+        f'<source type="image/webp" srcset="{_srcset(webp)}" sizes="{sizes}">'
+        f'<img src="{STATIC_URL}/{largest["file"]}?v={largest["sha256"]}" srcset="{_srcset(jpeg)}" sizes="{sizes}" '
+        f'width="{largest["width"]}" height="{largest["height"]}" loading="lazy" decoding="async" '
+        f'alt="{alt}" style="{style}">'
+        f'</picture>'
+    )
+
+
+if __name__ == "__main__":
+    for name, entry in build_assets().items():
+        original = (SOURCE_DIR / entry["source"]).stat().st_size
+        for v in entry["variants"]:
+            print(f"{name:12s} {v['file']:22s} {v['width']:4d}x{v['height']:<4d} {v['bytes'] / 1024:6.1f} KB"
+                  f" (Original {original / 1024:.1f} KB)")
@@ -0,0 +1,171 @@
+"""Batch-Scoring für das Level-2-Risikomodell.
+
+Liest CSV- oder Parquet-Dateien mit den Spalten aus ``expected_features``
+in Blöcken, berechnet pro Block ``predict_proba`` und schreibt
+Wahrscheinlichkeit und Schwellenwert-Flag blockweise in die Ausgabedatei.
+Die Eingabe wird dabei nie vollständig in den Speicher geladen.
+
+Beispiel:
+    python batch_scoring.py kohorte.csv scores.csv --chunksize 50000 --workers 4
+"""
+
+import argparse
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+
+from risk_model import expected_features, load_risk_model, threshold
+
+PROB_COLUMN = "Risikowahrscheinlichkeit"
+FLAG_COLUMN = "Erhöhtes Risiko"
+
+# -------------------------------------------------
+# EINLESEN IN BLÖCKEN
+# -------------------------------------------------
+
+def iter_chunks(input_path, chunksize, columns):
+    input_path = Path(input_path)
+
+    if input_path.suffix.lower() == ".parquet":
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(input_path)
+        missing = [c for c in columns if c not in parquet_file.schema_arrow.names]
+        if missing:
+            raise ValueError(f"Fehlende Spalten in {input_path.name}: {missing}")
+
+        for batch in parquet_file.iter_batches(batch_size=chunksize, columns=columns):
+            yield batch.to_pandas()
+    else:
+        header = pd.read_csv(input_path, nrows=0).columns
+        missing = [c for c in columns if c not in header]
+        if missing:
+            raise ValueError(f"Fehlende Spalten in {input_path.name}: {missing}")
+
+        yield from pd.read_csv(input_path, chunksize=chunksize, usecols=columns)
+
+# -------------------------------------------------
+# SCORING (auch im Worker-Prozess)
+# -------------------------------------------------
+
+_worker_model = None
+
+def _init_worker(model_path):
+    global _worker_model
+    _worker_model = load_risk_model(model_path)
+
+
+def _score_chunk(chunk):
+    return score_frame(_worker_model, chunk)
+
+
+def score_frame(model, chunk):
+    X = chunk[expected_features]
+    return model.predict_proba(X)[:, 1]
+
+# -------------------------------------------------
+# AUSGABE IN BLÖCKEN
+# -------------------------------------------------
+
+class _ChunkWriter:
+
+    def __init__(self, output_path):
+        self.output_path = Path(output_path)
+        self.parquet = self.output_path.suffix.lower() == ".parquet"
+        self._writer = None
+        self._first = True
+
+    def write(self, df):
+        if self.parquet:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            if self._writer is None:
+                self._writer = pq.ParquetWriter(self.output_path, table.schema)
+            self._writer.write_table(table)
+        else:
+            df.to_csv(self.output_path, mode="w" if self._first else "a",
+                      header=self._first, index=False)
+        self._first = False
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+
+# -------------------------------------------------
+# EINSTIEGSPUNKT
+# -------------------------------------------------
+
+def score_file(input_path, output_path, chunksize=100_000, workers=1,
+               id_column=None, model_path=None):
+    """Bewertet alle Zeilen von ``input_path`` und schreibt nach ``output_path``.
+
+    ``model_path`` kann auf das JSON-Artefakt oder die Pickle-Pipeline zeigen,
+    ohne Angabe wird das JSON-Artefakt bevorzugt. Gibt eine kleine
+    Zusammenfassung (Zeilen, erhöhte Risiken, Laufzeit) zurück.
+    """
+    start = time.perf_counter()
+    columns = list(expected_features)
+    if id_column is not None and id_column not in columns:
+        columns.append(id_column)
+
+    chunks = iter_chunks(input_path, chunksize, columns)
+    writer = _ChunkWriter(output_path)
+    summary = {"rows": 0, "elevated": 0}
+
+    def emit(chunk, probs):
+        out = pd.DataFrame({PROB_COLUMN: probs, FLAG_COLUMN: (probs >= threshold).astype("int8")})
+        if id_column is not None:
+            out.insert(0, id_column, chunk[id_column].to_numpy())
+        writer.write(out)
+        summary["rows"] += len(out)
+        summary["elevated"] += int(out[FLAG_COLUMN].sum())
+
+    try:
+        if workers <= 1:
+            model = load_risk_model(model_path)
+            for chunk in chunks:
+                emit(chunk, score_frame(model, chunk))
+        else:
+            # höchstens 2 Blöcke pro Worker gleichzeitig im Speicher, Reihenfolge bleibt erhalten
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(model_path,)) as pool:
+                pending = deque()
+                for chunk in chunks:
+                    pending.append((chunk, pool.submit(_score_chunk, chunk)))
+                    if len(pending) >= 2 * workers:
+                        done_chunk, future = pending.popleft()
+                        emit(done_chunk, future.result())
+                while pending:
+                    done_chunk, future = pending.popleft()
+                    emit(done_chunk, future.result())
+    finally:
+        writer.close()
+
+    summary["seconds"] = time.perf_counter() - start
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Batch-Scoring mit dem Level-2-Risikomodell")
+    parser.add_argument("input", help="CSV- oder Parquet-Datei mit den Modell-Features")
+    parser.add_argument("output", help="Ausgabedatei (.csv oder .parquet)")
+    parser.add_argument("--chunksize", type=int, default=100_000)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--id-column", default=None, help="Spalte, die unverändert übernommen wird")
+    parser.add_argument("--model", default=None, help="risk_model_lvl2.json oder .pkl")
+    args = parser.parse_args(argv)
+
+    summary = score_file(args.input, args.output, chunksize=args.chunksize, workers=args.workers,
+                         id_column=args.id_column, model_path=args.model)
+
+    print(f"{summary['rows']} Zeilen bewertet, davon {summary['elevated']} mit erhöhtem Risiko "
+          f"(Schwelle {threshold:.2f}) in {summary['seconds']:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
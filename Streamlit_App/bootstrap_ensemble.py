@@ -0,0 +1,202 @@
+"""Bootstrap-Ensemble des Risikomodells für Unsicherheitsintervalle pro Eingabe.
+
+Offline wird die Level-2-Pipeline (StandardScaler + LogisticRegression, gleiche
+Hyperparameter wie risk_model_lvl2.pkl) auf einigen hundert bis tausend
+Bootstrap-Stichproben des Trainingsteils von nhanes_clean.csv neu gefittet,
+verteilt auf einen Prozesspool:
+
+    python bootstrap_ensemble.py                    # 1000 Stichproben, alle Kerne
+    python bootstrap_ensemble.py --n 200 --workers 2
+    docker compose run --rm bootstrap
+
+Scaler und Koeffizienten jedes Fits werden wie in live_risk.py in den
+Rohwertraum umgerechnet (w = coef / scale, b = intercept − w · mean). Das
+Ergebnis ist eine einzige Matrix (Stichproben × Features + 1, letzte Spalte
+= Achsenabschnitt) in ``models/risk_model_lvl2_bootstrap.npz``. Die App
+rechnet damit zur Laufzeit das Risiko aller Ensemble-Mitglieder mit einem
+Matrix-Vektor-Produkt und gibt die Quantile als Intervall aus, ohne Refit und
+ohne Schleife über Modelle.
+
+Das Intervall beschreibt die Unsicherheit der Modellschätzung (Stichprobe),
+nicht die Unsicherheit, ob die Person tatsächlich erkrankt.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from data_store import atomic_write
+from model_registry import ModelRegistry
+from risk_model import MODEL_DIR, MODEL_PATH, expected_features
+
+ENSEMBLE_PATH = MODEL_DIR / "risk_model_lvl2_bootstrap.npz"
+N_BOOTSTRAP = 1000
+
+# -------------------------------------------------
+# ENSEMBLE
+# -------------------------------------------------
+
+class BootstrapEnsemble:
+    """Gewichte aller Bootstrap-Modelle im Rohwertraum als eine Matrix."""
+
+    def __init__(self, weights, meta):
+        weights = np.asarray(weights, dtype=np.float64)
+        if weights.ndim != 2 or weights.shape[1] != len(expected_features) + 1:
+            raise ValueError(f"Gewichtsmatrix hat die Form {weights.shape}, erwartet (n, {len(expected_features) + 1})")
+
+        self.weights = weights
+        self.coef = weights[:, :-1]
+        self.intercept = weights[:, -1]
+        self.meta = meta
+
+    def __len__(self):
+        return len(self.weights)
+
+    @property
+    def model_sha256(self):
+        """sha256 der Pipeline, deren Hyperparameter verwendet wurden."""
+        return self.meta.get("model_sha256")
+
+    def matches(self, model):
+        """Gehört das Ensemble zum geladenen Modell (gleiche Quell-Pipeline)?"""
+        return self.model_sha256 is not None and getattr(model, "source_sha256", None) == self.model_sha256
+
+    def probabilities(self, values):
+        """Risiko jedes Ensemble-Mitglieds für eine Eingabe (Reihenfolge wie expected_features)."""
+        logits = self.coef @ np.asarray(values, dtype=np.float64) + self.intercept
+        return 1.0 / (1.0 + np.exp(-logits))
+
+    def interval(self, values, level=0.95):
+        """(untere, obere) Grenze des zentralen ``level``-Intervalls über das Ensemble."""
+        alpha = (1.0 - level) / 2
+        low, high = np.quantile(self.probabilities(values), [alpha, 1.0 - alpha])
+        return float(low), float(high)
+
+    # ---- Datei ----
+
+    def save(self, path=ENSEMBLE_PATH):
+        with atomic_write(path) as f:
+            np.savez_compressed(f, weights=self.weights, meta=np.array(json.dumps(self.meta, ensure_ascii=False)))
+        return path
+
+    @classmethod
+    def load(cls, path=ENSEMBLE_PATH):
+        with np.load(path) as data:
+            meta = json.loads(str(data["meta"]))
+            if meta.get("features") != expected_features:
+                raise ValueError(f"{path}: Feature-Reihenfolge weicht von expected_features ab")
+            return cls(data["weights"], meta)
+
+
+# eine Instanz pro Prozess: Ensemble einmal laden, erneut nur bei geänderter Datei
+ensembles = ModelRegistry(loader=BootstrapEnsemble.load)
+
+
+def load_ensemble(model, path=ENSEMBLE_PATH):
+    """Ensemble zu ``model`` oder None (nicht gebaut oder zu einer anderen Pipeline gehörend)."""
+    if not path.exists():
+        return None
+    ensemble = ensembles.get(path)
+    return ensemble if ensemble.matches(model) else None
+
+# -------------------------------------------------
+# BOOTSTRAP (Prozesspool)
+# -------------------------------------------------
+
+# pro Worker einmal gesetzt (initializer), damit X und y nicht mit jeder Aufgabe übertragen werden
+_X = _y = _template = None
+
+
+def _init_worker(X, y, template):
+    global _X, _y, _template
+    _X, _y, _template = X, y, template
+
+
+def _fit_replicates(replicates):
+    """Fittet die Stichproben ``replicates``; Zeilen [w..., b] im Rohwertraum."""
+    from sklearn.base import clone
+
+    from live_risk import linear_weights
+    from train_model import RANDOM_STATE
+
+    rows = np.empty((len(replicates), _X.shape[1] + 1))
+    for row, i in zip(rows, replicates):
+        # eigener Zufallsstrom je Stichprobe: Ergebnis unabhängig von der Zahl der Worker
+        idx = np.random.default_rng([RANDOM_STATE, i]).integers(0, len(_X), len(_X))
+        weights, offset = linear_weights(clone(_template).fit(_X[idx], _y[idx]))
+        row[:-1], row[-1] = weights, offset
+    return rows
+
+
+def build_ensemble(n=N_BOOTSTRAP, workers=None, model_path=MODEL_PATH):
+    """Refit der Pipeline auf ``n`` Bootstrap-Stichproben des Trainingsteils."""
+    import joblib
+    from sklearn.model_selection import train_test_split
+
+    from live_risk import linear_weights
+    from train_model import RANDOM_STATE, load_training_data
+
+    start = time.perf_counter()
+    template = joblib.load(model_path)
+    if linear_weights(template) is None:
+        raise ValueError(f"{model_path}: Bootstrap-Ensemble nur für StandardScaler + LogisticRegression")
+
+    # Trainingsteil wie in train_model.py, der Holdout bleibt unberührt
+    X, y, data_hash = load_training_data()
+    X_train, _, y_train, _ = train_test_split(X, y, test_size=0.2, random_state=RANDOM_STATE, stratify=y)
+    X_train = X_train.to_numpy(dtype=np.float64)
+    y_train = y_train.to_numpy()
+
+    workers = workers or os.cpu_count() or 1
+    chunks = [c.tolist() for c in np.array_split(np.arange(n), min(n, workers * 4))]
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(X_train, y_train, template)) as pool:
+        weights = np.vstack(list(pool.map(_fit_replicates, chunks)))
+
+    meta = {
+        "n_bootstrap": n,
+        "features": list(expected_features),
+        "model_source": model_path.name,
+        "model_sha256": hashlib.sha256(model_path.read_bytes()).hexdigest(),
+        "model_params": {k: v for k, v in template.named_steps["model"].get_params().items()
+                         if isinstance(v, (int, float, str, bool, type(None)))},
+        "n_train": len(X_train),
+        "data_source": "nhanes_clean.csv",
+        "data_sha256": data_hash,
+        "random_state": RANDOM_STATE,
+        "workers": workers,
+        "build_seconds": time.perf_counter() - start,
+        "built_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+    return BootstrapEnsemble(weights, meta)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--n", type=int, default=N_BOOTSTRAP, help="Anzahl Bootstrap-Stichproben")
+    parser.add_argument("--workers", type=int, help="Prozesse im Pool (Standard: alle Kerne)")
+    args = parser.parse_args(argv)
+
+    ensemble = build_ensemble(args.n, args.workers)
+    path = ensemble.save()
+
+    # Kontrolle: Intervallbreite über die Trainingsdaten
+    from train_model import load_training_data
+
+    X, _, _ = load_training_data()
+    probs = 1.0 / (1.0 + np.exp(-(X.to_numpy(dtype=np.float64) @ ensemble.coef.T + ensemble.intercept)))
+    breite = np.quantile(probs, 0.975, axis=1) - np.quantile(probs, 0.025, axis=1)
+
+    print(f"{path.name}: {len(ensemble)} Modelle in {ensemble.meta['build_seconds']:.1f} s "
+          f"({ensemble.meta['workers']} Prozesse), {path.stat().st_size / 1024:.0f} KB")
+    print(f"Breite des 95 %-Intervalls: Median {np.median(breite) * 100:.1f} Prozentpunkte, "
+          f"90 %-Quantil {np.quantile(breite, 0.9) * 100:.1f} Prozentpunkte")
+
+
+if __name__ == "__main__":
+    main()
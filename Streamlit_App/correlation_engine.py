@@ -0,0 +1,103 @@
+"""Korrelation jährlicher prozentualer Veränderungen: Krebsarten × Risikofaktoren.
+
+Der komplette Block wird mit Matrixprodukten berechnet. Fehlende Werte
+werden paarweise behandelt: jedes Paar nutzt alle Jahre, in denen beide
+Veränderungen vorliegen (statt Zeilen mit irgendeinem NaN zu verwerfen).
+
+Die Signifikanz wird per Permutationstest geschätzt. Dazu werden die
+Jahre der Krebsreihen ``n_permutations``-mal gemischt, und alle
+Permutationen laufen gemeinsam durch ein einziges Matrixprodukt je
+Summenterm.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Paare mit weniger gemeinsamen Jahren bekommen keinen Koeffizienten
+MIN_PAARE = 3
+
+# -------------------------------------------------
+# HILFSFUNKTIONEN
+# -------------------------------------------------
+
+def align_years(df_cancer, df_rf):
+    """Beide Tabellen (mit Spalte 'Jahr') auf die gemeinsamen Jahre beschränken."""
+    df_cancer = df_cancer.set_index('Jahr')
+    df_rf = df_rf.set_index('Jahr')
+    jahre = df_cancer.index.intersection(df_rf.index)
+    return df_cancer.loc[jahre], df_rf.loc[jahre]
+
+
+def pct_change(values):
+    """Jährliche Veränderung in %, ohne Auffüllen fehlender Jahre (NaN, wenn ein Jahr fehlt)."""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        change = (values[1:] / values[:-1] - 1) * 100
+    change[~np.isfinite(change)] = np.nan
+    return change
+
+
+def pairwise_sums(A0, Ma, B0, Mb):
+    """Summenterme über gemeinsame Jahre. A0/Ma dürfen einen führenden Permutations-Index haben."""
+    return {
+        "n": Ma.swapaxes(-1, -2) @ Mb,
+        "sa": A0.swapaxes(-1, -2) @ Mb,
+        "sb": Ma.swapaxes(-1, -2) @ B0,
+        "saa": (A0 ** 2).swapaxes(-1, -2) @ Mb,
+        "sbb": Ma.swapaxes(-1, -2) @ (B0 ** 2),
+        "sab": A0.swapaxes(-1, -2) @ B0,
+    }
+
+
+def pearson(s):
+    """Pearson-r aus den Summentermen von ``pairwise_sums`` (NaN bei weniger als MIN_PAARE gemeinsamen Jahren)."""
+    n = s["n"]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cov = n * s["sab"] - s["sa"] * s["sb"]
+        var_a = n * s["saa"] - s["sa"] ** 2
+        var_b = n * s["sbb"] - s["sb"] ** 2
+        r = cov / np.sqrt(var_a * var_b)
+    r[(n < MIN_PAARE) | ~np.isfinite(r)] = np.nan
+    return np.clip(r, -1, 1)
+
+# -------------------------------------------------
+# KORRELATIONSBLOCK + PERMUTATIONSTEST
+# -------------------------------------------------
+
+def change_matrices(df_cancer, df_rf):
+    """Jährliche Veränderungen (NaN als 0) und Masken zweier ausgerichteter Tabellen."""
+    A = pct_change(df_cancer.to_numpy(dtype=np.float64))
+    B = pct_change(df_rf.to_numpy(dtype=np.float64))
+    Ma, Mb = ~np.isnan(A), ~np.isnan(B)
+    return np.where(Ma, A, 0.0), Ma.astype(np.float64), np.where(Mb, B, 0.0), Mb.astype(np.float64)
+
+
+def permutation_p_values(A0, Ma, B0, Mb, r, n_permutations=5000, seed=0):
+    """Permutations-p-Werte zu ``r``. Braucht die vollständigen Reihen, nicht nur Summen."""
+    # alle Permutationen der Jahre auf einmal: (P, Jahre, Krebsarten)
+    rng = np.random.default_rng(seed)
+    perm = rng.permuted(np.broadcast_to(np.arange(len(A0)), (n_permutations, len(A0))), axis=1)
+    r_perm = pearson(pairwise_sums(A0[perm], Ma[perm], B0, Mb))
+
+    with np.errstate(invalid='ignore'):
+        extreme = (np.abs(r_perm) >= np.abs(r) - 1e-12).sum(axis=0)
+    p = (extreme + 1) / (n_permutations + 1)
+    p[np.isnan(r)] = np.nan
+    return p
+
+
+def korrelation(df_cancer, df_rf, n_permutations=5000, seed=0):
+    """Korrelationen, Permutations-p-Werte und Anzahl der Jahrespaare.
+
+    Gibt drei DataFrames (Krebsarten × Risikofaktoren) zurück: r, p, n.
+    """
+    df_cancer, df_rf = align_years(df_cancer, df_rf)
+
+    A0, Ma, B0, Mb = change_matrices(df_cancer, df_rf)
+    observed = pairwise_sums(A0, Ma, B0, Mb)
+    r = pearson(observed)
+    p = permutation_p_values(A0, Ma, B0, Mb, r, n_permutations, seed)
+
+    index, columns = df_cancer.columns, df_rf.columns
+    return (pd.DataFrame(r, index=index, columns=columns),
+            pd.DataFrame(p, index=index, columns=columns),
+            pd.DataFrame(observed["n"].astype(int), index=index, columns=columns))
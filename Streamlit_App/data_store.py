@@ -0,0 +1,300 @@
+"""Spaltenbasierter Datenspeicher für alle Datensätze der App.
+
+Die Roh-CSVs (RKI im Format ``;``/Dezimalkomma, Risikofaktoren, NHANES)
+werden einmalig in typisierte Arrow-IPC-Dateien unter ``Data/store``
+umgewandelt. Gelesen wird per Memory-Map ohne CSV-Parsing.
+
+Fehlende Werte stehen als NaN in den Float-Spalten (keine Null-Bitmap),
+damit ``to_pandas`` jede Spalte ohne Kopie direkt auf den Arrow-Puffer
+abbildet. Die DataFrames des Katalogs sind dadurch schreibgeschützt und
+liegen pro Prozess genau einmal im Speicher; alle Sessions lesen dieselben
+Puffer. Wer Werte ändern will, muss selbst eine Kopie anlegen.
+
+    python data_store.py          # alle Datensätze (neu) konvertieren
+
+Die App greift über ``catalog`` zu: jeder Datensatz wird erst beim ersten
+Zugriff geladen und danach pro Prozess wiederverwendet. Veraltet ist eine
+Datei, wenn Größe oder sha256 der Rohdatei nicht zu den in den Arrow-Metadaten
+gespeicherten Werten passen (die mtime allein reicht nicht: ``git checkout``,
+Kopieren oder Uhren im Container verschieben sie).
+"""
+
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+BASE_DIR = Path(__file__).resolve().parent
+DATA_DIR = BASE_DIR / "Data"
+STORE_DIR = DATA_DIR / "store"
+
+# Version des Speicherformats; ältere Dateien werden beim Laden neu erzeugt
+STORE_FORMAT = b"3"
+
+# -------------------------------------------------
+# DATENQUELLEN
+# -------------------------------------------------
+
+# name -> (Rohdatei, Format)
+SOURCES = {
+    "krebs_inzidenz_w": (DATA_DIR / "Krebsdaten_w.csv", "rki"),
+    "krebs_inzidenz_m": (DATA_DIR / "Krebsdaten_m.csv", "rki"),
+    "krebs_mortalitaet_w": (DATA_DIR / "Krebsdaten_Mortalität_w.csv", "rki"),
+    "krebs_mortalitaet_m": (DATA_DIR / "Krebsdaten_Mortalität_m.csv", "rki"),
+    "risikofaktoren_w": (DATA_DIR / "risk_factors_w.csv", "risikofaktoren"),
+    "risikofaktoren_m": (DATA_DIR / "risk_factors_m.csv", "risikofaktoren"),
+    "nhanes": (BASE_DIR.parent / "ML-Models" / "nhanes_clean.csv", "nhanes"),
+}
+
+# -------------------------------------------------
+# EINLESEN DER ROHDATEN
+# -------------------------------------------------
+
+def _read_rki(path):
+    df = pd.read_csv(path, sep=';', decimal=',')
+    df = df.rename(columns={'Unnamed: 0': 'Jahr'}).sort_values('Jahr', ascending=True)
+    # das abschließende ';' jeder Zeile erzeugt eine leere Spalte
+    df = df.drop(columns=[c for c in df.columns if c.startswith('Unnamed')])
+    return df.astype({'Jahr': 'int16'}).reset_index(drop=True)
+
+
+def _read_risikofaktoren(path):
+    df = pd.read_csv(path, sep=',').sort_values('Jahr', ascending=True)
+    return df.astype({'Jahr': 'int16'}).reset_index(drop=True)
+
+
+def _smallest_int(lo, hi):
+    for dtype in (np.int8, np.int16, np.int32):
+        if np.iinfo(dtype).min <= lo and hi <= np.iinfo(dtype).max:
+            return dtype
+    return np.int64
+
+
+def _read_nhanes(path):
+    df = pd.read_csv(path)
+    types = {}
+
+    for col in df.columns:
+        values = df[col].to_numpy()
+        # SAS-Export enthält 5.4e-79 statt 0, daher auf ganze Zahlen runden
+        rounded = np.round(values)
+        if not np.isnan(values).any() and np.allclose(values, rounded, rtol=0, atol=1e-9):
+            df[col] = rounded
+            types[col] = _smallest_int(rounded.min(), rounded.max())
+        else:
+            # float64 wie in der CSV: die Messwerte gehen unverändert in Training,
+            # Bootstrap-Ensemble und Referenzverteilung ein
+            types[col] = 'float64'
+
+    return df.astype(types)
+
+
+_READERS = {
+    "rki": _read_rki,
+    "risikofaktoren": _read_risikofaktoren,
+    "nhanes": _read_nhanes,
+}
+
+# -------------------------------------------------
+# KONVERTIERUNG
+# -------------------------------------------------
+
+def store_path(name):
+    return STORE_DIR / f"{name}.arrow"
+
+
+def _sha256(path):
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+# Dateistand -> sha256: unveränderte Dateien nur einmal pro Prozess hashen. Die
+# ctime setzt jedes Schreiben und auch ``touch``/``os.utime``; zurücksetzen lässt
+# sie sich nicht, anders als die mtime.
+_source_hashes = {}
+
+
+def _source_sha256(source):
+    stat = source.stat()
+    key = (source, stat.st_ino, stat.st_size, stat.st_mtime_ns, stat.st_ctime_ns)
+    if key not in _source_hashes:
+        _source_hashes[key] = _sha256(source)
+    return _source_hashes[key]
+
+
+@contextmanager
+def atomic_write(path):
+    """Binäre Temp-Datei neben ``path``, nach erfolgreichem Schreiben per ``os.replace`` übernommen.
+
+    Eigener Temp-Name je Aufruf: parallel schreibende Prozesse (App, Ingest,
+    Image-Build) überschreiben sich nicht gegenseitig die halbfertige Datei.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    f = tempfile.NamedTemporaryFile("wb", dir=path.parent, prefix=f"{path.stem}.", suffix=".tmp", delete=False)
+    try:
+        with f:
+            yield f
+        # NamedTemporaryFile legt 0600 an, die App liest ggf. unter anderem Benutzer
+        os.chmod(f.name, 0o644)
+        os.replace(f.name, path)
+    except BaseException:
+        Path(f.name).unlink(missing_ok=True)
+        raise
+
+
+def _nan_for_null(table):
+    """Nulls in Float-Spalten durch NaN ersetzen (Spalten ohne Nulls liest pandas zero-copy)."""
+    for i, field in enumerate(table.schema):
+        if pa.types.is_floating(field.type) and table.column(i).null_count:
+            table = table.set_column(i, field, pc.fill_null(table.column(i), float("nan")))
+    return table
+
+
+def convert(name):
+    """Wandelt eine Rohdatei in eine Arrow-IPC-Datei um (ohne Kompression, mmap-fähig)."""
+    source, fmt = SOURCES[name]
+    df = _READERS[fmt](source)
+
+    table = _nan_for_null(pa.Table.from_pandas(df, preserve_index=False))
+    table = table.replace_schema_metadata({
+        **(table.schema.metadata or {}),
+        b"source": source.name.encode(),
+        b"source_sha256": _source_sha256(source).encode(),
+        b"source_size": str(source.stat().st_size).encode(),
+        b"store_format": STORE_FORMAT,
+    })
+
+    target = store_path(name)
+    with atomic_write(target) as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    return target
+
+
+def convert_all():
+    return {name: convert(name) for name in SOURCES}
+
+
+def _stored_metadata(name):
+    """Schema-Metadaten der gespeicherten Datei (liest nur den Footer)."""
+    with pa.memory_map(str(store_path(name)), "r") as source:
+        return pa.ipc.open_file(source).schema.metadata or {}
+
+
+def _is_stale(name):
+    """Fehlt die Datei, hat sie ein älteres Format oder passt sie nicht zur Rohdatei (Größe, sha256)?"""
+    if not store_path(name).exists():
+        return True
+    source, _ = SOURCES[name]
+    meta = _stored_metadata(name)
+    return (meta.get(b"store_format") != STORE_FORMAT
+            or meta.get(b"source_size") != str(source.stat().st_size).encode()
+            or meta.get(b"source_sha256") != _source_sha256(source).encode())
+
+# -------------------------------------------------
+# LADEN
+# -------------------------------------------------
+
+def _read_table(name):
+    with pa.memory_map(str(store_path(name)), "r") as source:
+        return pa.ipc.open_file(source).read_all()
+
+
+def load_table(name):
+    """Liest einen Datensatz als Arrow-Tabelle per Memory-Map (zero-copy)."""
+    if _is_stale(name):
+        convert(name)
+    return _read_table(name)
+
+
+def copied_columns(df):
+    """Spalten, die pandas nicht direkt auf den Arrow-Puffer abbilden konnte (beschreibbar)."""
+    return [col for col in df.columns if df[col].to_numpy().flags.writeable]
+
+
+def load_dataset(name):
+    return load_table(name).to_pandas(split_blocks=True)
+
+
+def source_hash(name):
+    """sha256 der Rohdatei, aus der der gespeicherte Datensatz erzeugt wurde."""
+    return load_table(name).schema.metadata[b"source_sha256"].decode()
+
+
+# -------------------------------------------------
+# KATALOG
+# -------------------------------------------------
+
+class DatasetCatalog:
+    """Lädt Datensätze einzeln beim ersten Zugriff und hält sie pro Prozess vor.
+
+    ``get`` gibt immer dasselbe, schreibgeschützte DataFrame zurück (keine Kopie
+    pro Session).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}
+
+    def get(self, name):
+        if name not in SOURCES:
+            raise KeyError(f"Unbekannter Datensatz: {name}")
+
+        with self._lock:
+            entry = self._entries.get(name)
+            # neu laden, wenn sich die Rohdatei geändert hat oder der Datensatz von einem
+            # anderen Prozess neu erzeugt wurde (z.B. rki_ingest.py)
+            if entry is None or _is_stale(name) or entry["store_mtime_ns"] != store_path(name).stat().st_mtime_ns:
+                entry = self._load(name)
+                self._entries[name] = entry
+            return entry["df"]
+
+    def version(self, name):
+        self.get(name)
+        return self._entries[name]["version"]
+
+    @staticmethod
+    def _load(name):
+        start = time.perf_counter()
+        table = load_table(name)
+        df = table.to_pandas(split_blocks=True)
+        copied = copied_columns(df)
+        return {
+            "df": df,
+            "store_mtime_ns": store_path(name).stat().st_mtime_ns,
+            "version": table.schema.metadata[b"source_sha256"].decode(),
+            "load_seconds": time.perf_counter() - start,
+            "memory_bytes": int(df.memory_usage(deep=True).sum()),
+            "arrow_bytes": table.nbytes,
+            "copied_columns": copied,
+            "loaded_at": time.time(),
+        }
+
+    def stats(self):
+        with self._lock:
+            return {
+                name: {k: v for k, v in entry.items() if k != "df"}
+                for name, entry in self._entries.items()
+            }
+
+
+# eine Instanz pro Prozess, von allen Seiten und Sessions geteilt
+catalog = DatasetCatalog()
+
+
+def data_version(*names):
+    """Cache-Schlüssel aus den Hashes der angegebenen Datensätze."""
+    return tuple(catalog.version(name) for name in names)
+
+
+if __name__ == "__main__":
+    for name, path in convert_all().items():
+        source, _ = SOURCES[name]
+        print(f"{name:22s} {source.stat().st_size / 1024:8.1f} KB CSV -> {path.stat().st_size / 1024:8.1f} KB Arrow")
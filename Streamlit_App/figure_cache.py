@@ -0,0 +1,71 @@
+"""Prozessweiter Cache für fertig gebaute Plotly-Abbildungen.
+
+Jede Abbildung wird pro Datenversion (Hash der Rohdateien) genau einmal
+gebaut. ``st.plotly_chart`` erhält danach das fertige Figure-Objekt: ein
+Dict würde dort erneut komplett validiert (~50 ms), ein Figure-Objekt wird
+nur noch in JSON umgewandelt.
+
+Treffer, Neubauten und Bauzeiten je Abbildung (``stats()``) erscheinen im
+Performance-Panel und im Prometheus-Export von perf.py.
+"""
+
+import hashlib
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class FigureCache:
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._figures = {}
+        self._stats = {}
+
+    @staticmethod
+    def _key(name, version):
+        digest = hashlib.sha256(repr(version).encode()).hexdigest()[:16]
+        return f"{name}-{digest}"
+
+    def get(self, name, version, build):
+        """Gibt die Abbildung ``name`` für ``version`` zurück, ``build()`` nur beim ersten Aufruf."""
+        key = self._key(name, version)
+
+        with self._lock:
+            stats = self._stats.setdefault(name, {"hits": 0, "misses": 0, "build_seconds": 0.0,
+                                                  "build_seconds_total": 0.0})
+            cached = self._figures.get(key)
+            if cached is not None:
+                stats["hits"] += 1
+                return cached
+
+        start = time.perf_counter()
+        fig = build()
+        build_seconds = time.perf_counter() - start
+
+        with self._lock:
+            # ältere Versionen derselben Abbildung verwerfen
+            for old in [k for k in self._figures if k.startswith(f"{name}-") and k != key]:
+                del self._figures[old]
+            self._figures[key] = fig
+            stats["misses"] += 1
+            stats["build_seconds"] = build_seconds
+            stats["build_seconds_total"] += build_seconds
+
+        logger.info("Abbildung %s gebaut in %.1f ms", name, build_seconds * 1e3)
+        return fig
+
+    def stats(self):
+        """{name: {hits, misses, hit_rate, build_seconds (letzter Bau), build_seconds_total}}."""
+        with self._lock:
+            report = {}
+            for name, s in self._stats.items():
+                total = s["hits"] + s["misses"]
+                report[name] = {**s, "hit_rate": s["hits"] / total if total else 0.0}
+            return report
+
+
+# eine Instanz pro Prozess, von allen Sessions geteilt
+figure_cache = FigureCache()
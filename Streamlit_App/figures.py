@@ -0,0 +1,206 @@
+"""Aufbau der Plotly-Abbildungen für streamlit_cancer_inzidence.py.
+
+Die Funktionen sind reine Builder (Daten rein, ``go.Figure`` raus) und
+werden über ``figure_cache`` nur einmal pro Datenversion aufgerufen.
+"""
+
+import numpy as np
+import plotly.graph_objects as go
+
+# -------------------------------------------------
+# ZEITVERLAUF INZIDENZ / MORTALITÄT
+# -------------------------------------------------
+
+def build_verlauf_figure(df_w, df_m, default_typ, title, yaxis_title, initial_title=None):
+    """Eine Linie je Krebsart und Geschlecht, Auswahl der Krebsart per Drop-Down."""
+    typs_w = list(df_w.columns.drop('Jahr'))
+    typs_m = list(df_m.columns.drop('Jahr'))
+    typs_all = sorted(set(typs_w).union(typs_m))
+
+    fig = go.Figure()
+
+    # für Frauen
+    for typ in typs_w:
+        fig.add_trace(go.Scatter(x=df_w['Jahr'],
+                                 y=df_w[typ],
+                                 mode='lines+markers',
+                                 name=f'{typ} (Frauen)',
+                                 visible=(typ == default_typ)))
+
+    # für Männer
+    for typ in typs_m:
+        fig.add_trace(go.Scatter(x=df_m['Jahr'],
+                                 y=df_m[typ],
+                                 mode='lines+markers',
+                                 name=f'{typ} (Männer)',
+                                 visible=(typ == default_typ)))
+
+    # Drop Down Menü: Trace-Positionen einmal nachschlagen statt list(...).index() je Button
+    position_w = {typ: i for i, typ in enumerate(typs_w)}
+    position_m = {typ: len(typs_w) + i for i, typ in enumerate(typs_m)}
+    n_traces = len(typs_w) + len(typs_m)
+
+    buttons = []
+    for typ in typs_all:
+        visible_arr = [False] * n_traces
+        if typ in position_w:
+            visible_arr[position_w[typ]] = True
+        if typ in position_m:
+            visible_arr[position_m[typ]] = True
+
+        buttons.append(dict(
+            label=typ,
+            method='update',
+            args=[{'visible': visible_arr},
+                  {'title': f'{title}: {typ}'}]
+        ))
+
+    fig.update_layout(
+        autosize=False,
+        width=1600,
+        height=800,
+        updatemenus=[dict(active=typs_all.index(default_typ), buttons=buttons)],
+        title=f'{initial_title or title}: {default_typ}',
+        xaxis_title='Jahr',
+        yaxis_title=yaxis_title,
+        template='plotly_white')
+
+    return fig
+
+# -------------------------------------------------
+# ZEITVERLAUF RISIKOFAKTOREN
+# -------------------------------------------------
+
+def _risikofaktor_yaxis_title(factor):
+    if factor == 'Alkoholkonsum_avg_täglich(g)':
+        return 'Durchschnittlicher Alkoholkonsum täglich (in g)'
+    if factor == 'Feinstaubkonzentration (PM2.5)':
+        return 'Feinstaubkonzentration (PM2.5)'
+    return 'Altersandardisierte Prävalenz (%)'
+
+
+def build_risikofaktoren_figure(df_w, df_m):
+    factors_w = list(df_w.columns.drop('Jahr'))
+    factors_m = list(df_m.columns.drop('Jahr'))
+    factors_all = sorted(set(factors_w).union(factors_m))
+
+    fig = go.Figure()
+
+    # für Frauen
+    for factor in factors_w:
+        fig.add_trace(go.Scatter(x=df_w['Jahr'],
+                                 y=df_w[factor],
+                                 mode='lines+markers',
+                                 name=f'{factor} (Frauen)',
+                                 visible=(factor == factors_all[0])))
+
+    # für Männer
+    for factor in factors_m:
+        fig.add_trace(go.Scatter(x=df_m['Jahr'],
+                                 y=df_m[factor],
+                                 mode='lines+markers',
+                                 name=f'{factor} (Männer)',
+                                 visible=(factor == factors_all[0])))
+
+    # Drop Down Menü
+    trace_factors = factors_w + factors_m
+
+    buttons = []
+    for factor in factors_all:
+        buttons.append(dict(
+            label=factor,
+            method='update',
+            args=[{'visible': [f == factor for f in trace_factors]},
+                  {'title': f'Zeitverlauf Risikofaktor: {factor}',
+                   'yaxis': {'title': _risikofaktor_yaxis_title(factor)}}]
+        ))
+
+    fig.update_layout(
+        autosize=False,
+        width=1600,
+        height=800,
+        updatemenus=[dict(active=0, buttons=buttons)],
+        title=f'Zeitverlauf Risikofaktor: {factors_all[0]}',
+        xaxis_title='Jahr',
+        yaxis_title='Altersandardisierte Prävalenz (%)',
+        template='plotly_white'
+    )
+
+    return fig
+
+# -------------------------------------------------
+# KORRELATIONS-HEATMAP
+# -------------------------------------------------
+
+def build_korrelation_heatmap(corr, p_values=None):
+    """Heatmap der Korrelationskoeffizienten, p-Werte (Permutationstest) im Hover."""
+    hover = dict(hovertemplate='%{y}<br>%{x}<br>r = %{z:.2f}<extra></extra>')
+    if p_values is not None:
+        hover = dict(customdata=p_values.loc[corr.index, corr.columns].values,
+                     hovertemplate='%{y}<br>%{x}<br>r = %{z:.2f}<br>p = %{customdata:.3f}<extra></extra>')
+
+    fig = go.Figure(data=go.Heatmap(
+        z=corr.values,
+        x=corr.columns,
+        y=corr.index,
+        colorscale='RdBu_r',
+        zmid=0,
+        zmin=-1,
+        zmax=1,
+        colorbar=dict(title="Korrelationskoeffizient"),
+        **hover
+    ))
+    fig.update_layout(width=1000, height=600, template='plotly_white')
+    return fig
+
+# -------------------------------------------------
+# PROGNOSE (Overlay auf die Verlaufsabbildungen)
+# -------------------------------------------------
+
+def add_prognose_traces(fig, prognosen, methode):
+    """Prognose je Serie und Geschlecht an eine Verlaufsabbildung mit Drop-Down anhängen.
+
+    prognosen: {'Frauen' | 'Männer': {serie: (jahre, mittel, unten, oben)}}. Linie
+    (gestrichelt) und Intervallband erhalten die Farbe des zugehörigen Verlaufs und
+    werden über das Drop-Down zusammen mit der Serie ein- und ausgeblendet.
+    """
+    menu = fig.layout.updatemenus[0]
+    aktiv = menu.buttons[menu.active].label
+    farben = fig.layout.template.layout.colorway
+    position = {trace.name: i for i, trace in enumerate(fig.data)}
+
+    trace_series = []
+    for geschlecht, serien in prognosen.items():
+        for serie, (jahre, mittel, unten, oben) in serien.items():
+            name = f'{serie} ({geschlecht})'
+            if name not in position:
+                continue
+            farbe = farben[position[name] % len(farben)]
+
+            fig.add_trace(go.Scatter(x=np.concatenate([jahre, jahre[::-1]]),
+                                     y=np.concatenate([oben, unten[::-1]]),
+                                     fill='toself',
+                                     fillcolor=farbe,
+                                     opacity=0.2,
+                                     line=dict(width=0),
+                                     hoverinfo='skip',
+                                     showlegend=False,
+                                     name=f'{name}, Prognoseintervall',
+                                     visible=(serie == aktiv)))
+            fig.add_trace(go.Scatter(x=jahre,
+                                     y=mittel,
+                                     mode='lines',
+                                     line=dict(color=farbe, dash='dash'),
+                                     name=f'{name}, Prognose {methode}',
+                                     visible=(serie == aktiv)))
+            trace_series += [serie, serie]
+
+    # Sichtbarkeit der neuen Traces in jedem Button ergänzen
+    buttons = []
+    for button in menu.buttons:
+        update, *rest = button.args
+        visible = list(update['visible']) + [serie == button.label for serie in trace_series]
+        buttons.append(dict(label=button.label, method=button.method, args=[{**update, 'visible': visible}, *rest]))
+    menu.buttons = buttons
+
+    return fig
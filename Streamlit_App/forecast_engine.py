@@ -0,0 +1,264 @@
+"""Prognosen für alle Serien der Inzidenz-, Mortalitäts- und Risikofaktor-Daten.
+
+Jede Serie (Krebsart bzw. Risikofaktor, je Geschlecht) wird mit drei Modellen
+HORIZONT Jahre über ihr letztes Beobachtungsjahr hinaus fortgeschrieben,
+jeweils mit 95%-Prognoseintervall:
+
+    linear      OLS y = a + b·Jahr wie in trend_engine.py, Intervall aus der t-Verteilung
+    loglinear   OLS log(y) = a + b·Jahr (konstante prozentuale Veränderung)
+    holt        exponentielle Glättung mit Trend (Holt, ETS(A,A,N) aus statsmodels)
+
+Die OLS-Modelle werden für alle Serien eines Datensatzes auf einmal in
+geschlossener Form gerechnet (fehlende Jahre maskiert), die Holt-Fits laufen
+parallel in einem Prozesspool. Holt braucht lückenlose Jahre und nutzt den
+letzten zusammenhängenden Abschnitt mit mindestens HOLT_MIN_JAHRE Werten,
+sonst bleibt die Prognose leer (NaN).
+
+Gespeichert unter ``Data/store/forecasts.npz``, je Datensatz mit seiner
+Datenversion. Gebaut wird beim Docker-Build und nach ``rki_ingest.py``; die
+App fittet beim Rerun nichts und lädt die Datei einmal pro Prozess. Fehlt sie
+oder ist ein Datensatz veraltet, rechnet die App ihn seriell nach (kein
+Prozesspool aus dem Streamlit-Server heraus).
+
+    python forecast_engine.py     # alle Prognosen rechnen
+"""
+
+import json
+import logging
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from data_store import STORE_DIR, atomic_write, catalog
+from trend_engine import JAHR_REFERENZ, TREND_SOURCES, sufficient_statistics
+
+FORECAST_PATH = STORE_DIR / "forecasts.npz"
+
+logger = logging.getLogger(__name__)
+
+# Kürzel -> Anzeigename
+METHODS = {
+    "linear": "Linear",
+    "loglinear": "Log-linear",
+    "holt": "Holt",
+}
+
+HORIZONT = 10
+LEVEL = 0.95
+HOLT_MIN_JAHRE = 10
+
+
+def source_names():
+    return sorted(set(TREND_SOURCES.values()))
+
+
+def last_observed(df):
+    """(Jahr, Wert) der letzten vorhandenen Beobachtung je Serie."""
+    jahre = df['Jahr'].to_numpy()
+    Y = df.drop(columns='Jahr').to_numpy(dtype=np.float64)
+    last = len(Y) - 1 - (~np.isnan(Y))[::-1].argmax(axis=0)
+    return jahre[last], Y[last, np.arange(Y.shape[1])]
+
+# -------------------------------------------------
+# OLS (alle Serien auf einmal)
+# -------------------------------------------------
+
+def ols_forecast(df, jahre, level=LEVEL):
+    """Mittel, untere und obere Grenze (Serien × 3 × Horizont) für die Prognosejahre ``jahre``."""
+    s = sufficient_statistics(df)
+    n = s["n"][:, None]
+    x0 = jahre - JAHR_REFERENZ
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        xbar = s["sx"][:, None] / n
+        Sxx = s["sxx"][:, None] - s["sx"][:, None] * xbar
+        Sxy = s["sxy"][:, None] - s["sx"][:, None] * s["sy"][:, None] / n
+        Syy = s["syy"][:, None] - s["sy"][:, None] ** 2 / n
+
+        slope = Sxy / Sxx
+        mean = s["sy"][:, None] / n + slope * (x0 - xbar)
+        sigma = np.sqrt(np.maximum(Syy - slope * Sxy, 0.0) / (n - 2))
+        se = sigma * np.sqrt(1 + 1 / n + (x0 - xbar) ** 2 / Sxx)
+        t_crit = stats.t.ppf(0.5 + level / 2, n - 2)
+
+    return np.stack([mean, mean - t_crit * se, mean + t_crit * se], axis=1)
+
+
+def loglinear_forecast(df, jahre, level=LEVEL):
+    """OLS auf log(y), zurücktransformiert; nur für Serien mit ausschließlich positiven Werten."""
+    Y = df.drop(columns='Jahr').to_numpy(dtype=np.float64)
+    positiv = (np.nan_to_num(Y, nan=1.0) > 0).all(axis=0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        df_log = pd.DataFrame(np.where(positiv, np.log(Y), np.nan), columns=df.columns.drop('Jahr'))
+    df_log.insert(0, 'Jahr', df['Jahr'].to_numpy())
+    return np.exp(ols_forecast(df_log, jahre, level))
+
+# -------------------------------------------------
+# HOLT (im Prozesspool)
+# -------------------------------------------------
+
+def _holt_forecast(jahre, y, horizont, level):
+    """Holt-Prognose einer Serie (3 × Horizont) ab ihrem letzten Beobachtungsjahr."""
+    result = np.full((3, horizont), np.nan)
+    valid = np.flatnonzero(~np.isnan(y))
+    if len(valid) == 0:
+        return result
+
+    # letzter lückenloser Abschnitt (aufeinanderfolgende Jahre mit Werten)
+    end = start = valid[-1]
+    while start > 0 and not np.isnan(y[start - 1]) and jahre[start] - jahre[start - 1] == 1:
+        start -= 1
+    if end - start + 1 < HOLT_MIN_JAHRE:
+        return result
+
+    from statsmodels.tsa.exponential_smoothing.ets import ETSModel
+
+    serie = pd.Series(y[start:end + 1])
+    with warnings.catch_warnings():
+        # Konvergenzhinweise der Optimierung bei kurzen Reihen
+        warnings.simplefilter('ignore')
+        fit = ETSModel(serie, error='add', trend='add').fit(disp=False)
+        frame = fit.get_prediction(start=len(serie), end=len(serie) + horizont - 1).summary_frame(alpha=1 - level)
+
+    result[:] = frame[['mean', 'pi_lower', 'pi_upper']].to_numpy().T
+    return result
+
+
+def build_forecasts(names=None, horizont=HORIZONT, level=LEVEL, workers=None, parallel=True):
+    """Prognosen aller Modelle für die Datensätze ``names`` (Standard: alle).
+
+    ``parallel=False`` rechnet die Holt-Fits ohne Prozesspool.
+    """
+    names = names or source_names()
+    frames = {name: catalog.get(name) for name in names}
+
+    arrays, serien = {}, {}
+    for name, df in frames.items():
+        letztes_jahr, letzter_wert = last_observed(df)
+        jahre = letztes_jahr[:, None] + np.arange(1, horizont + 1)
+        arrays[f"{name}/jahre"] = jahre
+        arrays[f"{name}/letztes_jahr"] = letztes_jahr
+        arrays[f"{name}/letzter_wert"] = letzter_wert
+        arrays[f"{name}/linear"] = ols_forecast(df, jahre, level)
+        arrays[f"{name}/loglinear"] = loglinear_forecast(df, jahre, level)
+        serien[name] = list(df.columns.drop('Jahr'))
+
+    # Holt: ein Fit je Serie, alle Serien aller Datensätze in einem Pool
+    aufgaben = [(name, serie) for name in names for serie in serien[name]]
+    with ProcessPoolExecutor(max_workers=workers) if parallel else nullcontext() as pool:
+        results = list((pool.map if parallel else map)(_holt_forecast,
+                                [frames[name]['Jahr'].to_numpy() for name, _ in aufgaben],
+                                [frames[name][serie].to_numpy(dtype=np.float64) for name, serie in aufgaben],
+                                [horizont] * len(aufgaben),
+                                [level] * len(aufgaben)))
+    for name in names:
+        arrays[f"{name}/holt"] = np.stack([r for (n, _), r in zip(aufgaben, results) if n == name])
+
+    meta = {
+        "versions": {name: catalog.version(name) for name in names},
+        "serien": serien,
+        "horizont": horizont,
+        "level": level,
+    }
+    return Forecasts(arrays, meta)
+
+# -------------------------------------------------
+# ZUGRIFF
+# -------------------------------------------------
+
+class Forecasts:
+    """Nachschlagen der gespeicherten Prognosen, ohne zur Laufzeit zu fitten."""
+
+    def __init__(self, arrays, meta):
+        self.arrays = arrays
+        self.meta = meta
+
+    @property
+    def level(self):
+        return self.meta["level"]
+
+    def prognose(self, name, method, horizont=HORIZONT):
+        """{serie: (jahre, mittel, unten, oben)} für die ersten ``horizont`` Jahre.
+
+        Vorne steht jeweils die letzte Beobachtung (Intervall ohne Breite), damit
+        die Prognose in der Abbildung an den Verlauf anschließt. Serien ohne
+        Prognose (z.B. Holt bei zu kurzen Reihen) fehlen.
+        """
+        values = self.arrays[f"{name}/{method}"][:, :, :horizont]
+        jahre = self.arrays[f"{name}/jahre"][:, :horizont]
+        letztes_jahr = self.arrays[f"{name}/letztes_jahr"]
+        letzter_wert = self.arrays[f"{name}/letzter_wert"]
+
+        result = {}
+        for i, serie in enumerate(self.meta["serien"][name]):
+            if np.isnan(values[i, 0]).all():
+                continue
+            result[serie] = (np.concatenate([[letztes_jahr[i]], jahre[i]]),
+                             *(np.concatenate([[letzter_wert[i]], v]) for v in values[i]))
+        return result
+
+    def merge(self, other):
+        """Datensätze aus ``other`` übernehmen (neu gerechnete ersetzen die alten)."""
+        names = set(other.meta["serien"])
+        arrays = {k: v for k, v in self.arrays.items() if k.split("/")[0] not in names}
+        meta = {
+            **self.meta,
+            "versions": {**self.meta["versions"], **other.meta["versions"]},
+            "serien": {**self.meta["serien"], **other.meta["serien"]},
+        }
+        return Forecasts({**arrays, **other.arrays}, meta)
+
+    def save(self, path=FORECAST_PATH):
+        with atomic_write(path) as f:
+            np.savez_compressed(f, meta=np.array(json.dumps(self.meta, ensure_ascii=False)), **self.arrays)
+        return path
+
+    @classmethod
+    def load(cls, path=FORECAST_PATH):
+        with np.load(path) as data:
+            meta = json.loads(str(data["meta"]))
+            arrays = {k: data[k] for k in data.files if k != "meta"}
+        return cls(arrays, meta)
+
+
+def load_forecasts(path=FORECAST_PATH, names=None, parallel=False):
+    """Gespeicherte Prognosen; Datensätze mit geänderter Datenversion werden neu gerechnet.
+
+    Mit ``names`` werden nur diese Datensätze geprüft. In der App seriell,
+    ``parallel=True`` für Skripte außerhalb des Servers (z.B. rki_ingest.py).
+    """
+    names = names or source_names()
+    forecasts = None
+    if path.exists():
+        forecasts = Forecasts.load(path)
+        if (forecasts.meta["horizont"], forecasts.meta["level"]) != (HORIZONT, LEVEL):
+            forecasts = None
+
+    if forecasts is None:
+        veraltet = source_names()
+    else:
+        veraltet = [name for name in names if forecasts.meta["versions"].get(name) != catalog.version(name)]
+        if not veraltet:
+            return forecasts
+
+    logger.warning("Prognosen für %s fehlen oder sind veraltet, werden neu gerechnet", ", ".join(veraltet))
+    neu = build_forecasts(veraltet, parallel=parallel)
+    forecasts = neu if forecasts is None else forecasts.merge(neu)
+    forecasts.save(path)
+    return forecasts
+
+
+if __name__ == "__main__":
+    import time
+
+    start = time.perf_counter()
+    forecasts = build_forecasts()
+    path = forecasts.save()
+    n_serien = sum(len(s) for s in forecasts.meta["serien"].values())
+    ohne_holt = sum(len(s) - len(forecasts.prognose(name, "holt")) for name, s in forecasts.meta["serien"].items())
+    print(f"{n_serien} Serien × {len(METHODS)} Modelle, {HORIZONT} Jahre in {time.perf_counter() - start:.1f} s "
+          f"-> {path} ({path.stat().st_size / 1024:.0f} KB), ohne Holt-Prognose: {ohne_holt}")
@@ -0,0 +1,327 @@
+"""Inkrementelles Nachtrainieren des Risikomodells bei neuen NHANES-Zyklen.
+
+Statt das Notebook bzw. ``train_model.py`` komplett neu laufen zu lassen,
+werden nur die neuen Zeilen (SEQN größer als bisher gesehen) blockweise
+gelesen. Pro Block werden
+
+  1. die Scaler-Statistiken (Anzahl, Mittelwert, Varianz) fortgeschrieben und
+     die Koeffizienten so umgerechnet, dass das Modell im Rohraum gleich bleibt,
+  2. die Logistische Regression per Mini-Batch-Gradientenabstieg (partial fit,
+     Gewichtung wie ``class_weight="balanced"``) aktualisiert.
+
+Der Speicherbedarf hängt nur von ``--chunksize`` ab. Jeder Lauf schreibt ein
+neues, versioniertes Artefakt im Format von ``NumpyRiskModel`` und einen
+Bericht, der die Metriken mit der Vorversion auf einem festen Holdout
+vergleicht. Trainingsgrenze (größte SEQN) und Holdout-SEQNs stammen aus
+``risk_model_lvl2.split.json``, das train_model.py zur Pipeline schreibt: neu
+ist, was nach dem Training der Pipeline angehängt wurde, und der Holdout
+bleibt der des ursprünglichen Fits.
+
+    python incremental_training.py                      # neue Zeilen aus nhanes_clean.csv
+    python incremental_training.py neuer_zyklus.csv     # oder aus einer eigenen Datei
+    python incremental_training.py --deploy             # Ergebnis als risk_model_lvl2.json übernehmen
+
+Ausgangspunkt beim ersten Lauf ist die ausgelieferte Pipeline (risk_model_lvl2.pkl).
+Jede Version merkt sich deren sha256; wurde die Pipeline seitdem ersetzt (z.B.
+``train_model.py --deploy``), beginnt die Kette wieder bei ihr, statt ältere
+Versionen fortzuschreiben und mit ``--deploy`` auszurollen.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from data_store import SOURCES, catalog
+from risk_model import ARTIFACT_PATH, ARTIFACT_VERSION, MODEL_DIR, MODEL_PATH, NumpyRiskModel, expected_features
+from train_model import LEVEL_2_VARS, RANDOM_STATE, TARGET, holdout_metrics, load_split
+
+INCREMENTAL_DIR = MODEL_DIR / "incremental"
+
+CHUNKSIZE = 2000
+BATCH_SIZE = 256
+EPOCHS = 3
+ETA0 = 0.05
+
+# -------------------------------------------------
+# STREAMING-SCALER
+# -------------------------------------------------
+
+class StreamingScaler:
+    """Laufende Anzahl, Mittelwert und Varianz (Chan et al.), wie StandardScaler.partial_fit."""
+
+    def __init__(self, n, mean, var):
+        self.n = int(n)
+        self.mean = np.asarray(mean, dtype=np.float64)
+        self.var = np.asarray(var, dtype=np.float64)
+
+    @property
+    def scale(self):
+        scale = np.sqrt(self.var)
+        # konstante Spalten wie bei scikit-learn nicht skalieren
+        return np.where(scale < 10 * np.finfo(np.float64).eps, 1.0, scale)
+
+    def update(self, X):
+        n_b = len(X)
+        if n_b == 0:
+            return
+        mean_b = X.mean(axis=0)
+        m2_b = ((X - mean_b) ** 2).sum(axis=0)
+
+        n = self.n + n_b
+        delta = mean_b - self.mean
+        m2 = self.var * self.n + m2_b + delta ** 2 * self.n * n_b / n
+        self.mean = self.mean + delta * n_b / n
+        self.var = m2 / n
+        self.n = n
+
+    def transform(self, X):
+        return (X - self.mean) / self.scale
+
+# -------------------------------------------------
+# ONLINE-LOGISTISCHE REGRESSION
+# -------------------------------------------------
+
+class OnlineLogisticRegression:
+    """L2-regularisierte Logistische Regression im standardisierten Raum, per Mini-Batch-SGD."""
+
+    def __init__(self, coef, intercept, alpha, steps=0):
+        self.coef = np.asarray(coef, dtype=np.float64)
+        self.intercept = float(intercept)
+        self.alpha = float(alpha)
+        self.steps = int(steps)
+
+    def rescale(self, old_mean, old_scale, new_mean, new_scale):
+        """Koeffizienten an neue Scaler-Statistiken anpassen, ohne die Vorhersage zu ändern."""
+        raw = self.coef / old_scale
+        self.intercept += float(raw @ (new_mean - old_mean))
+        self.coef = raw * new_scale
+
+    def partial_fit(self, Z, y, sample_weight, epochs=EPOCHS, batch_size=BATCH_SIZE, seed=RANDOM_STATE):
+        rng = np.random.default_rng(seed + self.steps)
+        for _ in range(epochs):
+            order = rng.permutation(len(Z))
+            for start in range(0, len(Z), batch_size):
+                idx = order[start:start + batch_size]
+                z, t, w = Z[idx], y[idx], sample_weight[idx]
+
+                p = 1.0 / (1.0 + np.exp(-(z @ self.coef + self.intercept)))
+                residual = w * (p - t) / w.sum()
+                lr = ETA0 / np.sqrt(1.0 + self.steps / 100)
+
+                self.coef -= lr * (z.T @ residual + self.alpha * self.coef)
+                self.intercept -= lr * residual.sum()
+                self.steps += 1
+
+# -------------------------------------------------
+# ZUSTAND UND ARTEFAKTE
+# -------------------------------------------------
+
+def artifact_path(version):
+    return INCREMENTAL_DIR / f"{MODEL_PATH.stem}_v{version:04d}.json"
+
+
+def versions():
+    """Versionsnummer -> Pfad aller inkrementellen Artefakte."""
+    return {int(m.group(1)): p for p in INCREMENTAL_DIR.glob(f"{MODEL_PATH.stem}_v*.json")
+            if (m := re.search(r"_v(\d+)\.json$", p.name))}
+
+
+def latest_version(base_sha256):
+    """Neueste Version, die auf der Pipeline mit ``base_sha256`` aufbaut (0 = die Pipeline selbst)."""
+    passend = [version for version, path in versions().items()
+               if json.loads(path.read_text(encoding="utf-8"))["incremental"].get("base_sha256") == base_sha256]
+    return max(passend, default=0)
+
+
+def _initial_state(split):
+    """Zustand aus der ausgelieferten scikit-learn-Pipeline (Version 0)."""
+    import joblib
+
+    pipeline = joblib.load(MODEL_PATH)
+    scaler = pipeline.named_steps["scaler"]
+    model = pipeline.named_steps["model"]
+
+    # Klassenhäufigkeiten des Trainingsteils (bis zur Trainingsgrenze, ohne Holdout) wie beim ursprünglichen Fit
+    df = catalog.get("nhanes")
+    _, y = _labelled(df[(df["SEQN"] <= split["max_seqn"]) & ~df["SEQN"].isin(split["holdout_seqn"])])
+    counts = np.bincount(y, minlength=2)
+    scaler_state = StreamingScaler(scaler.n_samples_seen_, scaler.mean_, scaler.var_)
+    logit = OnlineLogisticRegression(model.coef_.ravel(), model.intercept_[0],
+                                     alpha=1.0 / (model.C * scaler.n_samples_seen_))
+    return {
+        "model_version": 0,
+        "scaler": scaler_state,
+        "model": logit,
+        "class_counts": counts.tolist(),
+        "max_seqn": split["max_seqn"],
+        "source_sha256": split["model_sha256"],
+        "base_sha256": split["model_sha256"],
+    }
+
+
+def load_state(version, split):
+    if version == 0:
+        return _initial_state(split)
+
+    artifact = json.loads(artifact_path(version).read_text(encoding="utf-8"))
+    inc = artifact["incremental"]
+    return {
+        "model_version": version,
+        "scaler": StreamingScaler(inc["n_samples_seen"], artifact["scaler_mean"], inc["scaler_var"]),
+        "model": OnlineLogisticRegression(artifact["coef"], artifact["intercept"], inc["alpha"], inc["steps"]),
+        "class_counts": inc["class_counts"],
+        "max_seqn": inc["max_seqn"],
+        "source_sha256": artifact["source_sha256"],
+        "base_sha256": inc["base_sha256"],
+    }
+
+
+def to_artifact(state, parent):
+    scaler, model = state["scaler"], state["model"]
+    artifact = {
+        "version": ARTIFACT_VERSION,
+        "source": f"incremental v{state['model_version']}",
+        "features": list(expected_features),
+        "scaler_mean": scaler.mean.tolist(),
+        "scaler_scale": scaler.scale.tolist(),
+        "coef": model.coef.tolist(),
+        "intercept": model.intercept,
+        "incremental": {
+            "model_version": state["model_version"],
+            "parent_version": parent,
+            "parent_sha256": state["source_sha256"],
+            "base_sha256": state["base_sha256"],
+            "n_samples_seen": scaler.n,
+            "scaler_var": scaler.var.tolist(),
+            "alpha": model.alpha,
+            "steps": model.steps,
+            "class_counts": state["class_counts"],
+            "max_seqn": state["max_seqn"],
+        },
+    }
+    # Modellkennung für Registry/Health: Hash über die Parameter
+    artifact["source_sha256"] = hashlib.sha256(json.dumps(artifact, sort_keys=True).encode()).hexdigest()
+    return artifact
+
+# -------------------------------------------------
+# HOLDOUT
+# -------------------------------------------------
+
+def _labelled(df):
+    df = df[df[TARGET].isin([1, 2])]
+    return df[LEVEL_2_VARS].to_numpy(dtype=np.float64), (df[TARGET] == 1).to_numpy(dtype=np.int64)
+
+
+def holdout_frame(seqn):
+    df = catalog.get("nhanes")
+    df = df[df["SEQN"].isin(seqn) & df[TARGET].isin([1, 2])]
+    return df[LEVEL_2_VARS], (df[TARGET] == 1).astype(int)
+
+# -------------------------------------------------
+# UPDATE
+# -------------------------------------------------
+
+def iter_new_rows(path, max_seqn, exclude, chunksize=CHUNKSIZE):
+    """(X, y, SEQN) je Block für Zeilen mit SEQN > max_seqn, ohne Holdout."""
+    columns = ["SEQN", TARGET] + LEVEL_2_VARS
+    for chunk in pd.read_csv(path, chunksize=chunksize, usecols=columns):
+        chunk = chunk[(chunk["SEQN"] > max_seqn) & ~chunk["SEQN"].isin(exclude)]
+        if len(chunk):
+            X, y = _labelled(chunk)
+            yield X, y, int(chunk["SEQN"].max())
+
+
+def update(state, path, exclude, chunksize=CHUNKSIZE):
+    """Schreibt Scaler und Modell mit allen neuen Zeilen aus ``path`` fort."""
+    scaler, model = state["scaler"], state["model"]
+    counts = np.asarray(state["class_counts"], dtype=np.int64)
+    n_rows = 0
+
+    for X, y, max_seqn in iter_new_rows(path, state["max_seqn"], exclude, chunksize):
+        old_mean, old_scale = scaler.mean.copy(), scaler.scale
+        scaler.update(X)
+        model.rescale(old_mean, old_scale, scaler.mean, scaler.scale)
+
+        # Gewichte wie class_weight="balanced", aus den bisher gesehenen Klassenhäufigkeiten
+        counts += np.bincount(y, minlength=2)
+        class_weight = counts.sum() / (2 * np.maximum(counts, 1))
+        model.partial_fit(scaler.transform(X), y, class_weight[y])
+
+        state["max_seqn"] = max(state["max_seqn"], max_seqn)
+        n_rows += len(X)
+
+    state["class_counts"] = counts.tolist()
+    return n_rows
+
+
+def run(path=None, chunksize=CHUNKSIZE):
+    path = Path(path or SOURCES["nhanes"][0])
+    split = load_split(MODEL_PATH)
+    parent = latest_version(split["model_sha256"])
+    version = max(versions(), default=0) + 1
+    seqn = set(split["holdout_seqn"])
+    state = load_state(parent, split)
+    previous = NumpyRiskModel(to_artifact(state, parent))
+
+    n_rows = update(state, path, seqn, chunksize)
+    if n_rows == 0:
+        return None, None
+
+    state["model_version"] = version
+    artifact = to_artifact(state, parent)
+    X_hold, y_hold = holdout_frame(seqn)
+    report = {
+        "model_version": version,
+        "parent_version": parent,
+        "input": path.name,
+        "new_rows": n_rows,
+        "chunksize": chunksize,
+        "n_holdout": len(X_hold),
+        "holdout_metrics": {
+            "vorher": holdout_metrics(previous, X_hold, y_hold),
+            "neu": holdout_metrics(NumpyRiskModel(artifact), X_hold, y_hold),
+        },
+    }
+
+    INCREMENTAL_DIR.mkdir(parents=True, exist_ok=True)
+    target = artifact_path(version)
+    tmp = target.with_suffix(".tmp")
+    tmp.write_text(json.dumps(artifact, ensure_ascii=False, indent=1), encoding="utf-8")
+    os.replace(tmp, target)
+    target.with_name(target.stem + ".report.json").write_text(json.dumps(report, ensure_ascii=False, indent=1))
+    return target, report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("input", nargs="?", help="CSV mit neuen Zeilen (Standard: nhanes_clean.csv)")
+    parser.add_argument("--chunksize", type=int, default=CHUNKSIZE)
+    parser.add_argument("--deploy", action="store_true", help=f"neue Version als {ARTIFACT_PATH.name} übernehmen")
+    args = parser.parse_args(argv)
+
+    target, report = run(args.input, args.chunksize)
+    if target is None:
+        print("Keine neuen Zeilen, Modell unverändert.")
+        return
+
+    basis = f"v{report['parent_version']:04d}" if report["parent_version"] else MODEL_PATH.name
+    print(f"Version {report['model_version']} auf Basis von {basis}: {report['new_rows']} neue Zeilen -> {target}")
+    print(f"Holdout ({report['n_holdout']} Personen):")
+    for label, metrics in report["holdout_metrics"].items():
+        print(f"  {label:7s} " + "  ".join(f"{k} {v:.3f}" for k, v in metrics.items()))
+
+    if args.deploy:
+        # die Registry lädt das Artefakt beim nächsten Zugriff neu
+        shutil.copyfile(target, ARTIFACT_PATH)
+        print(f"-> {ARTIFACT_PATH} aktualisiert")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Live-Risiko pro Session: Logit inkrementell fortschreiben.
+
+Für StandardScaler + LogisticRegression gilt
+
+    logit = intercept + Σ coef_i · (x_i − mean_i) / scale_i = b + Σ w_i · x_i
+
+mit w_i = coef_i / scale_i. Ändert sich ein Merkmal um Δ, verschiebt sich der
+Logit um w_i · Δ; der Rest der Eingabe muss nicht neu ausgewertet werden.
+Beim BMI (aus Gewicht und Größe abgeleitet) ändern sich mit dem Gewicht zwei
+Merkmale, mit der Größe nur der BMI.
+
+Durch das wiederholte Aufaddieren sammeln sich Rundungsfehler; ``recompute``
+rechnet den Logit einmal vollständig und meldet die Abweichung.
+"""
+
+import math
+
+import numpy as np
+
+from risk_model import NumpyRiskModel, expected_features, predict_risk
+
+
+def linear_weights(model):
+    """(Gewichte w im Rohwertraum, Achsenabschnitt b) oder None, wenn das Modell nicht linear ist."""
+    if isinstance(model, NumpyRiskModel):
+        mean, scale, coef, intercept = model.mean, model.scale, model.coef, model.intercept
+    else:
+        # scikit-learn-Pipeline (Fallback ohne JSON-Artefakt)
+        from sklearn.linear_model import LogisticRegression
+
+        steps = getattr(model, "named_steps", {})
+        scaler, lr = steps.get("scaler"), steps.get("model")
+        if not isinstance(lr, LogisticRegression) or not hasattr(scaler, "scale_"):
+            return None
+        mean, scale = scaler.mean_, scaler.scale_
+        coef, intercept = lr.coef_.ravel(), float(lr.intercept_[0])
+
+    weights = np.asarray(coef, dtype=np.float64) / np.asarray(scale, dtype=np.float64)
+    return weights, float(intercept - weights @ np.asarray(mean, dtype=np.float64))
+
+
+def _sigmoid(z):
+    return 1.0 / (1.0 + math.exp(-z))
+
+
+class LiveRisk:
+    """Aktueller Logit einer Session, per Merkmals-Delta fortgeschrieben."""
+
+    def __init__(self, model, record):
+        parts = linear_weights(model)
+        if parts is None:
+            raise ValueError("Live-Berechnung nur für lineare Modelle (LogisticRegression)")
+
+        self.model = model
+        self.weights, self.offset = parts
+        self.index = {f: i for i, f in enumerate(expected_features)}
+        self.values = np.array([record[f] for f in expected_features], dtype=np.float64)
+        self.logit = self.offset + float(self.weights @ self.values)
+        self.updates = 0        # Deltas seit der letzten vollständigen Berechnung
+
+    @property
+    def probability(self):
+        return _sigmoid(self.logit)
+
+    def set(self, feature, value):
+        """Ein Merkmal setzen: O(1), nur der Beitrag dieses Merkmals ändert sich."""
+        i = self.index[feature]
+        delta = float(value) - self.values[i]
+        if delta == 0.0:
+            return False
+        self.logit += self.weights[i] * delta
+        self.values[i] = float(value)
+        self.updates += 1
+        return True
+
+    def update(self, record):
+        """Alle geänderten Merkmale aus ``record`` übernehmen; gibt deren Namen zurück."""
+        return [f for f in expected_features if self.set(f, record[f])]
+
+    def recompute(self):
+        """Logit vollständig neu berechnen und die Abweichung zum fortgeschriebenen Wert melden."""
+        full = self.offset + float(self.weights @ self.values)
+        drift = {
+            "updates": self.updates,
+            "logit_drift": abs(self.logit - full),
+            # Gegenprobe mit der Vorhersage des Modells selbst (skalierte Form)
+            "prob_diff": abs(_sigmoid(self.logit) - float(predict_risk(self.model, self.values)[0])),
+        }
+        self.logit = full
+        self.updates = 0
+        return drift
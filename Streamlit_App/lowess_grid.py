@@ -0,0 +1,178 @@
+"""Vorberechnete LOWESS-Trendlinien für die Scatterplots im Bereich Zusammenhang.
+
+Für jedes Geschlecht, jede Krebsart, jeden Risikofaktor und jede Stufe des
+Glättungs-Sliders wird die LOWESS-Kurve einmal berechnet (parallel in einem
+Prozesspool) und als NaN-aufgefüllte Arrays unter ``Data/store`` abgelegt:
+
+    X[krebs, rf, punkt]           sortierte x-Werte (Risikofaktor)
+    Y[krebs, rf, frac, punkt]     geglättete y-Werte (Krebsinzidenz)
+    KENNWERTE[krebs, rf, frac]    Start, Ende, Delta, Delta in %
+
+    python lowess_grid.py         # Gitter bauen (Docker-Build, rki_ingest.py)
+
+Die App lädt das Gitter einmal pro Prozess. Fehlt es oder passt es nicht mehr
+zur Datenversion, wird es beim ersten Zugriff seriell im App-Prozess gebaut:
+kein Prozesspool aus dem Streamlit-Server heraus (fork eines Prozesses mit
+laufenden Tornado-Threads).
+"""
+
+import json
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+
+import numpy as np
+from statsmodels.nonparametric.smoothers_lowess import lowess
+
+from correlation_engine import align_years
+from data_store import STORE_DIR, atomic_write, catalog, data_version
+
+# Stufen des Sliders "Glättung der Trendlinie" (0.1 bis 0.9, Schrittweite 0.1)
+FRACS = np.round(np.arange(1, 10) / 10, 1)
+
+# Geschlecht -> (Krebsdaten, Risikofaktoren) im Datenspeicher
+GRID_SOURCES = {
+    "w": ("krebs_inzidenz_w", "risikofaktoren_w"),
+    "m": ("krebs_inzidenz_m", "risikofaktoren_m"),
+}
+
+GRID_PATH = STORE_DIR / "lowess_grid.npz"
+
+logger = logging.getLogger(__name__)
+
+
+def frac_index(frac):
+    """Position einer Slider-Stellung in FRACS (robust gegen 0.30000000000000004)."""
+    return int(np.abs(FRACS - frac).argmin())
+
+# -------------------------------------------------
+# BERECHNUNG (im Prozesspool)
+# -------------------------------------------------
+
+def _fit_cancer(y, rf_values):
+    """Alle Risikofaktoren × alle fracs für eine Krebsart."""
+    n_rf, n_jahre = rf_values.shape[1], len(y)
+    X = np.full((n_rf, n_jahre), np.nan)
+    Y = np.full((n_rf, len(FRACS), n_jahre), np.nan)
+
+    for j in range(n_rf):
+        x = rf_values[:, j]
+        valid = ~(np.isnan(x) | np.isnan(y))
+        order = np.argsort(x[valid], kind='stable')
+        x_valid, y_valid = x[valid][order], y[valid][order]
+        k = len(x_valid)
+        X[j, :k] = x_valid
+
+        for f, frac in enumerate(FRACS):
+            if k < 2:
+                continue
+            fitted = lowess(y_valid, x_valid, frac=frac, is_sorted=True, return_sorted=False)
+            Y[j, f, :k] = fitted
+
+    return X, Y
+
+
+def _kennwerte(Y):
+    """Start, Ende, Delta und Delta in % jeder Kurve (erster/letzter vorhandener Punkt)."""
+    valid = ~np.isnan(Y)
+    n = valid.sum(axis=-1)
+    first = np.take_along_axis(Y, valid.argmax(axis=-1)[..., None], axis=-1)[..., 0]
+    last = np.take_along_axis(Y, np.maximum(n - 1, 0)[..., None], axis=-1)[..., 0]
+    delta = last - first
+    with np.errstate(divide='ignore', invalid='ignore'):
+        delta_perc = np.where(first != 0, delta / first * 100, np.nan)
+    return np.stack([first, last, delta, delta_perc], axis=-1)
+
+
+def build_grid(workers=None, parallel=True):
+    """Berechnet das komplette Gitter für beide Geschlechter (``parallel=False``: ohne Prozesspool)."""
+    frames = {}
+    for geschlecht, (cancer_name, rf_name) in GRID_SOURCES.items():
+        frames[geschlecht] = align_years(catalog.get(cancer_name), catalog.get(rf_name))
+
+    arrays = {}
+    meta = {"version": repr(grid_version()), "fracs": FRACS.tolist(), "krebsarten": {}, "risikofaktoren": {}}
+
+    with ProcessPoolExecutor(max_workers=workers) if parallel else nullcontext() as pool:
+        mapper = pool.map if parallel else map
+        for geschlecht, (df_cancer, df_rf) in frames.items():
+            rf_values = df_rf.to_numpy(dtype=np.float64)
+            results = list(mapper(_fit_cancer,
+                                    [df_cancer[c].to_numpy(dtype=np.float64) for c in df_cancer.columns],
+                                    [rf_values] * df_cancer.shape[1]))
+
+            Y = np.stack([r[1] for r in results])
+            arrays[f"x_{geschlecht}"] = np.stack([r[0] for r in results])
+            arrays[f"y_{geschlecht}"] = Y
+            arrays[f"kennwerte_{geschlecht}"] = _kennwerte(Y)
+            meta["krebsarten"][geschlecht] = list(df_cancer.columns)
+            meta["risikofaktoren"][geschlecht] = list(df_rf.columns)
+
+    return LowessGrid(arrays, meta)
+
+
+def grid_version():
+    return tuple(data_version(*names) for names in GRID_SOURCES.values())
+
+# -------------------------------------------------
+# ZUGRIFF
+# -------------------------------------------------
+
+class LowessGrid:
+    """Nachschlagen von Kurven und Kennwerten, ohne zur Laufzeit zu fitten."""
+
+    def __init__(self, arrays, meta):
+        self.arrays = arrays
+        self.meta = meta
+        self._krebs = {g: {c: i for i, c in enumerate(cols)} for g, cols in meta["krebsarten"].items()}
+        self._rf = {g: {c: i for i, c in enumerate(cols)} for g, cols in meta["risikofaktoren"].items()}
+
+    def _position(self, geschlecht, krebs, rf):
+        return self._krebs[geschlecht][krebs], self._rf[geschlecht][rf]
+
+    def curve(self, geschlecht, krebs, rf, frac):
+        """(x, y) der LOWESS-Kurve, nach x sortiert."""
+        i, j = self._position(geschlecht, krebs, rf)
+        x = self.arrays[f"x_{geschlecht}"][i, j]
+        k = int((~np.isnan(x)).sum())
+        return x[:k], self.arrays[f"y_{geschlecht}"][i, j, frac_index(frac), :k]
+
+    def kennwerte(self, geschlecht, krebs, rf, frac):
+        """(Startwert, Endwert, Delta, Delta in %)."""
+        i, j = self._position(geschlecht, krebs, rf)
+        return tuple(self.arrays[f"kennwerte_{geschlecht}"][i, j, frac_index(frac)])
+
+    def save(self, path=GRID_PATH):
+        with atomic_write(path) as f:
+            np.savez_compressed(f, meta=np.array(json.dumps(self.meta)), **self.arrays)
+        return path
+
+    @classmethod
+    def load(cls, path=GRID_PATH):
+        with np.load(path) as data:
+            meta = json.loads(str(data["meta"]))
+            arrays = {k: data[k] for k in data.files if k != "meta"}
+        return cls(arrays, meta)
+
+
+def load_grid(path=GRID_PATH, parallel=False):
+    """Gespeichertes Gitter, falls es zur aktuellen Datenversion passt, sonst neu bauen."""
+    if path.exists():
+        grid = LowessGrid.load(path)
+        if grid.meta["version"] == repr(grid_version()):
+            return grid
+
+    logger.warning("LOWESS-Gitter fehlt oder ist veraltet, wird neu gebaut (vorab: python lowess_grid.py)")
+    grid = build_grid(parallel=parallel)
+    grid.save(path)
+    return grid
+
+
+if __name__ == "__main__":
+    import time
+
+    start = time.perf_counter()
+    grid = build_grid()
+    path = grid.save()
+    n_kurven = sum(grid.arrays[f"y_{g}"].shape[0] * grid.arrays[f"y_{g}"].shape[1] for g in GRID_SOURCES) * len(FRACS)
+    print(f"{n_kurven} LOWESS-Kurven in {time.perf_counter() - start:.1f} s -> {path} ({path.stat().st_size / 1024:.0f} KB)")
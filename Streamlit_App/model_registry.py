@@ -0,0 +1,124 @@
+"""Prozessweite Modell-Registry.
+
+Streamlit führt die Seiten bei jeder Widget-Interaktion neu aus, Module
+werden aber nur einmal pro Prozess importiert. Die Registry hält daher
+jedes Modell genau einmal im Speicher und teilt es über alle Sessions.
+Ändert sich die Datei auf der Festplatte (mtime/Größe und sha256), wird
+das Modell neu geladen und der Eintrag in einem Schritt ausgetauscht.
+Ohne Pfad gilt ``risk_model.default_model_path``: das JSON-Artefakt, solange es
+aus der aktuellen risk_model_lvl2.pkl stammt, sonst wird es neu exportiert.
+Schlägt das Neuladen fehl, bleibt das alte Modell aktiv und der Stand der
+fehlerhaften Datei wird vermerkt, sodass sie erst nach der nächsten Änderung
+erneut gehasht und geladen wird.
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from dataclasses import dataclass, replace
+from pathlib import Path
+
+from risk_model import default_model_path, load_risk_model
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class _Entry:
+    model: object
+    sha256: str
+    mtime_ns: int
+    size: int
+    load_seconds: float
+    loaded_at: float
+    failed: tuple = None     # (sha256, mtime_ns, size) der zuletzt nicht ladbaren Datei
+
+
+def _file_sha256(path):
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+class ModelRegistry:
+
+    def __init__(self, loader=load_risk_model):
+        self._loader = loader
+        self._lock = threading.Lock()
+        self._entries = {}
+        self.hits = 0
+        self.misses = 0
+        self.reloads = 0
+        self.errors = 0
+
+    def get(self, path=None):
+        """Gibt das Modell für ``path`` zurück und lädt es nur bei Bedarf."""
+        path = Path(path or default_model_path()).resolve()
+        stat = path.stat()
+
+        with self._lock:
+            entry = self._entries.get(path)
+
+            if entry is not None and (entry.mtime_ns, entry.size) == (stat.st_mtime_ns, stat.st_size):
+                self.hits += 1
+                return entry.model
+
+            if entry is not None and entry.failed is not None and entry.failed[1:] == (stat.st_mtime_ns, stat.st_size):
+                # Datei seit dem fehlgeschlagenen Laden unverändert: nicht erneut versuchen
+                self.hits += 1
+                return entry.model
+
+            sha256 = _file_sha256(path)
+            if entry is not None and entry.sha256 == sha256:
+                # nur der Zeitstempel hat sich geändert (z.B. touch, erneutes Kopieren)
+                self._entries[path] = _Entry(entry.model, sha256, stat.st_mtime_ns, stat.st_size,
+                                             entry.load_seconds, entry.loaded_at)
+                self.hits += 1
+                return entry.model
+            if entry is not None and entry.failed is not None and entry.failed[0] == sha256:
+                self._entries[path] = replace(entry, failed=(sha256, stat.st_mtime_ns, stat.st_size))
+                self.hits += 1
+                return entry.model
+
+            start = time.perf_counter()
+            try:
+                model = self._loader(path)
+            except Exception:
+                self.errors += 1
+                if entry is None:
+                    raise
+                # z.B. halb geschriebene Datei während eines Deployments: altes Modell weiter nutzen
+                logger.exception("Neuladen von %s fehlgeschlagen, altes Modell bleibt aktiv", path)
+                self._entries[path] = replace(entry, failed=(sha256, stat.st_mtime_ns, stat.st_size))
+                return entry.model
+
+            self._entries[path] = _Entry(model, sha256, stat.st_mtime_ns, stat.st_size,
+                                         time.perf_counter() - start, time.time())
+            self.misses += 1
+            if entry is not None:
+                self.reloads += 1
+                logger.info("Modell %s neu geladen (sha256 %s)", path.name, sha256[:12])
+            return model
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "reloads": self.reloads,
+                "errors": self.errors,
+                "hit_rate": self.hits / total if total else 0.0,
+                "models": {
+                    str(path): {
+                        "sha256": entry.sha256,
+                        "load_seconds": entry.load_seconds,
+                        "loaded_at": entry.loaded_at,
+                        "failed_sha256": entry.failed[0] if entry.failed else None,
+                    }
+                    for path, entry in self._entries.items()
+                },
+            }
+
+
+# eine Instanz pro Prozess, von allen Sessions geteilt
+registry = ModelRegistry()
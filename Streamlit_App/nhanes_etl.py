@@ -0,0 +1,180 @@
+"""ETL: nhanes_clean.csv aus den NHANES-Rohdateien (SAS-Transportformat, .xpt).
+
+Die Daten stammen aus dem Zyklus August 2021 – August 2023 (Dateiendung
+``_L``, SEQN 130378 bis 142310). Jede Komponente (Demografie, Fragebögen,
+Untersuchung, Labor, Ernährung) wird in einem eigenen Prozess blockweise
+gelesen, auf die benötigten Variablen reduziert und auf die deutschen
+Spaltennamen umbenannt. Danach werden alle Komponenten über ``SEQN``
+zusammengeführt (nur Erwachsene mit vollständigen Angaben, ``Krebstyp`` nur
+bei Krebsdiagnose) und die bereinigte Datei geschrieben.
+
+    python nhanes_etl.py Rohdaten/                     # erwartet DEMO_L.xpt, MCQ_L.xpt, ...
+    python nhanes_etl.py Rohdaten/ --cycle L --workers 4
+
+Antwortcodes wie 7/9 ("verweigert"/"weiß nicht") bleiben wie in der
+bisherigen Datei erhalten. Danach wird der Datenspeicher (Arrow, typisiert)
+neu erzeugt, siehe data_store.py.
+"""
+
+import argparse
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+
+from data_store import SOURCES, convert
+
+OUTPUT_PATH = SOURCES["nhanes"][0]
+CHUNKSIZE = 10_000
+MIN_AGE = 20
+
+# nur bei Krebsdiagnose erfragt, darf daher fehlen
+OPTIONAL_COLUMNS = ["Krebstyp"]
+
+# -------------------------------------------------
+# VARIABLEN JE KOMPONENTE
+# -------------------------------------------------
+
+# Spalte in nhanes_clean.csv -> (Komponente, NHANES-Variable), in der Reihenfolge der Datei
+CLEAN_COLUMNS = {
+    "SEQN": ("DEMO", "SEQN"),
+    "Alter": ("DEMO", "RIDAGEYR"),
+    "Geschlecht": ("DEMO", "RIAGENDR"),
+    "Ethnie": ("DEMO", "RIDRETH1"),
+    "Höchster Bildungsabschluss": ("DEMO", "DMDEDUC2"),
+    "Familienstand": ("DEMO", "DMDMARTZ"),
+    "Verhältnis zwischen Familieneinkommen und Armut": ("DEMO", "INDFMPIR"),
+    "Geburtsland": ("DEMO", "DMDBORN4"),
+    "Lebenszeitprävalenz": ("MCQ", "MCQ220"),
+    "Krebstyp": ("MCQ", "MCQ230A"),
+    "Asthma": ("MCQ", "MCQ010"),
+    "Heuschnupfen": ("AGQ", "AGQ030"),
+    "COPD": ("MCQ", "MCQ160P"),
+    "Athritis": ("MCQ", "MCQ160A"),
+    "Herzinfarkt": ("MCQ", "MCQ160E"),
+    "Schlaganfall": ("MCQ", "MCQ160F"),
+    "Gallensteine": ("MCQ", "MCQ550"),
+    "Schilddrüsenprobleme": ("MCQ", "MCQ160M"),
+    "mind. 100 Zigaretten geraucht": ("SMQ", "SMQ020"),
+    "mind. einmal Alkohol getrunken": ("ALQ", "ALQ111"),
+    "wie oft wird Alkohol getrunken?": ("ALQ", "ALQ121"),
+    "Gibt es Zeiträume in denen sie täglich getrunken haben?": ("ALQ", "ALQ151"),
+    "Bewertung der Mundgesundheit": ("OHQ", "OHQ845"),
+    "Anzahl der Beschwerden im letzten Jahr": ("OHQ", "OHQ620"),
+    "Benutzt Sonnencreme": ("DEQ", "DEQ034D"),
+    "BMI": ("BMX", "BMXBMI"),
+    "Hüftumfang (cm)": ("BMX", "BMXHIP"),
+    "Gewicht (kg)": ("BMX", "BMXWT"),
+    "pulse": ("BPXO", "BPXOPLS1"),
+    "sys_bp": ("BPXO", "BPXOSY1"),
+    "dia_bp": ("BPXO", "BPXODI1"),
+    "Blood cadmium (ug/L)": ("PBCD", "LBXBCD"),
+    "Blood lead (ug/dL) (Blei)": ("PBCD", "LBXBPB"),
+    "Blood mercury, total(ug/L) (Quecksilber)": ("PBCD", "LBXTHG"),
+    "Blood selenium(ug/L)": ("PBCD", "LBXBSE"),
+    "Blood manganese (ug/L)": ("PBCD", "LBXBMN"),
+    "25-hydroxyvitamin D2 +D3 nmol/L)": ("VID", "LBXVIDMS"),
+    "Energy (kcal)": ("DR1TOT", "DR1TKCAL"),
+    "Total sugars (gm)": ("DR1TOT", "DR1TSUGR"),
+    "Total fat (gm)": ("DR1TOT", "DR1TTFAT"),
+    "Dietary fiber (gm)": ("DR1TOT", "DR1TFIBE"),
+    "Protein (gm)": ("DR1TOT", "DR1TPROT"),
+    "Cholesterol (mg)": ("DR1TOT", "DR1TCHOL"),
+    "Häufigkeit moderate körperliche Aktivitäten in Freizeit": ("PAQ", "PAD790Q"),
+    "Dauer der moderaten Aktivitäten": ("PAQ", "PAD800"),
+    "Häufigkeit körperl. anstrengender Aktivitäten": ("PAQ", "PAD810Q"),
+    "Sitzzeit pro Tag": ("PAQ", "PAD680"),
+    "Depressive Symptome": ("DPQ", "DPQ020"),
+    "Trouble sleeping or sleeping too much": ("DPQ", "DPQ030"),
+    "Schalfstunden unter der Woche": ("SLQ", "SLD012"),
+    "Schalfstunden am Wochenende": ("SLQ", "SLD013"),
+    "Entzündungsmarker im Blut": ("HSCRP", "LBXHSCRP"),
+}
+
+
+def components():
+    """Komponente -> {NHANES-Variable: deutscher Spaltenname} (ohne SEQN)."""
+    result = {}
+    for label, (component, variable) in CLEAN_COLUMNS.items():
+        if variable != "SEQN":
+            result.setdefault(component, {})[variable] = label
+    return result
+
+
+def component_path(raw_dir, component, cycle):
+    return Path(raw_dir) / f"{component}_{cycle}.xpt"
+
+# -------------------------------------------------
+# EINLESEN (pro Komponente in einem eigenen Prozess)
+# -------------------------------------------------
+
+def read_component(path, columns, chunksize=CHUNKSIZE):
+    """Liest eine XPT-Datei blockweise und behält nur SEQN und ``columns`` (umbenannt)."""
+    parts = []
+    with pd.read_sas(path, format="xport", chunksize=chunksize) as reader:
+        for chunk in reader:
+            missing = [c for c in ["SEQN", *columns] if c not in chunk.columns]
+            if missing:
+                raise ValueError(f"{Path(path).name}: Variablen fehlen: {missing}")
+            parts.append(chunk[["SEQN", *columns]].rename(columns=columns))
+
+    df = pd.concat(parts, ignore_index=True)
+    df["SEQN"] = df["SEQN"].astype("int64")
+    # pro Person genau eine Zeile (z.B. Ernährungs-Tag 1)
+    return df.drop_duplicates("SEQN").set_index("SEQN")
+
+
+def build_clean(raw_dir, cycle="L", workers=None, chunksize=CHUNKSIZE):
+    """Liest alle Komponenten parallel und führt sie über SEQN zusammen."""
+    jobs = components()
+    paths = {c: component_path(raw_dir, c, cycle) for c in jobs}
+    missing = [p.name for p in paths.values() if not p.exists()]
+    if missing:
+        raise FileNotFoundError(f"Rohdateien fehlen in {raw_dir}: {missing}")
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {c: pool.submit(read_component, paths[c], jobs[c], chunksize) for c in jobs}
+        frames = {c: f.result() for c, f in futures.items()}
+
+    # Demografie als Basis, dann alle übrigen Komponenten (nur Personen, die überall vorkommen)
+    df = frames.pop("DEMO")
+    df = df[df["Alter"] >= MIN_AGE]
+    for frame in frames.values():
+        df = df.join(frame, how="inner")
+
+    df = df.reset_index()[list(CLEAN_COLUMNS)]
+    required = [c for c in CLEAN_COLUMNS if c not in OPTIONAL_COLUMNS]
+    return df.dropna(subset=required).sort_values("SEQN").reset_index(drop=True)
+
+
+def write_clean(df, output=OUTPUT_PATH):
+    output = Path(output)
+    tmp = output.with_suffix(".tmp")
+    df.to_csv(tmp, index=False)
+    tmp.replace(output)
+
+    # typisierten Arrow-Datensatz der App neu erzeugen
+    if output.resolve() == OUTPUT_PATH.resolve():
+        convert("nhanes")
+    return output
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("raw_dir", type=Path, help="Verzeichnis mit den .xpt-Dateien")
+    parser.add_argument("--cycle", default="L", help="Dateiendung des NHANES-Zyklus (L = 2021–2023)")
+    parser.add_argument("--output", type=Path, default=OUTPUT_PATH)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunksize", type=int, default=CHUNKSIZE)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    df = build_clean(args.raw_dir, args.cycle, args.workers, args.chunksize)
+    path = write_clean(df, args.output)
+    print(f"{len(df)} Personen, {df.shape[1]} Spalten aus {len(components())} Komponenten"
+          f" in {time.perf_counter() - start:.1f} s -> {path}")
+
+
+if __name__ == "__main__":
+    main()
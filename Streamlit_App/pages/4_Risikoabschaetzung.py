@@ -1,6 +1,6 @@
 import streamlit as st
-import joblib
-import pandas as pd
+
+import perf
 
 
 
@@ -10,6 +10,9 @@ import pandas as pd
 
 st.set_page_config(page_title="Risikoeinschätzung", layout="wide")
 
+# Zeitmessung je Abschnitt (Panel/Metriken per PERF_PANEL / PERF_METRICS_FILE, siehe perf.py)
+perf_run = perf.start_run('risiko')
+
 st.markdown("""
 <style>
 
@@ -47,55 +50,25 @@ Die Einschätzung basiert auf statistischen Modellen und ersetzt keine ärztlich
 # LOAD MODEL
 # -------------------------------------------------
 
-from pathlib import Path
-import joblib
-
-BASE_DIR = Path(__file__).resolve().parent.parent
-model_path = BASE_DIR / "models" / "risk_model_lvl2.pkl"
-
-model = joblib.load(model_path)
-
-# -------------------------------------------------
-# FEATURE ORDER
-# -------------------------------------------------
-
-expected_features = [
-    "Alter",
-    "Geschlecht",
-    "Höchster Bildungsabschluss",
-    "Familienstand",
-    "Verhältnis zwischen Familieneinkommen und Armut",
-    "mind. 100 Zigaretten geraucht",
-    "mind. einmal Alkohol getrunken",
-    "wie oft wird Alkohol getrunken?",
-    "Gibt es Zeiträume in denen sie täglich getrunken haben?",
-    "Häufigkeit moderate körperliche Aktivitäten in Freizeit",
-    "Sitzzeit pro Tag",
-    "Trouble sleeping or sleeping too much",
-    "Asthma",
-    "COPD",
-    "Athritis",
-    "Herzinfarkt",
-    "Schlaganfall",
-    "Schilddrüsenprobleme",
-    "BMI",
-    "Depressive Symptome",
-    "Hüftumfang (cm)",
-    "Gewicht (kg)",
-    "pulse",
-    "sys_bp",
-    "dia_bp",
-    "Dauer der moderaten Aktivitäten",
-    "Häufigkeit körperl. anstrengender Aktivitäten",
-    "Schalfstunden unter der Woche",
-    "Schalfstunden am Wochenende",
-    "Energy (kcal)",
-    "Total sugars (gm)",
-    "Total fat (gm)",
-    "Dietary fiber (gm)",
-    "Protein (gm)",
-    "Cholesterol (mg)"
-]
+from bootstrap_ensemble import load_ensemble
+from live_risk import LiveRisk, linear_weights
+from model_registry import registry
+from prediction_cache import prediction_cache
+from reference_scores import load_reference, reference_version
+from risk_model import FEATURE_SCHEMA, GROESSE, expected_features, threshold
+from what_if import WHAT_IF_FEATURES, build_what_if_heatmap, build_what_if_line, risk_grid
+
+# NumPy-Artefakt (models/risk_model_lvl2.json), scikit-learn wird nicht importiert.
+# Die Registry lädt es einmal pro Prozess und erneut nur, wenn sich die Datei ändert.
+with perf.section('modell_laden'):
+    model = registry.get()
+    # Bootstrap-Ensemble für das Unsicherheitsintervall (optional, siehe bootstrap_ensemble.py)
+    ensemble = load_ensemble(model)
+
+# Referenzverteilung (NHANES, einmal bewertet), neu gebaut wenn sich Modell oder Daten ändern
+@st.cache_resource
+def load_reference_scores(version):
+    return load_reference()
 
 # -------------------------------------------------
 # LAYOUT
@@ -112,45 +85,29 @@ with col1:
 
     st.header("Demografie")
 
-    age = st.number_input("Alter", 18, 90, 45)
+    age = st.number_input("Alter", *FEATURE_SCHEMA["Alter"].widget_args())
 
-    geschlecht_map = {"Männlich": 1.0, "Weiblich": 2.0}
+    geschlecht_map = FEATURE_SCHEMA["Geschlecht"].choices
     geschlecht = geschlecht_map[st.selectbox("Geschlecht", list(geschlecht_map.keys()))]
 
-    education_map = {
-        "Hauptschule": 1.0,
-        "Realschule": 2.0,
-        "Abitur": 3.0,
-        "Studium abgebrochen": 4.0,
-        "Universitärer Abschluss": 5.0
-    }
+    education_map = FEATURE_SCHEMA["Höchster Bildungsabschluss"].choices
     education = education_map[st.selectbox("Höchster Bildungsabschluss", list(education_map.keys()))]
 
-    family_map = {
-        "Verheiratet/Lebensgemeinschaft": 1.0,
-        "Geschieden/Getrennt/Verwitwet": 2.0,
-        "Ledig": 3.0
-    }
+    family_map = FEATURE_SCHEMA["Familienstand"].choices
     familienstand = family_map[st.selectbox("Familienstand", list(family_map.keys()))]
 
-    income_map = {
-        "Unter Armutsgrenze": 0.8,
-        "Nahe Armutsgrenze": 1.2,
-        "Mittleres Einkommen": 2.5,
-        "Überdurchschnittliches Einkommen": 4.0,
-        "Hohes Einkommen": 5.0
-    }
+    income_map = FEATURE_SCHEMA["Verhältnis zwischen Familieneinkommen und Armut"].choices
     income_ratio = income_map[st.selectbox("Haushaltseinkommen (Einschätzung)", list(income_map.keys()))]
 
     st.header("Körpermaße")
 
-    gewicht = st.number_input("Gewicht (kg)", 40, 200, 75, step=1)
-    groesse = st.number_input("Körpergröße (cm)", 140, 220, 170, step=1)
+    gewicht = st.number_input("Gewicht (kg)", *FEATURE_SCHEMA["Gewicht (kg)"].widget_args(), step=1)
+    groesse = st.number_input("Körpergröße (cm)", *GROESSE.widget_args(), step=1)
 
     bmi = gewicht / ((groesse / 100) ** 2)
     st.write(f"Berechneter BMI: **{bmi:.1f}**")
 
-    hueftumfang = st.number_input("Hüftumfang (cm)", 60.0, 180.0, 95.0)
+    hueftumfang = st.number_input("Hüftumfang (cm)", *FEATURE_SCHEMA["Hüftumfang (cm)"].widget_args())
 
     st.header("Gesundheitszustand")
 
@@ -172,26 +129,26 @@ with col2:
 
     st.header("Blutdruck & Puls")
 
-    sys_bp = st.number_input("Systolischer Blutdruck (mmHg)", 80.0, 220.0, 120.0)
-    dia_bp = st.number_input("Diastolischer Blutdruck (mmHg)", 40.0, 140.0, 80.0)
-    pulse = st.number_input("Puls", 40.0, 140.0, 70.0)
+    sys_bp = st.number_input("Systolischer Blutdruck (mmHg)", *FEATURE_SCHEMA["sys_bp"].widget_args())
+    dia_bp = st.number_input("Diastolischer Blutdruck (mmHg)", *FEATURE_SCHEMA["dia_bp"].widget_args())
+    pulse = st.number_input("Puls", *FEATURE_SCHEMA["pulse"].widget_args())
 
     st.header("Lebensstil")
 
     raucher = st.checkbox("Mindestens 100 Zigaretten im Leben")
     alkohol = st.checkbox("Alkohol konsumiert")
-    alkohol_freq = st.slider("Alkoholkonsum (0=nie, 10=sehr häufig)", 0, 10, 2)
+    alkohol_freq = st.slider("Alkoholkonsum (0=nie, 10=sehr häufig)", *FEATURE_SCHEMA["wie oft wird Alkohol getrunken?"].widget_args())
     alkohol_daily = st.checkbox("Phasen mit täglichem Alkoholkonsum")
 
-    aktivitaet_mod = st.slider("Moderate Aktivität (Tage/Woche)", 0, 7, 2)
-    aktivitaet_mod_dauer = st.number_input("Dauer moderater Aktivität (Minuten/Tag)", 0, 300, 30)
-    aktivitaet_vig_freq = st.slider("Anstrengende Aktivität (Tage/Woche)", 0, 7, 1)
+    aktivitaet_mod = st.slider("Moderate Aktivität (Tage/Woche)", *FEATURE_SCHEMA["Häufigkeit moderate körperliche Aktivitäten in Freizeit"].widget_args())
+    aktivitaet_mod_dauer = st.number_input("Dauer moderater Aktivität (Minuten/Tag)", *FEATURE_SCHEMA["Dauer der moderaten Aktivitäten"].widget_args())
+    aktivitaet_vig_freq = st.slider("Anstrengende Aktivität (Tage/Woche)", *FEATURE_SCHEMA["Häufigkeit körperl. anstrengender Aktivitäten"].widget_args())
 
-    sitzzeit = st.slider("Sitzzeit pro Tag (Stunden)", 0, 16, 6)
+    sitzzeit = st.slider("Sitzzeit pro Tag (Stunden)", *FEATURE_SCHEMA["Sitzzeit pro Tag"].widget_args())
 
     schlafproblem = st.checkbox("Schlafprobleme")
-    schlaf_woche = st.slider("Schlafstunden unter der Woche", 3, 12, 7)
-    schlaf_wochenende = st.slider("Schlafstunden am Wochenende", 3, 12, 8)
+    schlaf_woche = st.slider("Schlafstunden unter der Woche", *FEATURE_SCHEMA["Schalfstunden unter der Woche"].widget_args())
+    schlaf_wochenende = st.slider("Schlafstunden am Wochenende", *FEATURE_SCHEMA["Schalfstunden am Wochenende"].widget_args())
 
     depression = st.checkbox("Depressive Symptome")
 
@@ -205,19 +162,61 @@ st.markdown("---")
 use_nutrition = st.checkbox("Erweiterte Analyse mit Ernährungsdaten")
 
 if use_nutrition:
-    energy = st.number_input("Energie (kcal)", 500.0, 5000.0, 2000.0)
-    sugar = st.number_input("Zucker (gm)", 0.0, 500.0, 80.0)
-    fat = st.number_input("Fette (gm)", 0.0, 300.0, 70.0)
-    fiber = st.number_input("Ballaststoffe (gm)", 0.0, 80.0, 20.0)
-    protein = st.number_input("Protein (gm)", 0.0, 200.0, 70.0)
-    cholesterol = st.number_input("Cholesterol (mg)", 0.0, 1000.0, 200.0)
+    energy = st.number_input("Energie (kcal)", *FEATURE_SCHEMA["Energy (kcal)"].widget_args())
+    sugar = st.number_input("Zucker (gm)", *FEATURE_SCHEMA["Total sugars (gm)"].widget_args())
+    fat = st.number_input("Fette (gm)", *FEATURE_SCHEMA["Total fat (gm)"].widget_args())
+    fiber = st.number_input("Ballaststoffe (gm)", *FEATURE_SCHEMA["Dietary fiber (gm)"].widget_args())
+    protein = st.number_input("Protein (gm)", *FEATURE_SCHEMA["Protein (gm)"].widget_args())
+    cholesterol = st.number_input("Cholesterol (mg)", *FEATURE_SCHEMA["Cholesterol (mg)"].widget_args())
 else: #sind die Werte nicht eingegeben, werden Durchschnittswerte aus dem Datensatz verwendet
-    energy = 1926.73
-    sugar = 89.9
-    fat = 80.7
-    fiber = 15.41
-    protein = 71.56
-    cholesterol = 276.7
+    energy = FEATURE_SCHEMA["Energy (kcal)"].fallback
+    sugar = FEATURE_SCHEMA["Total sugars (gm)"].fallback
+    fat = FEATURE_SCHEMA["Total fat (gm)"].fallback
+    fiber = FEATURE_SCHEMA["Dietary fiber (gm)"].fallback
+    protein = FEATURE_SCHEMA["Protein (gm)"].fallback
+    cholesterol = FEATURE_SCHEMA["Cholesterol (mg)"].fallback
+
+# -------------------------------------------------
+# EINGABE (Merkmale in Modell-Kodierung)
+# -------------------------------------------------
+
+user_input = {
+    "Alter": age,
+    "Geschlecht": geschlecht,
+    "Höchster Bildungsabschluss": education,
+    "Familienstand": familienstand,
+    "Verhältnis zwischen Familieneinkommen und Armut": income_ratio,
+    "mind. 100 Zigaretten geraucht": int(raucher),
+    "mind. einmal Alkohol getrunken": int(alkohol),
+    "wie oft wird Alkohol getrunken?": alkohol_freq,
+    "Gibt es Zeiträume in denen sie täglich getrunken haben?": int(alkohol_daily),
+    "Häufigkeit moderate körperliche Aktivitäten in Freizeit": aktivitaet_mod,
+    "Sitzzeit pro Tag": sitzzeit,
+    "Trouble sleeping or sleeping too much": int(schlafproblem),
+    "Asthma": int(asthma),
+    "COPD": int(copd),
+    "Athritis": int(arthritis),
+    "Herzinfarkt": int(herzinfarkt),
+    "Schlaganfall": int(schlaganfall),
+    "Schilddrüsenprobleme": int(schilddruese),
+    "BMI": bmi,
+    "Depressive Symptome": int(depression),
+    "Hüftumfang (cm)": hueftumfang,
+    "Gewicht (kg)": gewicht,
+    "pulse": pulse,
+    "sys_bp": sys_bp,
+    "dia_bp": dia_bp,
+    "Dauer der moderaten Aktivitäten": aktivitaet_mod_dauer,
+    "Häufigkeit körperl. anstrengender Aktivitäten": aktivitaet_vig_freq,
+    "Schalfstunden unter der Woche": schlaf_woche,
+    "Schalfstunden am Wochenende": schlaf_wochenende,
+    "Energy (kcal)": energy,
+    "Total sugars (gm)": sugar,
+    "Total fat (gm)": fat,
+    "Dietary fiber (gm)": fiber,
+    "Protein (gm)": protein,
+    "Cholesterol (mg)": cholesterol
+}
 
 # =================================================
 # RESULT COLUMN
@@ -236,6 +235,10 @@ with col3:
     <h3 style="margin-top:0;">Risikobewertung</h3>
     """, unsafe_allow_html=True)
 
+    # Live-Modus: Logit pro Session inkrementell fortschreiben (nur lineare Modelle, siehe live_risk.py)
+    live_modus = st.toggle("Live-Berechnung", disabled=linear_weights(model) is None,
+                           help="Ergebnis bei jeder Eingabe sofort aktualisieren (nur bei linearem Modell)")
+
     result_placeholder = st.empty()
 
     with result_placeholder.container():
@@ -255,54 +258,7 @@ with col3:
 # BUTTON + CALCULATION
 # -------------------------------------------------
 
-if st.button("Risiko berechnen"):
-
-    
-
-    user_input = {
-        "Alter": age,
-        "Geschlecht": geschlecht,
-        "Höchster Bildungsabschluss": education,
-        "Familienstand": familienstand,
-        "Verhältnis zwischen Familieneinkommen und Armut": income_ratio,
-        "mind. 100 Zigaretten geraucht": int(raucher),
-        "mind. einmal Alkohol getrunken": int(alkohol),
-        "wie oft wird Alkohol getrunken?": alkohol_freq,
-        "Gibt es Zeiträume in denen sie täglich getrunken haben?": int(alkohol_daily),
-        "Häufigkeit moderate körperliche Aktivitäten in Freizeit": aktivitaet_mod,
-        "Sitzzeit pro Tag": sitzzeit,
-        "Trouble sleeping or sleeping too much": int(schlafproblem),
-        "Asthma": int(asthma),
-        "COPD": int(copd),
-        "Athritis": int(arthritis),
-        "Herzinfarkt": int(herzinfarkt),
-        "Schlaganfall": int(schlaganfall),
-        "Schilddrüsenprobleme": int(schilddruese),
-        "BMI": bmi,
-        "Depressive Symptome": int(depression),
-        "Hüftumfang (cm)": hueftumfang,
-        "Gewicht (kg)": gewicht,
-        "pulse": pulse,
-        "sys_bp": sys_bp,
-        "dia_bp": dia_bp,
-        "Dauer der moderaten Aktivitäten": aktivitaet_mod_dauer,
-        "Häufigkeit körperl. anstrengender Aktivitäten": aktivitaet_vig_freq,
-        "Schalfstunden unter der Woche": schlaf_woche,
-        "Schalfstunden am Wochenende": schlaf_wochenende,
-        "Energy (kcal)": energy,
-        "Total sugars (gm)": sugar,
-        "Total fat (gm)": fat,
-        "Dietary fiber (gm)": fiber,
-        "Protein (gm)": protein,
-        "Cholesterol (mg)": cholesterol
-        }
-
-    input_df = pd.DataFrame([user_input])
-    input_df = input_df[expected_features]
-
-    prob = model.predict_proba(input_df)[0][1]
-    threshold = 0.40
-
+def show_result(prob, values):
     with result_placeholder.container():
 
         st.markdown(f"""
@@ -310,12 +266,28 @@ if st.button("Risiko berechnen"):
         <div class="big-percentage">{prob*100:.1f} %</div>
         """, unsafe_allow_html=True)
 
+        # ein Matrix-Vektor-Produkt über alle Ensemble-Modelle, kein Refit
+        if ensemble is not None:
+            with perf.section('intervall'):
+                low, high = ensemble.interval(values)
+            st.markdown(f"95 %-Intervall: **{low*100:.1f} – {high*100:.1f} %**",
+                        help=f"Spanne über {len(ensemble)} auf Bootstrap-Stichproben trainierte Modelle "
+                             "(Unsicherheit der Modellschätzung)")
+
         if prob >= threshold:
             st.error("Erhöhtes Risiko")
             st.warning("Bitte ärztliche Beratung in Betracht ziehen.")
         else:
             st.success("Niedriges Risiko")
 
+        with perf.section('referenz'):
+            reference = load_reference_scores(reference_version())
+            vergleich = reference.percentiles(prob, age, geschlecht)
+
+        st.markdown("**Vergleich mit der NHANES-Stichprobe**")
+        for label, perzentil, anzahl in vergleich:
+            st.markdown(f"Höher als bei {perzentil:.0f} % ({label}, n = {anzahl})")
+
 
         st.markdown(
         "Dieses Modell dient ausschließlich zu Demonstrationszwecken "
@@ -323,4 +295,89 @@ if st.button("Risiko berechnen"):
         , unsafe_allow_html=True
         )
 
-        
\ No newline at end of file
+
+berechnen = st.button("Risiko berechnen")
+
+if berechnen:
+
+    with perf.section('eingabe'):
+        input_values = [user_input[f] for f in expected_features]
+
+    # prozessweiter LRU-Cache: gleiche Eingaben (auf Widget-Auflösung) werden nur einmal gerechnet
+    with perf.section('inferenz'):
+        prob = prediction_cache.predict(model, input_values)
+
+    # für die What-if-Analyse über weitere Reruns hinweg merken
+    st.session_state["risiko_eingabe"] = {"werte": user_input, "groesse": groesse}
+
+    show_result(prob, input_values)
+
+# -------------------------------------------------
+# LIVE-BERECHNUNG
+# -------------------------------------------------
+
+if live_modus:
+    with col3:
+        neu_berechnen = st.button("Vollständig neu berechnen", help="Logit komplett neu rechnen und die Abweichung anzeigen")
+
+    with perf.section('live'):
+        live = st.session_state.get("live_risiko")
+        if live is None or live.model is not model:
+            # erster Live-Lauf der Session oder neues Modell: einmal vollständig rechnen
+            live = st.session_state["live_risiko"] = LiveRisk(model, user_input)
+            geaendert = None
+        else:
+            # nur die geänderten Merkmale verschieben den Logit (Gewicht: auch BMI)
+            geaendert = live.update(user_input)
+
+        drift = live.recompute() if neu_berechnen else None
+
+    st.session_state["risiko_eingabe"] = {"werte": user_input, "groesse": groesse}
+    if not berechnen:
+        show_result(live.probability, live.values)
+
+    with col3:
+        if drift is not None:
+            st.caption(f"Vollständig neu berechnet nach {drift['updates']} Änderungen: "
+                       f"Abweichung Logit {drift['logit_drift']:.1e}, Wahrscheinlichkeit {drift['prob_diff']:.1e}")
+        elif geaendert is None:
+            st.caption("Live: vollständig berechnet")
+        else:
+            st.caption(f"Live: {len(geaendert)} Merkmal(e) geändert, "
+                       f"{live.updates} Änderungen seit der letzten vollständigen Berechnung")
+
+# -------------------------------------------------
+# WHAT-IF-ANALYSE
+# -------------------------------------------------
+
+if "risiko_eingabe" in st.session_state:
+    st.markdown("---")
+    st.header("Was wäre, wenn ...?")
+    st.markdown("Ein oder zwei Merkmale der zuletzt berechneten Eingabe variieren, alle anderen bleiben gleich.")
+
+    eingabe = st.session_state["risiko_eingabe"]
+    achsen = list(WHAT_IF_FEATURES.keys())
+
+    wi_col1, wi_col2 = st.columns(2)
+    x_label = wi_col1.selectbox("Merkmal 1", achsen)
+    y_label = wi_col2.selectbox("Merkmal 2 (optional)", ["–"] + [a for a in achsen if a != x_label])
+
+    x_feature = WHAT_IF_FEATURES[x_label]
+    y_feature = WHAT_IF_FEATURES.get(y_label)
+
+    # gesamtes Raster in einem einzigen predict-Aufruf
+    with perf.section('what_if'):
+        xs, ys, probs = risk_grid(model, eingabe["werte"], eingabe["groesse"], x_feature, y_feature)
+
+    if y_feature is None:
+        fig = build_what_if_line(xs, probs, x_label, current=eingabe["werte"][x_feature], threshold=threshold)
+    else:
+        fig = build_what_if_heatmap(xs, ys, probs, x_label, y_label,
+                                    current=(eingabe["werte"][x_feature], eingabe["werte"][y_feature]))
+    st.plotly_chart(fig, use_container_width=True)
+
+if perf.panel_enabled():
+    with st.sidebar.expander("Vorhersage-Cache"):
+        st.json(prediction_cache.stats())
+
+perf.finish_run(perf_run)
@@ -0,0 +1,275 @@
+"""Leichte Zeitmessung pro Abschnitt eines Skriptlaufs.
+
+    run = perf.start_run('krebs')
+    with perf.section('daten'):
+        df = catalog.get(...)
+    ...
+    perf.finish_run(run)
+
+Abschnitte in einem ``st.fragment`` laufen in ``perf.fragment_run(name)``:
+im vollen Skriptlauf zählen sie zum Lauf der Seite, ein Fragment-Rerun wird
+als eigener Lauf ``name`` erfasst.
+
+Jeder Abschnitt wird pro Prozess in ein Prometheus-Histogramm (kumulativ)
+und in ein rollierendes Zeitfenster (Quantile der letzten 15 Minuten)
+eingetragen. Panel und Export zeigen außerdem die Statistik des
+Abbildungs-Caches (figure_cache.py). Gesteuert über Umgebungsvariablen (wie ``DOCKER_ENV``):
+
+    PERF_PANEL=TRUE                      Sidebar-Panel mit den Zeiten des aktuellen Laufs
+    PERF_METRICS_FILE=/pfad/perf.prom    Metriken im Prometheus-Textformat (z.B. für den
+                                         textfile-Collector des node_exporters)
+"""
+
+import bisect
+import functools
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+# Bucket-Grenzen in ms
+BUCKETS = (1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+WINDOW_SECONDS = 15 * 60
+WINDOW_MAX_SAMPLES = 2000
+QUANTILES = (0.5, 0.9, 0.99)
+EXPORT_INTERVAL_SECONDS = 5
+
+
+def _flag(name):
+    return os.environ.get(name, "").strip().upper() in ("1", "TRUE", "YES", "JA")
+
+
+def panel_enabled():
+    return _flag("PERF_PANEL")
+
+
+def metrics_file():
+    return os.environ.get("PERF_METRICS_FILE") or None
+
+# -------------------------------------------------
+# HISTOGRAMME (pro Prozess)
+# -------------------------------------------------
+
+class _Series:
+    """Kumulatives Histogramm + rollierendes Fenster für einen Abschnitt."""
+
+    def __init__(self):
+        self.buckets = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.sum_ms = 0.0
+        self.window = deque(maxlen=WINDOW_MAX_SAMPLES)
+
+    def add(self, ms, now):
+        self.buckets[bisect.bisect_left(BUCKETS, ms)] += 1
+        self.count += 1
+        self.sum_ms += ms
+        self.window.append((now, ms))
+
+    def recent(self, now):
+        while self.window and self.window[0][0] < now - WINDOW_SECONDS:
+            self.window.popleft()
+        return sorted(ms for _, ms in self.window)
+
+
+def _quantile(values, q):
+    if not values:
+        return float("nan")
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+class PerfRecorder:
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._series = {}
+        self._last_export = 0.0
+
+    def record(self, page, section, ms):
+        now = time.time()
+        with self._lock:
+            self._series.setdefault((page, section), _Series()).add(ms, now)
+
+    def summary(self):
+        """{(seite, abschnitt): {count, p50, p90, p99}} über das rollierende Fenster."""
+        now = time.time()
+        with self._lock:
+            report = {}
+            for key, series in self._series.items():
+                recent = series.recent(now)
+                report[key] = {"count": len(recent), **{f"p{int(q * 100)}": _quantile(recent, q) for q in QUANTILES}}
+            return report
+
+    def prometheus_text(self):
+        now = time.time()
+        lines = [
+            "# HELP app_section_latency_ms Laufzeit je Abschnitt eines Skriptlaufs in ms.",
+            "# TYPE app_section_latency_ms histogram",
+        ]
+        window = [
+            f"# HELP app_section_latency_window_ms Quantile der letzten {WINDOW_SECONDS // 60} Minuten in ms.",
+            "# TYPE app_section_latency_window_ms gauge",
+        ]
+
+        with self._lock:
+            for (page, section), series in sorted(self._series.items()):
+                labels = f'page="{page}",section="{section}"'
+                cumulative = 0
+                for bound, n in zip(BUCKETS, series.buckets):
+                    cumulative += n
+                    lines.append(f'app_section_latency_ms_bucket{{{labels},le="{bound}"}} {cumulative}')
+                lines.append(f'app_section_latency_ms_bucket{{{labels},le="+Inf"}} {series.count}')
+                lines.append(f"app_section_latency_ms_sum{{{labels}}} {series.sum_ms:.3f}")
+                lines.append(f"app_section_latency_ms_count{{{labels}}} {series.count}")
+
+                recent = series.recent(now)
+                for q in QUANTILES:
+                    window.append(f'app_section_latency_window_ms{{{labels},quantile="{q}"}} {_quantile(recent, q):.3f}')
+
+        return "\n".join(lines + window + _figure_cache_metrics()) + "\n"
+
+    def export(self, path, force=False):
+        """Schreibt die Metriken atomar nach ``path`` (höchstens alle EXPORT_INTERVAL_SECONDS)."""
+        now = time.time()
+        if not force and now - self._last_export < EXPORT_INTERVAL_SECONDS:
+            return False
+        self._last_export = now
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            f.write(self.prometheus_text())
+        os.replace(tmp, path)
+        return True
+
+
+def _figure_cache_metrics():
+    from figure_cache import figure_cache
+
+    stats = figure_cache.stats()
+    if not stats:
+        return []
+    lines = [
+        "# HELP app_figure_cache_requests_total Abrufe je Abbildung aus dem Abbildungs-Cache.",
+        "# TYPE app_figure_cache_requests_total counter",
+    ]
+    build = [
+        "# HELP app_figure_cache_build_seconds_total Bauzeit je Abbildung (alle Neubauten) in s.",
+        "# TYPE app_figure_cache_build_seconds_total counter",
+    ]
+    for name, s in sorted(stats.items()):
+        lines.append(f'app_figure_cache_requests_total{{figure="{name}",result="hit"}} {s["hits"]}')
+        lines.append(f'app_figure_cache_requests_total{{figure="{name}",result="miss"}} {s["misses"]}')
+        build.append(f'app_figure_cache_build_seconds_total{{figure="{name}"}} {s["build_seconds_total"]:.6f}')
+    return lines + build
+
+
+# eine Instanz pro Prozess, von allen Sessions geteilt
+recorder = PerfRecorder()
+
+# -------------------------------------------------
+# MESSUNG EINES SKRIPTLAUFS
+# -------------------------------------------------
+
+# jede Streamlit-Session läuft in einem eigenen Thread
+_local = threading.local()
+
+
+class Run:
+
+    def __init__(self, page):
+        self.page = page
+        self.start = time.perf_counter()
+        self.sections = {}
+
+    def add(self, section, ms):
+        self.sections[section] = self.sections.get(section, 0.0) + ms
+
+
+def start_run(page):
+    _local.run = Run(page)
+    return _local.run
+
+
+@contextmanager
+def section(name):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        ms = (time.perf_counter() - start) * 1e3
+        run = getattr(_local, "run", None)
+        if run is not None:
+            run.add(name, ms)
+
+
+def timed(name):
+    """Dekorator: jeder Aufruf der Funktion zählt zum Abschnitt ``name``."""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with section(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+@contextmanager
+def fragment_run(page):
+    """Fragment-Rerun als eigenen Lauf erfassen (im vollen Skriptlauf nichts extra)."""
+    if getattr(_local, "run", None) is not None:
+        yield
+        return
+
+    run = start_run(page)
+    try:
+        yield
+    finally:
+        # die Sidebar ist aus einem Fragment heraus nicht beschreibbar
+        finish_run(run, panel=False)
+
+
+def finish_run(run, panel=True):
+    """Abschnitte (je Lauf summiert) und Gesamtzeit erfassen, exportieren, ggf. Panel zeigen."""
+    total = (time.perf_counter() - run.start) * 1e3
+    for name, ms in run.sections.items():
+        recorder.record(run.page, name, ms)
+    recorder.record(run.page, "gesamt", total)
+    _local.run = None
+
+    path = metrics_file()
+    if path:
+        recorder.export(path)
+
+    if panel and panel_enabled():
+        render_panel(run, total)
+
+
+def render_panel(run, total):
+    import pandas as pd
+    import streamlit as st
+
+    summary = recorder.summary()
+    rows = [
+        {"Abschnitt": name, "dieser Lauf (ms)": ms,
+         **{k: summary.get((run.page, name), {}).get(k) for k in ("p50", "p90", "p99")}}
+        for name, ms in sorted(run.sections.items(), key=lambda item: -item[1])
+    ]
+    rows.append({"Abschnitt": "gesamt", "dieser Lauf (ms)": total,
+                 **{k: summary.get((run.page, "gesamt"), {}).get(k) for k in ("p50", "p90", "p99")}})
+
+    with st.sidebar.expander("Performance", expanded=True):
+        st.caption(f"Seite '{run.page}', Quantile der letzten {WINDOW_SECONDS // 60} Minuten (alle Sessions)")
+        st.dataframe(pd.DataFrame(rows).set_index("Abschnitt").round(1), use_container_width=True)
+
+    from figure_cache import figure_cache
+
+    stats = figure_cache.stats()
+    if stats:
+        with st.sidebar.expander("Abbildungs-Cache"):
+            st.caption("Treffer und Bauzeiten je Abbildung (dieser Prozess, alle Sessions)")
+            st.dataframe(pd.DataFrame([
+                {"Abbildung": name, "Treffer": s["hits"], "gebaut": s["misses"],
+                 "Trefferquote (%)": s["hit_rate"] * 100, "letzter Bau (ms)": s["build_seconds"] * 1e3}
+                for name, s in sorted(stats.items())
+            ]).set_index("Abbildung").round(1), use_container_width=True)
@@ -0,0 +1,97 @@
+"""Prozessweiter LRU-Cache vor dem Risikomodell.
+
+Der Schlüssel ist der Merkmalsvektor, quantisiert auf die Auflösung der
+jeweiligen Eingabe (``FeatureSpec.resolution``): Schieberegler und
+Ganzzahlfelder auf 1, float-Felder auf 0.01, Auswahlfelder und der aus
+Gewicht/Größe berechnete BMI exakt. Zwei Eingaben, die sich in der
+Maske nicht unterscheiden lassen, teilen sich also einen Eintrag.
+
+Wechselt das Modell (Registry lädt nach einer Dateiänderung neu), wird
+der Cache geleert.
+"""
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from risk_model import FEATURE_SCHEMA, expected_features, predict_risk
+
+MAX_ENTRIES = 4096
+
+# Nachkommastellen für Werte ohne Schrittweite (BMI): nur Gleitkomma-Rauschen entfernen
+_EXACT_DIGITS = 9
+
+_RESOLUTIONS = [FEATURE_SCHEMA[name].resolution for name in expected_features]
+
+
+def quantize(values):
+    """Cache-Schlüssel für einen Merkmalsvektor (Reihenfolge wie expected_features)."""
+    return tuple(
+        int(round(value / res)) if res else round(float(value), _EXACT_DIGITS)
+        for value, res in zip(values, _RESOLUTIONS)
+    )
+
+
+class PredictionCache:
+
+    def __init__(self, maxsize=MAX_ENTRIES):
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._model = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def predict(self, model, values):
+        """Risikowahrscheinlichkeit für einen Datensatz, aus dem Cache oder neu berechnet."""
+        key = quantize(values)
+
+        with self._lock:
+            if model is not self._model:
+                # anderes Modell: alte Einträge sind ungültig
+                if self._model is not None:
+                    self.invalidations += 1
+                self._entries.clear()
+                self._model = model
+
+            prob = self._entries.get(key)
+            if prob is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return prob
+
+        prob = float(predict_risk(model, np.asarray([values], dtype=np.float64))[0])
+
+        with self._lock:
+            self.misses += 1
+            if model is self._model:
+                self._entries[key] = prob
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+        return prob
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
+
+
+# eine Instanz pro Prozess, von allen Sessions geteilt
+prediction_cache = PredictionCache()
@@ -0,0 +1,132 @@
+"""Referenzverteilung der Risikowerte in der NHANES-Stichprobe.
+
+Alle Personen aus ``nhanes_clean.csv`` werden einmal mit dem ausgelieferten
+Modell bewertet. Gespeichert werden die sortierten Scores je Schicht
+(gesamt, Geschlecht, Geschlecht × Altersgruppe) unter ``Data/store``:
+
+    python reference_scores.py      # Referenz bauen (z.B. beim Docker-Build)
+
+Das Perzentil einer Eingabe ist dann eine binäre Suche (``searchsorted``)
+im passenden Array, die Stichprobe wird pro Anfrage nicht neu bewertet.
+Ändert sich das Modell-Artefakt (sha256) oder der Datensatz, wird die
+Referenz beim nächsten Zugriff neu gebaut.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+
+import numpy as np
+
+from data_store import STORE_DIR, atomic_write, catalog
+from risk_model import FEATURE_SCHEMA, default_model_path, expected_features, load_risk_model, predict_risk
+
+REFERENCE_PATH = STORE_DIR / "nhanes_reference.npz"
+
+# Untergrenzen der Altersgruppen (NHANES: 20 bis 80 Jahre)
+AGE_BANDS = (0, 30, 40, 50, 60, 70)
+
+_GESCHLECHT = {value: label for label, value in FEATURE_SCHEMA["Geschlecht"].choices.items()}
+
+
+def age_band(alter):
+    """Index der Altersgruppe für ein Alter."""
+    return int(np.searchsorted(AGE_BANDS, alter, side="right")) - 1
+
+
+def age_band_label(band):
+    lo = AGE_BANDS[band]
+    if band == 0:
+        return f"unter {AGE_BANDS[1]}"
+    if band == len(AGE_BANDS) - 1:
+        return f"ab {lo}"
+    return f"{lo}–{AGE_BANDS[band + 1] - 1}"
+
+
+def reference_version(model_path=None):
+    """(sha256 des Modell-Artefakts, Datenversion NHANES)."""
+    model_path = Path(model_path or default_model_path())
+    return hashlib.sha256(model_path.read_bytes()).hexdigest(), catalog.version("nhanes")
+
+# -------------------------------------------------
+# AUFBAU
+# -------------------------------------------------
+
+def build_reference(model_path=None):
+    df = catalog.get("nhanes")
+    model = load_risk_model(model_path)
+    scores = predict_risk(model, df[expected_features].to_numpy(dtype=np.float64))
+
+    geschlecht = df["Geschlecht"].to_numpy()
+    band = np.searchsorted(AGE_BANDS, df["Alter"].to_numpy(), side="right") - 1
+
+    arrays = {"gesamt": np.sort(scores)}
+    for g in np.unique(geschlecht):
+        arrays[f"g{int(g)}"] = np.sort(scores[geschlecht == g])
+        for b in range(len(AGE_BANDS)):
+            mask = (geschlecht == g) & (band == b)
+            if mask.any():
+                arrays[f"g{int(g)}_a{b}"] = np.sort(scores[mask])
+
+    meta = {"version": list(reference_version(model_path))}
+    return ReferenceScores(arrays, meta)
+
+# -------------------------------------------------
+# ZUGRIFF
+# -------------------------------------------------
+
+class ReferenceScores:
+
+    def __init__(self, arrays, meta):
+        self.arrays = arrays
+        self.meta = meta
+
+    def percentile(self, prob, stratum="gesamt"):
+        """Anteil der Referenzpersonen (in %) mit niedrigerem oder gleichem Risiko."""
+        scores = self.arrays[stratum]
+        return 100.0 * np.searchsorted(scores, prob, side="right") / len(scores)
+
+    def percentiles(self, prob, alter, geschlecht):
+        """[(Beschriftung, Perzentil, Anzahl Personen)] für gesamt, Geschlecht und Altersgruppe."""
+        g, b = int(geschlecht), age_band(alter)
+        strata = [
+            ("alle Personen", "gesamt"),
+            (_GESCHLECHT.get(g, f"Geschlecht {g}"), f"g{g}"),
+            (f"{_GESCHLECHT.get(g, f'Geschlecht {g}')}, {age_band_label(b)} Jahre", f"g{g}_a{b}"),
+        ]
+        return [(label, self.percentile(prob, key), len(self.arrays[key]))
+                for label, key in strata if key in self.arrays]
+
+    def save(self, path=REFERENCE_PATH):
+        with atomic_write(path) as f:
+            np.savez(f, meta=np.array(json.dumps(self.meta)), **self.arrays)
+        return path
+
+    @classmethod
+    def load(cls, path=REFERENCE_PATH):
+        with np.load(path) as data:
+            meta = json.loads(str(data["meta"]))
+            arrays = {k: data[k] for k in data.files if k != "meta"}
+        return cls(arrays, meta)
+
+
+def load_reference(path=REFERENCE_PATH, model_path=None):
+    """Gespeicherte Referenz, falls sie zu Modell und Daten passt, sonst neu bauen."""
+    if path.exists():
+        reference = ReferenceScores.load(path)
+        if tuple(reference.meta["version"]) == reference_version(model_path):
+            return reference
+
+    reference = build_reference(model_path)
+    reference.save(path)
+    return reference
+
+
+if __name__ == "__main__":
+    import time
+
+    start = time.perf_counter()
+    reference = build_reference()
+    path = reference.save()
+    print(f"{len(reference.arrays['gesamt'])} Personen in {len(reference.arrays)} Schichten bewertet"
+          f" in {time.perf_counter() - start:.2f} s -> {path}")
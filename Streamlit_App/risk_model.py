@@ -0,0 +1,390 @@
+import hashlib
+import json
+import logging
+import math
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+# -------------------------------------------------
+# PFADE
+# -------------------------------------------------
+
+BASE_DIR = Path(__file__).resolve().parent
+MODEL_DIR = BASE_DIR / "models"
+MODEL_PATH = MODEL_DIR / "risk_model_lvl2.pkl"
+ARTIFACT_PATH = MODEL_DIR / "risk_model_lvl2.json"
+
+ARTIFACT_VERSION = 1
+
+logger = logging.getLogger(__name__)
+
+# -------------------------------------------------
+# FEATURE ORDER
+# -------------------------------------------------
+
+# Reihenfolge wie beim Training in 02_Reduced_Model_InterpretabilityV2.ipynb
+expected_features = [
+    "Alter",
+    "Geschlecht",
+    "Höchster Bildungsabschluss",
+    "Familienstand",
+    "Verhältnis zwischen Familieneinkommen und Armut",
+    "mind. 100 Zigaretten geraucht",
+    "mind. einmal Alkohol getrunken",
+    "wie oft wird Alkohol getrunken?",
+    "Gibt es Zeiträume in denen sie täglich getrunken haben?",
+    "Häufigkeit moderate körperliche Aktivitäten in Freizeit",
+    "Sitzzeit pro Tag",
+    "Trouble sleeping or sleeping too much",
+    "Asthma",
+    "COPD",
+    "Athritis",
+    "Herzinfarkt",
+    "Schlaganfall",
+    "Schilddrüsenprobleme",
+    "BMI",
+    "Depressive Symptome",
+    "Hüftumfang (cm)",
+    "Gewicht (kg)",
+    "pulse",
+    "sys_bp",
+    "dia_bp",
+    "Dauer der moderaten Aktivitäten",
+    "Häufigkeit körperl. anstrengender Aktivitäten",
+    "Schalfstunden unter der Woche",
+    "Schalfstunden am Wochenende",
+    "Energy (kcal)",
+    "Total sugars (gm)",
+    "Total fat (gm)",
+    "Dietary fiber (gm)",
+    "Protein (gm)",
+    "Cholesterol (mg)"
+]
+
+# Entscheidungsschwelle (Recall ~0.90, siehe Notebook)
+threshold = 0.40
+
+# -------------------------------------------------
+# FEATURE-SCHEMA (Wertebereiche der Eingabemaske)
+# -------------------------------------------------
+
+@dataclass(frozen=True)
+class FeatureSpec:
+    kind: str                       # "int", "float", "bool", "choice" oder "derived"
+    min: float = None
+    max: float = None
+    default: float = None           # Startwert des Widgets
+    choices: dict = None            # Beschriftung -> Modellwert (nur "choice")
+    fallback: float = None          # Wert, wenn das Feature fehlt (None = Pflichtfeld)
+    step: float = None              # Schrittweite des Widgets (None = Streamlit-Standard)
+
+    def widget_args(self):
+        """(min, max, Startwert) für st.number_input / st.slider."""
+        return self.min, self.max, self.default
+
+    @property
+    def resolution(self):
+        """Kleinste Änderung, die die Eingabemaske zulässt (None = abgeleiteter Wert)."""
+        if self.step is not None:
+            return self.step
+        if self.kind in ("int", "bool"):
+            return 1
+        if self.kind == "float":
+            return 0.01     # Standard-Schrittweite von st.number_input für float
+        return None
+
+
+def _bool():
+    return FeatureSpec("bool", 0, 1, 0)
+
+
+# Körpergröße (cm) geht nur über den BMI ins Modell ein
+GROESSE = FeatureSpec("int", 140, 220, 170)
+_GEWICHT = FeatureSpec("int", 40, 200, 75)
+
+# Gleiche Bereiche wie die Widgets in pages/4_Risikoabschaetzung.py. Die Ernährungswerte
+# sind optional, ohne Angabe werden Durchschnittswerte aus dem Datensatz verwendet.
+FEATURE_SCHEMA = {
+    "Alter": FeatureSpec("int", 18, 90, 45),
+    "Geschlecht": FeatureSpec("choice", choices={"Männlich": 1.0, "Weiblich": 2.0}),
+    "Höchster Bildungsabschluss": FeatureSpec("choice", choices={
+        "Hauptschule": 1.0,
+        "Realschule": 2.0,
+        "Abitur": 3.0,
+        "Studium abgebrochen": 4.0,
+        "Universitärer Abschluss": 5.0,
+    }),
+    "Familienstand": FeatureSpec("choice", choices={
+        "Verheiratet/Lebensgemeinschaft": 1.0,
+        "Geschieden/Getrennt/Verwitwet": 2.0,
+        "Ledig": 3.0,
+    }),
+    "Verhältnis zwischen Familieneinkommen und Armut": FeatureSpec("choice", choices={
+        "Unter Armutsgrenze": 0.8,
+        "Nahe Armutsgrenze": 1.2,
+        "Mittleres Einkommen": 2.5,
+        "Überdurchschnittliches Einkommen": 4.0,
+        "Hohes Einkommen": 5.0,
+    }),
+    "mind. 100 Zigaretten geraucht": _bool(),
+    "mind. einmal Alkohol getrunken": _bool(),
+    "wie oft wird Alkohol getrunken?": FeatureSpec("int", 0, 10, 2),
+    "Gibt es Zeiträume in denen sie täglich getrunken haben?": _bool(),
+    "Häufigkeit moderate körperliche Aktivitäten in Freizeit": FeatureSpec("int", 0, 7, 2),
+    "Sitzzeit pro Tag": FeatureSpec("int", 0, 16, 6),
+    "Trouble sleeping or sleeping too much": _bool(),
+    "Asthma": _bool(),
+    "COPD": _bool(),
+    "Athritis": _bool(),
+    "Herzinfarkt": _bool(),
+    "Schlaganfall": _bool(),
+    "Schilddrüsenprobleme": _bool(),
+    # aus Gewicht und Größe berechnet, hat daher keine eigene Schrittweite
+    "BMI": FeatureSpec("derived", _GEWICHT.min / (GROESSE.max / 100) ** 2, _GEWICHT.max / (GROESSE.min / 100) ** 2,
+                       _GEWICHT.default / (GROESSE.default / 100) ** 2),
+    "Depressive Symptome": _bool(),
+    "Hüftumfang (cm)": FeatureSpec("float", 60.0, 180.0, 95.0),
+    "Gewicht (kg)": _GEWICHT,
+    "pulse": FeatureSpec("float", 40.0, 140.0, 70.0),
+    "sys_bp": FeatureSpec("float", 80.0, 220.0, 120.0),
+    "dia_bp": FeatureSpec("float", 40.0, 140.0, 80.0),
+    "Dauer der moderaten Aktivitäten": FeatureSpec("int", 0, 300, 30),
+    "Häufigkeit körperl. anstrengender Aktivitäten": FeatureSpec("int", 0, 7, 1),
+    "Schalfstunden unter der Woche": FeatureSpec("int", 3, 12, 7),
+    "Schalfstunden am Wochenende": FeatureSpec("int", 3, 12, 8),
+    "Energy (kcal)": FeatureSpec("float", 500.0, 5000.0, 2000.0, fallback=1926.73),
+    "Total sugars (gm)": FeatureSpec("float", 0.0, 500.0, 80.0, fallback=89.9),
+    "Total fat (gm)": FeatureSpec("float", 0.0, 300.0, 70.0, fallback=80.7),
+    "Dietary fiber (gm)": FeatureSpec("float", 0.0, 80.0, 20.0, fallback=15.41),
+    "Protein (gm)": FeatureSpec("float", 0.0, 200.0, 70.0, fallback=71.56),
+    "Cholesterol (mg)": FeatureSpec("float", 0.0, 1000.0, 200.0, fallback=276.7),
+}
+
+
+# optionales Feld im Datensatz: daraus und aus dem Gewicht wird der BMI berechnet
+GROESSE_FELD = "Körpergröße (cm)"
+
+# erlaubte Abweichung zwischen angegebenem und aus Gewicht/Größe berechnetem BMI
+BMI_TOLERANZ = 0.05
+
+
+def _check_value(name, spec, value):
+    """Fehlertext für einen einzelnen Wert oder None."""
+    if isinstance(value, bool):
+        value = int(value)
+    # inf/nan (z.B. aus 1e400 oder Infinity im JSON) vor jeder int()-Umwandlung abweisen
+    if not isinstance(value, (int, float)) or (isinstance(value, float) and not math.isfinite(value)):
+        return f"{name}: keine endliche Zahl ({value!r})"
+    if spec.kind == "choice":
+        if value not in spec.choices.values():
+            return f"{name}: {value} nicht in {sorted(spec.choices.values())}"
+        return None
+    if not spec.min <= value <= spec.max:
+        return f"{name}: {value} außerhalb [{spec.min}, {spec.max}]"
+    if spec.kind in ("int", "bool") and value != int(value):
+        return f"{name}: ganze Zahl erwartet ({value})"
+    return None
+
+
+def _check_bmi(record, errors):
+    """BMI aus Gewicht und Größe berechnen bzw. gegen das Gewicht prüfen."""
+    gewicht, bmi, groesse = record.get("Gewicht (kg)"), record.get("BMI"), record.get(GROESSE_FELD)
+
+    if groesse is not None:
+        fehler = _check_value(GROESSE_FELD, GROESSE, groesse)
+        if fehler:
+            errors.append(fehler)
+            return bmi
+        if gewicht is None or _check_value("Gewicht (kg)", _GEWICHT, gewicht):
+            return bmi
+        berechnet = gewicht / (groesse / 100) ** 2
+        if bmi is not None and not _check_value("BMI", FEATURE_SCHEMA["BMI"], bmi) \
+                and abs(bmi - berechnet) > BMI_TOLERANZ:
+            errors.append(f"BMI: {bmi} passt nicht zu Gewicht {gewicht} kg und Größe {groesse} cm ({berechnet:.2f})")
+        return berechnet
+
+    # ohne Größe: die aus BMI und Gewicht folgende Größe muss im Bereich der Eingabemaske liegen
+    if bmi is not None and gewicht is not None and not _check_value("BMI", FEATURE_SCHEMA["BMI"], bmi) \
+            and not _check_value("Gewicht (kg)", _GEWICHT, gewicht):
+        groesse = 100 * math.sqrt(gewicht / bmi)
+        if not GROESSE.min <= groesse <= GROESSE.max:
+            errors.append(f"BMI: {bmi} passt nicht zu Gewicht {gewicht} kg (Größe {groesse:.0f} cm außerhalb "
+                          f"[{GROESSE.min}, {GROESSE.max}]; {GROESSE_FELD} angeben)")
+    return bmi
+
+
+def validate_record(record):
+    """Prüft einen Datensatz {Feature: Wert} gegen FEATURE_SCHEMA.
+
+    Statt ``BMI`` kann ``Körpergröße (cm)`` angegeben werden, der BMI wird dann
+    aus dem Gewicht berechnet (sind beide angegeben, müssen sie übereinstimmen).
+    Gibt die Werte in der Reihenfolge von ``expected_features`` zurück und
+    wirft ValueError mit allen gefundenen Fehlern.
+    """
+    if not isinstance(record, dict):
+        raise ValueError("Datensatz muss ein JSON-Objekt sein")
+
+    errors = [f"unbekanntes Feature: {name}" for name in record
+              if name not in FEATURE_SCHEMA and name != GROESSE_FELD]
+    record = {**record, "BMI": _check_bmi(record, errors)}
+    values = []
+
+    for name in expected_features:
+        spec = FEATURE_SCHEMA[name]
+        value = record.get(name)
+
+        if value is None:
+            if spec.fallback is None:
+                errors.append(f"{name}: fehlt")
+            values.append(spec.fallback)
+            continue
+
+        fehler = _check_value(name, spec, value)
+        if fehler:
+            errors.append(fehler)
+        values.append(int(value) if isinstance(value, bool) else value)
+
+    if errors:
+        raise ValueError("; ".join(errors))
+    return values
+
+# -------------------------------------------------
+# PORTABLES KOEFFIZIENTEN-ARTEFAKT
+# -------------------------------------------------
+
+def export_coefficients(model_path=MODEL_PATH, artifact_path=ARTIFACT_PATH):
+    """Schreibt Scaler- und Modellparameter der Pipeline als JSON-Artefakt."""
+    import joblib
+
+    pipeline = joblib.load(model_path)
+    scaler = pipeline.named_steps["scaler"]
+    model = pipeline.named_steps["model"]
+
+    features = list(getattr(pipeline, "feature_names_in_", expected_features))
+    if features != expected_features:
+        raise ValueError("Feature-Reihenfolge des Modells weicht von expected_features ab")
+
+    artifact = {
+        "version": ARTIFACT_VERSION,
+        "source": Path(model_path).name,
+        "source_sha256": hashlib.sha256(Path(model_path).read_bytes()).hexdigest(),
+        "features": features,
+        "scaler_mean": scaler.mean_.tolist(),
+        "scaler_scale": scaler.scale_.tolist(),
+        "coef": model.coef_.ravel().tolist(),
+        "intercept": float(model.intercept_[0]),
+        "threshold": threshold,
+    }
+
+    # repr() von float ist verlustfrei, die Werte werden also exakt wiederhergestellt
+    artifact_path = Path(artifact_path)
+    with tempfile.NamedTemporaryFile("w", dir=artifact_path.parent, suffix=".tmp", delete=False,
+                                     encoding="utf-8") as f:
+        f.write(json.dumps(artifact, ensure_ascii=False, indent=1))
+    os.replace(f.name, artifact_path)
+    return artifact
+
+
+def base_sha256(artifact):
+    """sha256 der Pipeline, aus der das Artefakt stammt (bei inkrementellen Versionen der Kettenanfang)."""
+    incremental = artifact.get("incremental")
+    return incremental.get("base_sha256") if incremental else artifact.get("source_sha256")
+
+
+class NumpyRiskModel:
+    """StandardScaler + LogisticRegression, nur mit NumPy ausgewertet."""
+
+    def __init__(self, artifact):
+        if artifact.get("version") != ARTIFACT_VERSION:
+            raise ValueError(f"Unbekannte Artefakt-Version: {artifact.get('version')}")
+
+        self.features = artifact["features"]
+        self.mean = np.asarray(artifact["scaler_mean"], dtype=np.float64)
+        self.scale = np.asarray(artifact["scaler_scale"], dtype=np.float64)
+        self.coef = np.asarray(artifact["coef"], dtype=np.float64)
+        self.intercept = float(artifact["intercept"])
+        self.source_sha256 = artifact.get("source_sha256")
+
+    @classmethod
+    def load(cls, artifact_path=ARTIFACT_PATH):
+        return cls(json.loads(Path(artifact_path).read_text(encoding="utf-8")))
+
+    def decision_function(self, X):
+        if hasattr(X, "columns"):
+            X = X[self.features].to_numpy(dtype=np.float64)
+        X = np.atleast_2d(np.asarray(X, dtype=np.float64))
+        return ((X - self.mean) / self.scale) @ self.coef + self.intercept
+
+    def predict_proba(self, X):
+        prob = 1.0 / (1.0 + np.exp(-self.decision_function(X)))
+        return np.column_stack([1.0 - prob, prob])
+
+
+def predict_risk(model, X):
+    """Risikowahrscheinlichkeit für die Zeilen von X (n × Features, Reihenfolge wie expected_features)."""
+    if isinstance(model, NumpyRiskModel):
+        return model.predict_proba(X)[:, 1]
+    # scikit-learn-Pipeline (Fallback ohne JSON-Artefakt) erwartet Spaltennamen
+    import pandas as pd
+    return model.predict_proba(pd.DataFrame(np.atleast_2d(X), columns=expected_features))[:, 1]
+
+
+def _file_state(path):
+    stat = path.stat()
+    return stat.st_ino, stat.st_size, stat.st_mtime_ns, stat.st_ctime_ns
+
+
+# (Stand Artefakt, Stand Pipeline) -> zu ladende Datei; geprüft wird nur nach einer Änderung
+_resolved = {}
+
+
+def _check_artifact():
+    """Artefakt, wenn es zur Pipeline passt; sonst neu exportieren oder die Pipeline selbst."""
+    artifact = json.loads(ARTIFACT_PATH.read_text(encoding="utf-8"))
+    if base_sha256(artifact) == hashlib.sha256(MODEL_PATH.read_bytes()).hexdigest():
+        return ARTIFACT_PATH
+
+    logger.warning("%s passt nicht zu %s, wird neu exportiert", ARTIFACT_PATH.name, MODEL_PATH.name)
+    try:
+        export_coefficients(MODEL_PATH, ARTIFACT_PATH)
+        return ARTIFACT_PATH
+    except Exception:
+        # z.B. keine Logistische Regression oder schreibgeschütztes Verzeichnis
+        logger.exception("Export fehlgeschlagen, %s wird direkt verwendet", MODEL_PATH.name)
+        return MODEL_PATH
+
+
+def default_model_path():
+    """Das NumPy-Artefakt, sofern es aus der aktuellen risk_model_lvl2.pkl stammt.
+
+    Wurde die Pipeline ersetzt, ohne das Artefakt neu zu schreiben (anders als
+    ``train_model.py --deploy``), liefe sonst das alte Modell weiter.
+    """
+    if not ARTIFACT_PATH.exists() or not MODEL_PATH.exists():
+        return ARTIFACT_PATH if ARTIFACT_PATH.exists() else MODEL_PATH
+
+    key = (_file_state(ARTIFACT_PATH), _file_state(MODEL_PATH))
+    if key not in _resolved:
+        _resolved[key] = _check_artifact()
+    return _resolved[key]
+
+
+def load_risk_model(path=None):
+    """Lädt das Risikomodell, bevorzugt das NumPy-Artefakt (ohne scikit-learn)."""
+    if path is None:
+        path = default_model_path()
+
+    if Path(path).suffix == ".json":
+        return NumpyRiskModel.load(path)
+
+    import joblib
+    return joblib.load(path)
+
+
+if __name__ == "__main__":
+    artifact = export_coefficients()
+    print(f"{ARTIFACT_PATH.name} geschrieben ({len(artifact['features'])} Features, Version {ARTIFACT_VERSION})")
@@ -0,0 +1,156 @@
+"""Neue Jahre der RKI-/Risikofaktor-Daten einspielen.
+
+    python rki_ingest.py krebs_inzidenz_w neue_jahre.csv
+    python rki_ingest.py risikofaktoren_m 2023.csv --check
+
+Die neuen Zeilen müssen im Format der Zieldatei vorliegen (RKI: ``;`` und
+Dezimalkomma, Risikofaktoren: ``,``) und dieselben Spalten haben. Geprüft
+wird außerdem, dass nur spätere Jahre angehängt werden und alle Werte
+Zahlen ≥ 0 sind. Danach werden
+
+  - die Zeilen an die Rohdatei angehängt (Format und Zeilenenden wie bisher),
+  - der Arrow-Datensatz neu erzeugt,
+  - Trend- und Korrelationssummen in aggregates.npz nur um die neuen Jahre
+    fortgeschrieben, die Permutations-p-Werte der betroffenen Korrelation
+    einmal neu berechnet (siehe aggregates.py),
+  - die Prognosen des Datensatzes (forecast_engine.py) und, bei Inzidenz-
+    oder Risikofaktor-Daten, das LOWESS-Gitter neu gebaut (Prozesspool hier
+    statt beim ersten Seitenaufruf in der App).
+
+Die zwischengespeicherten Abbildungen der App hängen an der Datenversion und
+werden für den geänderten Datensatz beim nächsten Aufruf neu gebaut.
+``--check`` vergleicht das Ergebnis mit einem vollständigen Neuaufbau.
+"""
+
+import argparse
+import sys
+
+import numpy as np
+
+from aggregates import consistency_report, load_aggregates
+from data_store import _READERS, SOURCES, catalog, convert
+from forecast_engine import load_forecasts
+from lowess_grid import GRID_SOURCES, build_grid
+
+# Trennzeichen und Dezimalzeichen der Rohdateien
+_FORMATS = {
+    "rki": {"sep": ";", "decimal": ",", "trailing_sep": True},
+    "risikofaktoren": {"sep": ",", "decimal": ".", "trailing_sep": False},
+}
+
+# -------------------------------------------------
+# PRÜFUNG
+# -------------------------------------------------
+
+def read_new_rows(name, path):
+    """Liest und prüft neue Zeilen für den Datensatz ``name``."""
+    if name not in SOURCES or SOURCES[name][1] not in _FORMATS:
+        raise ValueError(f"{name}: kein RKI- oder Risikofaktor-Datensatz")
+
+    fmt = SOURCES[name][1]
+    df_new = _READERS[fmt](path)
+    df_old = catalog.get(name)
+    errors = []
+
+    if list(df_new.columns) != list(df_old.columns):
+        fehlend = [c for c in df_old.columns if c not in df_new.columns]
+        neu = [c for c in df_new.columns if c not in df_old.columns]
+        errors.append(f"Spalten weichen ab (fehlend: {fehlend}, unbekannt: {neu})")
+    else:
+        jahre = df_new["Jahr"]
+        if jahre.duplicated().any():
+            errors.append(f"doppelte Jahre: {sorted(jahre[jahre.duplicated()].unique())}")
+        if (jahre <= df_old["Jahr"].max()).any():
+            errors.append(f"Jahre bis {df_old['Jahr'].max()} sind bereits vorhanden: {sorted(jahre[jahre <= df_old['Jahr'].max()])}")
+
+        values = df_new.drop(columns="Jahr")
+        nicht_numerisch = [c for c in values.columns if not np.issubdtype(values[c].dtype, np.number)]
+        if nicht_numerisch:
+            errors.append(f"keine Zahlen in: {nicht_numerisch}")
+        else:
+            if (values < 0).any().any():
+                errors.append("negative Werte")
+            if values.isna().all(axis=1).any():
+                errors.append(f"Jahre ohne Werte: {sorted(jahre[values.isna().all(axis=1)])}")
+
+    if errors:
+        raise ValueError(f"{path}: " + "; ".join(errors))
+    return df_new
+
+# -------------------------------------------------
+# ANHÄNGEN
+# -------------------------------------------------
+
+def _format_value(value, decimal):
+    if value != value:
+        return ""
+    return repr(float(value)).replace(".", decimal)
+
+
+def format_rows(df, fmt):
+    spec = _FORMATS[fmt]
+    lines = []
+    for row in df.itertuples(index=False):
+        jahr, *values = row
+        fields = [str(int(jahr))] + [_format_value(v, spec["decimal"]) for v in values]
+        lines.append(spec["sep"].join(fields) + (spec["sep"] if spec["trailing_sep"] else ""))
+    return lines
+
+
+def append_rows(name, df_new):
+    """Hängt die Zeilen an die Rohdatei an, Zeilenende wie in der Datei."""
+    path, fmt = SOURCES[name]
+    raw = path.read_bytes()
+    newline = "\r\n" if b"\r\n" in raw else "\n"
+
+    text = newline.join(format_rows(df_new, fmt)) + newline
+    if raw and not raw.endswith(b"\n"):
+        text = newline + text
+    with open(path, "a", encoding="utf-8", newline="") as f:
+        f.write(text)
+
+    convert(name)
+    return path
+
+
+def ingest(name, rows_path):
+    """Prüfen, anhängen, Aggregate und Vorberechnungen fortschreiben. Gibt (neue Zeilen, Aggregate) zurück."""
+    aggregates = load_aggregates()       # Stand vor dem Anhängen
+    df_new = read_new_rows(name, rows_path)
+    append_rows(name, df_new)
+
+    aggregates.add_rows(name, df_new)
+    aggregates.save()
+
+    load_forecasts(names=[name], parallel=True)
+    if any(name in names for names in GRID_SOURCES.values()):
+        build_grid().save()
+    return df_new, aggregates
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("dataset", choices=[n for n, (_, fmt) in SOURCES.items() if fmt in _FORMATS])
+    parser.add_argument("rows", help="CSV mit den neuen Jahren (inkl. Kopfzeile)")
+    parser.add_argument("--check", action="store_true", help="mit vollständigem Neuaufbau vergleichen")
+    args = parser.parse_args(argv)
+
+    try:
+        df_new, aggregates = ingest(args.dataset, args.rows)
+    except ValueError as exc:
+        print(f"Abgelehnt: {exc}", file=sys.stderr)
+        return 2
+
+    print(f"{args.dataset}: Jahre {', '.join(str(j) for j in df_new['Jahr'])} angehängt, Aggregate fortgeschrieben")
+
+    if args.check:
+        ok, report = consistency_report(aggregates)
+        for key, diff in report.items():
+            print(f"  {key:32s} max. Abweichung {diff:.2e}")
+        print("Konsistent mit vollständigem Neuaufbau." if ok else "ABWEICHUNG zum vollständigen Neuaufbau!")
+        return 0 if ok else 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,241 @@
+"""HTTP-Scoring-Service für das Level-2-Risikomodell (ohne Streamlit).
+
+    python scoring_service.py --port 8502 --max-batch 64 --max-wait-ms 5
+
+Endpunkte:
+    POST /score     {"Alter": 45, ...} oder [{...}, ...] oder {"records": [{...}, ...]}
+    GET  /schema    FEATURE_SCHEMA als JSON (Wertebereiche wie in der Eingabemaske)
+    GET  /health    Modell-Hash und Kennzahlen
+    GET  /metrics   Kennzahlen im Prometheus-Textformat
+
+Die Datensätze werden gegen ``FEATURE_SCHEMA`` geprüft (nur endliche Zahlen;
+statt ``BMI`` kann ``Körpergröße (cm)`` angegeben werden, siehe
+``risk_model.validate_record``), Fehler kommen je Datensatz mit 422 zurück. Gleichzeitig
+eintreffende Anfragen sammelt ein Micro-Batcher (bis ``max_batch`` Zeilen
+oder ``max_wait_ms``) und berechnet sie mit einem einzigen
+``predict_proba``-Aufruf.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import time
+from dataclasses import asdict
+
+import numpy as np
+import tornado.web
+
+from model_registry import registry
+from risk_model import FEATURE_SCHEMA, GROESSE, GROESSE_FELD, expected_features, predict_risk, threshold, validate_record
+
+logger = logging.getLogger(__name__)
+
+MAX_RECORDS_PER_REQUEST = 10_000
+
+# -------------------------------------------------
+# MICRO-BATCHING
+# -------------------------------------------------
+
+class MicroBatcher:
+    """Sammelt Zeilen aus gleichzeitigen Anfragen und scored sie gemeinsam."""
+
+    def __init__(self, max_batch=64, max_wait_ms=5.0, model_path=None):
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self.model_path = model_path
+        self._queue = asyncio.Queue()
+        self._task = None
+        self.requests = 0
+        self.rows = 0
+        self.batches = 0
+        self.batch_rows = {}      # Batchgröße -> Anzahl
+
+    def start(self):
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def score(self, X):
+        """Wahrscheinlichkeiten für die Zeilen von X (n × Features)."""
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((X, future))
+        self.requests += 1
+        return await future
+
+    async def _collect(self):
+        items = [await self._queue.get()]
+        n = len(items[0][0])
+        deadline = time.monotonic() + self.max_wait
+
+        while n < self.max_batch:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                item = await asyncio.wait_for(self._queue.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+            items.append(item)
+            n += len(item[0])
+        return items
+
+    async def _run(self):
+        while True:
+            items = await self._collect()
+            X = np.vstack([x for x, _ in items])
+
+            try:
+                probs = predict_risk(registry.get(self.model_path), X)
+            except Exception as exc:
+                logger.exception("Scoring fehlgeschlagen")
+                for _, future in items:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+
+            self.batches += 1
+            self.rows += len(X)
+            self.batch_rows[len(X)] = self.batch_rows.get(len(X), 0) + 1
+
+            start = 0
+            for x, future in items:
+                if not future.done():
+                    future.set_result(probs[start:start + len(x)])
+                start += len(x)
+
+# -------------------------------------------------
+# HTTP
+# -------------------------------------------------
+
+def parse_records(body):
+    payload = json.loads(body)
+    if isinstance(payload, dict) and "records" in payload:
+        payload = payload["records"]
+    records = payload if isinstance(payload, list) else [payload]
+
+    if not records:
+        raise ValueError("keine Datensätze")
+    if len(records) > MAX_RECORDS_PER_REQUEST:
+        raise ValueError(f"höchstens {MAX_RECORDS_PER_REQUEST} Datensätze pro Anfrage")
+
+    rows, errors = [], []
+    for i, record in enumerate(records):
+        try:
+            rows.append(validate_record(record))
+        except ValueError as exc:
+            errors.append({"index": i, "fehler": str(exc)})
+    if errors:
+        raise ValueError(errors)
+    return np.asarray(rows, dtype=np.float64)
+
+
+class _JsonHandler(tornado.web.RequestHandler):
+
+    def write_json(self, payload, status=200):
+        self.set_status(status)
+        self.set_header("Content-Type", "application/json; charset=utf-8")
+        self.finish(json.dumps(payload, ensure_ascii=False))
+
+
+class ScoreHandler(_JsonHandler):
+
+    def initialize(self, batcher):
+        self.batcher = batcher
+
+    async def post(self):
+        try:
+            X = parse_records(self.request.body)
+        except json.JSONDecodeError as exc:
+            return self.write_json({"fehler": f"ungültiges JSON: {exc}"}, 400)
+        except ValueError as exc:
+            return self.write_json({"fehler": exc.args[0]}, 422)
+
+        probs = await self.batcher.score(X)
+        self.write_json({
+            "results": [{"Risikowahrscheinlichkeit": float(p), "Erhöhtes Risiko": bool(p >= threshold)} for p in probs],
+            "threshold": threshold,
+        })
+
+
+class SchemaHandler(_JsonHandler):
+
+    def get(self):
+        self.write_json({
+            "features": expected_features,
+            "schema": {name: {k: v for k, v in asdict(spec).items() if v is not None}
+                       for name, spec in FEATURE_SCHEMA.items()},
+            # optional, BMI wird dann aus Gewicht und Größe berechnet
+            "optional": {GROESSE_FELD: {k: v for k, v in asdict(GROESSE).items() if v is not None}},
+        })
+
+
+class HealthHandler(_JsonHandler):
+
+    def initialize(self, batcher):
+        self.batcher = batcher
+
+    def get(self):
+        model = registry.get(self.batcher.model_path)
+        self.write_json({
+            "status": "ok",
+            "model_sha256": getattr(model, "source_sha256", None),
+            "requests": self.batcher.requests,
+            "rows": self.batcher.rows,
+            "batches": self.batcher.batches,
+            "registry": registry.stats(),
+        })
+
+
+class MetricsHandler(tornado.web.RequestHandler):
+
+    def initialize(self, batcher):
+        self.batcher = batcher
+
+    def get(self):
+        b = self.batcher
+        lines = [
+            "# TYPE scoring_requests_total counter", f"scoring_requests_total {b.requests}",
+            "# TYPE scoring_rows_total counter", f"scoring_rows_total {b.rows}",
+            "# TYPE scoring_batches_total counter", f"scoring_batches_total {b.batches}",
+            "# TYPE scoring_batch_rows gauge",
+        ]
+        lines += [f'scoring_batch_rows{{size="{size}"}} {n}' for size, n in sorted(b.batch_rows.items())]
+        self.set_header("Content-Type", "text/plain; version=0.0.4")
+        self.finish("\n".join(lines) + "\n")
+
+
+def make_app(batcher):
+    return tornado.web.Application([
+        (r"/score", ScoreHandler, {"batcher": batcher}),
+        (r"/schema", SchemaHandler),
+        (r"/health", HealthHandler, {"batcher": batcher}),
+        (r"/metrics", MetricsHandler, {"batcher": batcher}),
+    ])
+
+
+async def serve(port, max_batch, max_wait_ms, model_path=None):
+    batcher = MicroBatcher(max_batch, max_wait_ms, model_path)
+    registry.get(model_path)      # Modell vor der ersten Anfrage laden
+    batcher.start()
+
+    make_app(batcher).listen(port, xheaders=True)
+    logger.info("Scoring-Service auf Port %d (max_batch=%d, max_wait=%.1f ms)", port, max_batch, max_wait_ms)
+    await asyncio.Event().wait()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="HTTP-Scoring-Service für das Risikomodell")
+    parser.add_argument("--port", type=int, default=int(os.environ.get("SCORING_PORT", 8502)))
+    parser.add_argument("--max-batch", type=int, default=int(os.environ.get("SCORING_MAX_BATCH", 64)))
+    parser.add_argument("--max-wait-ms", type=float, default=float(os.environ.get("SCORING_MAX_WAIT_MS", 5)))
+    parser.add_argument("--model", default=None, help="Pfad zu .json oder .pkl (Standard: JSON-Artefakt)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    # kein Log-Eintrag pro Anfrage (bei einigen hundert Anfragen/s)
+    logging.getLogger("tornado.access").setLevel(logging.WARNING)
+    asyncio.run(serve(args.port, args.max_batch, args.max_wait_ms, args.model))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,310 @@
+"""Skriptbares Training des Risikomodells (ersetzt die Notebooks in ML-Models).
+
+Ablauf wie in 01_model_comparison.ipynb / 02_Reduced_Model_InterpretabilityV2.ipynb:
+stratifizierter 80/20-Split (random_state=42), auf dem Trainingsteil
+stratifizierte k-fache Kreuzvalidierung mit Hyperparametersuche für
+Logistische Regression, Random Forest und Entscheidungsbaum. Alle
+Kandidaten aller Modellfamilien laufen in einem gemeinsamen Prozesspool
+(``n_jobs``), die beste Pipeline wird auf dem ganzen Trainingsteil neu
+gefittet und auf dem Holdout bewertet.
+
+    python train_model.py                          # Ergebnis nach models/trained/
+    python train_model.py --family lr --deploy     # LR erzwingen und als Produktivmodell übernehmen
+    docker compose run --rm train                  # headless im Container
+
+Ausgabe: ``risk_model_lvl2.pkl``, ``risk_model_lvl2.meta.json`` (Features,
+Level-1/Level-2-Variablen, Metriken, Daten-Hash, Trainingszeit) und
+``risk_model_lvl2.split.json`` (größte SEQN der Trainingsdaten und die
+Holdout-SEQNs, für incremental_training.py).
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+
+import joblib
+import sklearn
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import f1_score, make_scorer, precision_score, recall_score, roc_auc_score
+from sklearn.model_selection import GridSearchCV, StratifiedKFold, train_test_split
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler
+from sklearn.tree import DecisionTreeClassifier
+
+from data_store import catalog
+from risk_model import ARTIFACT_PATH, MODEL_DIR, MODEL_PATH, expected_features, export_coefficients, threshold
+
+TRAINED_DIR = MODEL_DIR / "trained"
+TARGET = "Lebenszeitprävalenz"
+RANDOM_STATE = 42
+
+# -------------------------------------------------
+# VARIABLEN (wie in 02_Reduced_Model_InterpretabilityV2.ipynb)
+# -------------------------------------------------
+
+LEVEL_1_VARS = [
+    # Demografie
+    "Alter",
+    "Geschlecht",
+    "Höchster Bildungsabschluss",
+    "Familienstand",
+    "Verhältnis zwischen Familieneinkommen und Armut",
+    # Gesundheitsverhalten
+    "mind. 100 Zigaretten geraucht",
+    "mind. einmal Alkohol getrunken",
+    "wie oft wird Alkohol getrunken?",
+    "Gibt es Zeiträume in denen sie täglich getrunken haben?",
+    # Körperliche Aktivität
+    "Häufigkeit moderate körperliche Aktivitäten in Freizeit",
+    "Sitzzeit pro Tag",
+    # Schlaf
+    "Trouble sleeping or sleeping too much",
+    # Vorerkrankungen
+    "Asthma",
+    "COPD",
+    "Athritis",
+    "Herzinfarkt",
+    "Schlaganfall",
+    "Schilddrüsenprobleme",
+    # Anthropometrie
+    "BMI",
+    # Psychische Gesundheit
+    "Depressive Symptome",
+]
+
+LEVEL_2_CLINICAL_VARS = [
+    "Hüftumfang (cm)",
+    "Gewicht (kg)",
+    "pulse",
+    "sys_bp",
+    "dia_bp",
+    "Dauer der moderaten Aktivitäten",
+    "Häufigkeit körperl. anstrengender Aktivitäten",
+    "Schalfstunden unter der Woche",
+    "Schalfstunden am Wochenende",
+]
+
+LEVEL_2_NUTRITION_VARS = [
+    "Energy (kcal)",
+    "Total sugars (gm)",
+    "Total fat (gm)",
+    "Dietary fiber (gm)",
+    "Protein (gm)",
+    "Cholesterol (mg)",
+]
+
+LEVEL_2_VARS = LEVEL_1_VARS + LEVEL_2_CLINICAL_VARS + LEVEL_2_NUTRITION_VARS
+
+# die App erwartet genau diese Reihenfolge
+assert LEVEL_2_VARS == expected_features
+
+# -------------------------------------------------
+# MODELLFAMILIEN UND SUCHRÄUME
+# -------------------------------------------------
+
+# Kürzel -> (Name, Schätzer, Parameterraster für den Schritt "model")
+MODEL_FAMILIES = {
+    "lr": ("Logistic Regression",
+           LogisticRegression(max_iter=5000, class_weight="balanced", random_state=RANDOM_STATE),
+           {"model__C": [0.01, 0.1, 1.0, 10.0]}),
+    "rf": ("Random Forest",
+           RandomForestClassifier(n_estimators=300, class_weight="balanced", random_state=RANDOM_STATE),
+           {"model__max_depth": [None, 10], "model__min_samples_leaf": [1, 5]}),
+    "dt": ("Decision Tree",
+           DecisionTreeClassifier(class_weight="balanced", random_state=RANDOM_STATE),
+           {"model__max_depth": [3, 5, 8], "model__min_samples_leaf": [1, 20]}),
+}
+
+
+def _at_threshold(metric):
+    """Scorer für eine Klassifikationsmetrik bei der Entscheidungsschwelle der App."""
+    return make_scorer(lambda y, p: metric(y, p >= threshold, zero_division=0), response_method="predict_proba")
+
+
+SCORING = {
+    "roc_auc": "roc_auc",
+    "recall": _at_threshold(recall_score),
+    "precision": _at_threshold(precision_score),
+    "f1": _at_threshold(f1_score),
+}
+
+
+def param_grid(families):
+    """Ein gemeinsames Raster über alle Familien (der Schritt "model" wird ausgetauscht)."""
+    return [{"model": [MODEL_FAMILIES[f][1]], **MODEL_FAMILIES[f][2]} for f in families]
+
+# -------------------------------------------------
+# DATEN
+# -------------------------------------------------
+
+def load_training_data():
+    """(X, y, Daten-Hash): nur gültige Antworten (1 = Krebs, 2 = kein Krebs)."""
+    df = catalog.get("nhanes")
+    df = df[df[TARGET].isin([1, 2])]
+    y = (df[TARGET] == 1).astype(int)
+    return df[LEVEL_2_VARS], y, catalog.version("nhanes")
+
+
+def split_path(model_path=MODEL_PATH):
+    return Path(model_path).with_name(f"{Path(model_path).stem}.split.json")
+
+
+def split_info(X, X_test):
+    """Trainingsgrenze (größte SEQN) und Holdout-SEQNs eines Splits von ``load_training_data``."""
+    seqn = catalog.get("nhanes")["SEQN"]
+    return {
+        "max_seqn": int(seqn[X.index].max()),
+        "holdout_seqn": sorted(int(s) for s in seqn[X_test.index]),
+    }
+
+
+def load_split(model_path=MODEL_PATH):
+    """Split, auf dem die Pipeline ``model_path`` trainiert wurde (prüft den sha256 der Pipeline)."""
+    path = split_path(model_path)
+    if not path.exists():
+        raise FileNotFoundError(f"{path.name} fehlt: Pipeline mit train_model.py neu trainieren")
+    split = json.loads(path.read_text(encoding="utf-8"))
+    if split["model_sha256"] != hashlib.sha256(Path(model_path).read_bytes()).hexdigest():
+        raise ValueError(f"{path.name} gehört nicht zu {Path(model_path).name}")
+    return split
+
+
+def holdout_metrics(pipeline, X, y):
+    probs = pipeline.predict_proba(X)[:, 1]
+    pred = probs >= threshold
+    return {
+        "roc_auc": roc_auc_score(y, probs),
+        "recall": recall_score(y, pred),
+        "precision": precision_score(y, pred, zero_division=0),
+        "f1": f1_score(y, pred),
+    }
+
+# -------------------------------------------------
+# TRAINING
+# -------------------------------------------------
+
+def _family_of(estimator):
+    return next(f for f, (_, est, _) in MODEL_FAMILIES.items() if type(est) is type(estimator))
+
+
+def train(families=tuple(MODEL_FAMILIES), folds=5, refit_metric="roc_auc", n_jobs=-1):
+    """Kreuzvalidierung + Suche über alle Familien, Rückgabe (Pipeline, Metadaten, Split)."""
+    start = time.perf_counter()
+    X, y, data_hash = load_training_data()
+    X_train, X_test, y_train, y_test = train_test_split(
+        X, y, test_size=0.2, random_state=RANDOM_STATE, stratify=y)
+
+    pipeline = Pipeline([("scaler", StandardScaler()), ("model", MODEL_FAMILIES[families[0]][1])])
+    search = GridSearchCV(
+        pipeline,
+        param_grid(families),
+        scoring=SCORING,
+        refit=refit_metric,
+        cv=StratifiedKFold(n_splits=folds, shuffle=True, random_state=RANDOM_STATE),
+        n_jobs=n_jobs,
+    )
+    search.fit(X_train, y_train)
+
+    # bestes Ergebnis je Familie aus den Suchergebnissen
+    results = search.cv_results_
+    kandidaten = {}
+    for i, params in enumerate(results["params"]):
+        family = _family_of(params["model"])
+        score = results[f"mean_test_{refit_metric}"][i]
+        if family not in kandidaten or score > kandidaten[family]["cv"][refit_metric]["mean"]:
+            kandidaten[family] = {
+                "name": MODEL_FAMILIES[family][0],
+                "params": {k: v for k, v in params.items() if k != "model"},
+                "cv": {m: {"mean": float(results[f"mean_test_{m}"][i]), "std": float(results[f"std_test_{m}"][i])}
+                       for m in SCORING},
+            }
+
+    best = search.best_estimator_
+    split = split_info(X, X_test)
+    meta = {
+        "model_family": _family_of(best.named_steps["model"]),
+        "model_params": {k: v for k, v in search.best_params_.items() if k != "model"},
+        "features": list(LEVEL_2_VARS),
+        "level_1_vars": LEVEL_1_VARS,
+        "level_2_vars": LEVEL_2_VARS,
+        "target": TARGET,
+        "threshold": threshold,
+        "refit_metric": refit_metric,
+        "cv_folds": folds,
+        "cv_candidates": len(results["params"]),
+        "cv_results": kandidaten,
+        "holdout_metrics": holdout_metrics(best, X_test, y_test),
+        "n_train": len(X_train),
+        "n_holdout": len(X_test),
+        "max_seqn": split["max_seqn"],
+        "data_source": "nhanes_clean.csv",
+        "data_sha256": data_hash,
+        "random_state": RANDOM_STATE,
+        "sklearn_version": sklearn.__version__,
+        "training_seconds": time.perf_counter() - start,
+        "trained_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+    return best, meta, split
+
+
+def save(pipeline, meta, split, output_dir=TRAINED_DIR):
+    output_dir.mkdir(parents=True, exist_ok=True)
+    model_path = output_dir / MODEL_PATH.name
+    meta_path = output_dir / f"{MODEL_PATH.stem}.meta.json"
+
+    tmp = model_path.with_suffix(".tmp")
+    joblib.dump(pipeline, tmp)
+    os.replace(tmp, model_path)
+    meta_path.write_text(json.dumps(meta, ensure_ascii=False, indent=1, default=str), encoding="utf-8")
+    # Holdout einzeilig, die Liste hat über tausend Einträge
+    split = {"model_sha256": hashlib.sha256(model_path.read_bytes()).hexdigest(), **split}
+    split_path(model_path).write_text(json.dumps(split), encoding="utf-8")
+    return model_path, meta_path
+
+
+def deploy(model_path, meta):
+    """Übernimmt die Pipeline als Produktivmodell und schreibt das NumPy-Artefakt neu."""
+    if meta["model_family"] != "lr":
+        raise ValueError("Nur die Logistische Regression lässt sich als Koeffizienten-Artefakt ausliefern")
+    shutil.copyfile(model_path, MODEL_PATH)
+    shutil.copyfile(split_path(model_path), split_path(MODEL_PATH))
+    export_coefficients(MODEL_PATH, ARTIFACT_PATH)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--family", choices=list(MODEL_FAMILIES), action="append",
+                        help="nur diese Modellfamilie(n) durchsuchen (mehrfach möglich)")
+    parser.add_argument("--folds", type=int, default=5)
+    parser.add_argument("--metric", default="roc_auc", choices=list(SCORING), help="Auswahlkriterium")
+    parser.add_argument("--jobs", type=int, default=-1, help="parallele Prozesse (-1 = alle Kerne)")
+    parser.add_argument("--output-dir", type=Path, default=TRAINED_DIR)
+    parser.add_argument("--deploy", action="store_true",
+                        help=f"Ergebnis nach {MODEL_PATH.name} / {ARTIFACT_PATH.name} übernehmen")
+    args = parser.parse_args(argv)
+
+    pipeline, meta, split = train(tuple(args.family or MODEL_FAMILIES), args.folds, args.metric, args.jobs)
+    model_path, meta_path = save(pipeline, meta, split, args.output_dir)
+
+    print(f"{meta['cv_candidates']} Kandidaten, {args.folds}-fache CV in {meta['training_seconds']:.1f} s")
+    for family, result in meta["cv_results"].items():
+        cv = result["cv"]
+        print(f"  {result['name']:20s} {args.metric} {cv[args.metric]['mean']:.3f} ± {cv[args.metric]['std']:.3f}"
+              f"  recall@{threshold} {cv['recall']['mean']:.3f}  {result['params']}")
+    holdout = meta["holdout_metrics"]
+    print(f"Gewählt: {MODEL_FAMILIES[meta['model_family']][0]}, Holdout: "
+          + ", ".join(f"{k} {v:.3f}" for k, v in holdout.items()))
+    print(f"-> {model_path}\n-> {meta_path}")
+
+    if args.deploy:
+        deploy(model_path, meta)
+        print(f"-> {MODEL_PATH} und {ARTIFACT_PATH} aktualisiert")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Lineare Trendanalyse für alle Zeitreihen eines Datensatzes auf einmal.
+
+Statt pro Spalte ein ``statsmodels.OLS`` zu fitten, werden Steigung,
+Standardfehler, p-Wert, 95%-KI und Veränderung pro Dekade für alle Spalten
+einer Jahr × Serie-Tabelle in geschlossener Form berechnet. Fehlende Werte
+(dünn besetzte Risikofaktoren) werden pro Spalte maskiert.
+
+Grundlage sind die suffizienten Statistiken n, Σx, Σy, Σx², Σy², Σxy je
+Serie. Sie lassen sich bei neuen Jahren einfach aufaddieren.
+"""
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from data_store import catalog
+
+# Jahre werden um ein festes Referenzjahr zentriert, damit Σx² numerisch klein bleibt
+JAHR_REFERENZ = 2000
+
+# (Datensatz, Geschlecht) -> Name im Datenspeicher
+TREND_SOURCES = {
+    ("inzidenz", "w"): "krebs_inzidenz_w",
+    ("inzidenz", "m"): "krebs_inzidenz_m",
+    ("mortalitaet", "w"): "krebs_mortalitaet_w",
+    ("mortalitaet", "m"): "krebs_mortalitaet_m",
+    ("risikofaktoren", "w"): "risikofaktoren_w",
+    ("risikofaktoren", "m"): "risikofaktoren_m",
+}
+
+# -------------------------------------------------
+# SUFFIZIENTE STATISTIKEN
+# -------------------------------------------------
+
+def sufficient_statistics(df):
+    """Summen je Spalte einer nach Jahr sortierten Tabelle (Spalte 'Jahr' + Serien)."""
+    x = df['Jahr'].to_numpy(dtype=np.float64) - JAHR_REFERENZ
+    Y = df.drop(columns='Jahr').to_numpy(dtype=np.float64)
+    M = ~np.isnan(Y)
+    Y0 = np.where(M, Y, 0.0)
+    Mf = M.astype(np.float64)
+
+    # erster vorhandener Wert je Serie als Basis für die prozentuale Veränderung
+    first = M.argmax(axis=0)
+    baseline = Y[first, np.arange(Y.shape[1])]
+
+    return {
+        "serie": np.asarray(df.columns.drop('Jahr')),
+        "n": Mf.sum(axis=0),
+        "sx": x @ Mf,
+        "sxx": (x ** 2) @ Mf,
+        "sy": Y0.sum(axis=0),
+        "syy": (Y0 ** 2).sum(axis=0),
+        "sxy": x @ Y0,
+        "baseline": baseline,
+        "baseline_jahr": df['Jahr'].to_numpy()[first],
+    }
+
+
+def trend_from_statistics(s):
+    """OLS y = a + b*Jahr für alle Serien aus den suffizienten Statistiken."""
+    n = s["n"]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        Sxx = s["sxx"] - s["sx"] ** 2 / n
+        Sxy = s["sxy"] - s["sx"] * s["sy"] / n
+        Syy = s["syy"] - s["sy"] ** 2 / n
+
+        slope = Sxy / Sxx
+        dof = n - 2
+        sse = np.maximum(Syy - slope * Sxy, 0.0)
+        se = np.sqrt(sse / dof / Sxx)
+        t_value = slope / se
+
+        p_value = 2 * stats.t.sf(np.abs(t_value), dof)
+        t_crit = stats.t.ppf(0.975, dof)
+
+        baseline = s["baseline"]
+        perc_dekade = np.where(baseline != 0, slope * 10 / baseline * 100, np.nan)
+
+    return pd.DataFrame({
+        "serie": s["serie"],
+        "n": n.astype(int),
+        "slope": slope,
+        "se": se,
+        "p_value": p_value,
+        "ci_low": slope - t_crit * se,
+        "ci_high": slope + t_crit * se,
+        "perc_dekade": perc_dekade,
+    })
+
+# -------------------------------------------------
+# TABELLE FÜR ALLE DATENSÄTZE
+# -------------------------------------------------
+
+def build_trend_table(frames):
+    """frames: {(datensatz, geschlecht): DataFrame} -> eine Zeile je Serie."""
+    parts = []
+    for (dataset, geschlecht), df in frames.items():
+        part = trend_from_statistics(sufficient_statistics(df))
+        part.insert(0, "geschlecht", geschlecht)
+        part.insert(0, "dataset", dataset)
+        parts.append(part)
+
+    return pd.concat(parts, ignore_index=True).set_index(["dataset", "geschlecht", "serie"]).sort_index()
+
+
+def trend_table(dataset=None):
+    """Trendtabelle für alle Datensätze oder nur für ``dataset`` (beide Geschlechter)."""
+    return build_trend_table({
+        key: catalog.get(name)
+        for key, name in TREND_SOURCES.items()
+        if dataset is None or key[0] == dataset
+    })
+
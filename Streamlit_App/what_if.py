@@ -0,0 +1,106 @@
+"""What-if-Analyse für die Risikoseite.
+
+Ausgehend von der aktuellen Eingabe werden ein oder zwei Merkmale über
+ein Raster variiert und alle Rasterpunkte mit einem einzigen
+``predict_risk``-Aufruf bewertet (eine Matrix statt vieler Einzelaufrufe).
+
+Der BMI wird nie unabhängig vom Gewicht verändert: die BMI-Achse
+variiert das Gewicht bei fester Körpergröße und setzt beide Spalten.
+"""
+
+import numpy as np
+import plotly.graph_objects as go
+
+from risk_model import FEATURE_SCHEMA, expected_features, predict_risk
+
+GRID_POINTS = 41
+
+# Achsen der What-if-Analyse: Beschriftung -> Feature
+WHAT_IF_FEATURES = {
+    "BMI (über das Gewicht)": "BMI",
+    "Alkoholkonsum": "wie oft wird Alkohol getrunken?",
+    "Moderate Aktivität (Tage/Woche)": "Häufigkeit moderate körperliche Aktivitäten in Freizeit",
+    "Dauer moderater Aktivität (Minuten/Tag)": "Dauer der moderaten Aktivitäten",
+    "Anstrengende Aktivität (Tage/Woche)": "Häufigkeit körperl. anstrengender Aktivitäten",
+    "Sitzzeit pro Tag (Stunden)": "Sitzzeit pro Tag",
+    "Schlafstunden unter der Woche": "Schalfstunden unter der Woche",
+    "Hüftumfang (cm)": "Hüftumfang (cm)",
+    "Systolischer Blutdruck (mmHg)": "sys_bp",
+    "Mindestens 100 Zigaretten": "mind. 100 Zigaretten geraucht",
+}
+
+_INDEX = {name: i for i, name in enumerate(expected_features)}
+_BMI = _INDEX["BMI"]
+_GEWICHT = _INDEX["Gewicht (kg)"]
+
+
+def axis_values(feature, groesse, n=GRID_POINTS):
+    """Rasterwerte für ein Feature innerhalb der Grenzen der Eingabemaske."""
+    if feature == "BMI":
+        return axis_values("Gewicht (kg)", groesse, n) / (groesse / 100) ** 2
+
+    spec = FEATURE_SCHEMA[feature]
+    if spec.kind in ("int", "bool"):
+        # höchstens n Punkte, aber nur Werte, die das Widget auch annehmen kann
+        return np.unique(np.round(np.linspace(spec.min, spec.max, min(n, int(spec.max - spec.min) + 1))))
+    return np.linspace(spec.min, spec.max, n)
+
+
+def _set_column(X, feature, values, groesse):
+    if feature == "BMI":
+        X[:, _BMI] = values
+        X[:, _GEWICHT] = values * (groesse / 100) ** 2
+    else:
+        X[:, _INDEX[feature]] = values
+
+
+def risk_grid(model, user_input, groesse, x, y=None, n=GRID_POINTS):
+    """Risiko über ein Raster aus einem (x) oder zwei (x, y) Features.
+
+    Gibt ``(xs, ys, probs)`` zurück, ``probs`` hat die Form (len(xs),) bzw.
+    (len(ys), len(xs)); ``ys`` ist None bei nur einer Achse.
+    """
+    xs = axis_values(x, groesse, n)
+    ys = axis_values(y, groesse, n) if y else None
+
+    base = np.asarray([user_input[f] for f in expected_features], dtype=np.float64)
+    # BMI aus der Eingabe exakt übernehmen, damit nur die variierten Spalten abweichen
+    base[_BMI] = base[_GEWICHT] / (groesse / 100) ** 2
+
+    if y is None:
+        X = np.tile(base, (len(xs), 1))
+        _set_column(X, x, xs, groesse)
+        return xs, None, predict_risk(model, X)
+
+    gx, gy = np.meshgrid(xs, ys)
+    X = np.tile(base, (gx.size, 1))
+    _set_column(X, x, gx.ravel(), groesse)
+    _set_column(X, y, gy.ravel(), groesse)
+    return xs, ys, predict_risk(model, X).reshape(gx.shape)
+
+# -------------------------------------------------
+# ABBILDUNGEN
+# -------------------------------------------------
+
+def build_what_if_line(xs, probs, x_label, current=None, threshold=None):
+    fig = go.Figure(go.Scatter(x=xs, y=probs * 100, mode='lines',
+                               hovertemplate=f'{x_label}: %{{x:.1f}}<br>Risiko: %{{y:.1f}} %<extra></extra>'))
+    if current is not None:
+        fig.add_vline(x=current, line_dash='dot', annotation_text='aktuell')
+    if threshold is not None:
+        fig.add_hline(y=threshold * 100, line_dash='dash', line_color='firebrick', annotation_text='Schwelle')
+    fig.update_layout(xaxis_title=x_label, yaxis_title='Risikowahrscheinlichkeit (%)',
+                      yaxis_range=[0, 100], height=400, template='plotly_white')
+    return fig
+
+
+def build_what_if_heatmap(xs, ys, probs, x_label, y_label, current=None):
+    fig = go.Figure(go.Heatmap(
+        x=xs, y=ys, z=probs * 100, zmin=0, zmax=100, colorscale='RdYlGn_r',
+        colorbar=dict(title='Risiko (%)'),
+        hovertemplate=f'{x_label}: %{{x:.1f}}<br>{y_label}: %{{y:.1f}}<br>Risiko: %{{z:.1f}} %<extra></extra>'))
+    if current is not None:
+        fig.add_trace(go.Scatter(x=[current[0]], y=[current[1]], mode='markers', name='aktuell',
+                                 marker=dict(symbol='x', size=12, color='black'), hoverinfo='skip'))
+    fig.update_layout(xaxis_title=x_label, yaxis_title=y_label, height=500, template='plotly_white')
+    return fig
@@ -0,0 +1,243 @@
+"""Rerun-Latenz je Interaktion auf streamlit_cancer_inzidence.py (echter Streamlit-Server).
+
+    python benchmarks/fragment_reruns.py                  # aktueller Stand
+    python benchmarks/fragment_reruns.py --ref HEAD~1     # zusätzlich eine ältere Version der Seite
+
+Startet die Seite per ``streamlit run`` und spricht den Server wie der Browser
+über den Websocket an: Pill wählen, dann ein Widget ändern und die Zeit bis
+``script_finished`` messen. Liegt das Widget in einem ``st.fragment``, wird
+wie im Browser nur dieses Fragment neu ausgeführt (``fragment_id``), sonst das
+ganze Skript. Gezählt werden außerdem die gesendeten Elemente (Deltas) und
+deren Größe.
+
+AppTest kann keine Fragment-Reruns auslösen (jeder Lauf führt das ganze
+Skript aus) und eignet sich daher nicht für diesen Vergleich.
+"""
+
+import argparse
+import asyncio
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+from contextlib import contextmanager
+from pathlib import Path
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+from tornado.websocket import websocket_connect
+
+ROOT = Path(__file__).resolve().parents[1]
+APP_DIR = ROOT / "Streamlit_App"
+PAGE = "Streamlit_App/streamlit_cancer_inzidence.py"
+
+PILL_LABEL = "Auswahl der Analyse: "
+
+# (Name, Pill, Widget-Typ, Label, Werte, die der Reihe nach gesetzt werden)
+INTERACTIONS = [
+    ("Inzidenz: Prognose", "Inzidenz", "radio", "Prognose: ", ["Linear", "Log-linear", "Holt", "keine"]),
+    ("Inzidenz: Krebsart (Trend)", "Inzidenz", "selectbox", "Krebsart für die Trendanalyse wählen: ", None),
+    ("Mortalität: Krebsart (Trend)", "Mortalität", "selectbox", "Krebsart für die Trendanalyse wählen: ", None),
+    ("Risikofaktoren: Faktor (Trend)", "Risikofaktoren", "selectbox", "Krebsart für die Trendanalyse wählen: ", None),
+    ("Zusammenhang: Geschlecht", "Zusammenhang", "radio", "Geschlecht auswählen: ", ["Männer", "Frauen"]),
+    ("Zusammenhang: Krebsart", "Zusammenhang", "selectbox", "Krebsart wählen :", None),
+    ("Zusammenhang: Risikofaktor", "Zusammenhang", "selectbox", "Risikofaktor wählen :", None),
+    ("Zusammenhang: Glättung", "Zusammenhang", "slider", "Glättung der Trendlinie: ",
+     [0.2, 0.3, 0.4, 0.6, 0.7, 0.8]),
+]
+
+# -------------------------------------------------
+# SERVER
+# -------------------------------------------------
+
+# "streamlit run", aber mit TCP_NODELAY auf dem Websocket des Servers: sonst
+# bestimmen Nagle und verzögerte ACKs (~40 ms je kleiner Nachricht) die Messung
+_SERVER = """
+import sys
+import tornado.websocket
+from streamlit.web.cli import main
+
+_write = tornado.websocket.WebSocketProtocol13.write_message
+def write_message(self, *args, **kwargs):
+    self.stream.set_nodelay(True)
+    return _write(self, *args, **kwargs)
+tornado.websocket.WebSocketProtocol13.write_message = write_message
+
+sys.argv = ["streamlit", *sys.argv[1:]]
+main()
+"""
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+@contextmanager
+def serve(script, timeout=60):
+    """Startet ``streamlit run`` für ``script`` und gibt den Port zurück."""
+    port = _free_port()
+    proc = subprocess.Popen(
+        [sys.executable, "-c", _SERVER, "run", str(script), "--server.headless", "true",
+         "--server.port", str(port), "--server.fileWatcherType", "none",
+         "--browser.gatherUsageStats", "false"],
+        cwd=APP_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1)
+                break
+            except OSError:
+                if time.monotonic() > deadline or proc.poll() is not None:
+                    raise RuntimeError(f"Streamlit-Server für {script} startet nicht")
+                time.sleep(0.2)
+        yield port
+    finally:
+        proc.terminate()
+        proc.wait()
+
+# -------------------------------------------------
+# SESSION (Websocket wie im Browser)
+# -------------------------------------------------
+
+def _widget_state(kind, element, value):
+    ws = WidgetState(id=element.id)
+    if kind == "button_group":
+        ws.int_array_value.data[:] = [[o.content for o in element.options].index(value)]
+    elif kind == "radio":
+        ws.int_value = list(element.options).index(value)
+    elif kind == "selectbox":
+        ws.string_value = value
+    elif kind == "slider":
+        ws.double_array_value.data[:] = [value]
+    else:
+        raise ValueError(kind)
+    return ws
+
+
+class Session:
+
+    def __init__(self, port):
+        self.url = f"ws://127.0.0.1:{port}/_stcore/stream"
+        self.widgets = {}       # Label -> (Typ, Element-Proto, fragment_id)
+        self.states = {}        # Label -> WidgetState
+        self.page_hash = ""
+
+    async def connect(self):
+        self.ws = await websocket_connect(self.url, subprotocols=["streamlit"])
+        self.ws.protocol.stream.set_nodelay(True)
+
+    async def rerun(self, fragment_id=""):
+        """Löst einen Lauf aus; gibt (ms, Anzahl Deltas, Bytes) zurück."""
+        msg = BackMsg()
+        msg.rerun_script.page_script_hash = self.page_hash
+        msg.rerun_script.fragment_id = fragment_id
+        msg.rerun_script.widget_states.widgets.extend(self.states.values())
+
+        start = time.perf_counter()
+        await self.ws.write_message(msg.SerializeToString(), binary=True)
+        deltas = size = 0
+        while True:
+            raw = await self.ws.read_message()
+            if raw is None:
+                raise RuntimeError("Verbindung zum Server beendet")
+            fwd = ForwardMsg()
+            fwd.ParseFromString(raw)
+            kind = fwd.WhichOneof("type")
+
+            if kind == "new_session":
+                self.page_hash = fwd.new_session.page_script_hash
+            elif kind == "delta":
+                deltas += 1
+                size += len(raw)
+                self._remember(fwd.delta)
+            elif kind == "script_finished":
+                if fwd.script_finished == ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                    continue
+                return (time.perf_counter() - start) * 1e3, deltas, size
+
+    def _remember(self, delta):
+        if delta.WhichOneof("type") != "new_element":
+            return
+        element = delta.new_element
+        kind = element.WhichOneof("type")
+        if kind == "exception":
+            raise RuntimeError(element.exception.message)
+        if kind in ("button_group", "radio", "selectbox", "slider"):
+            proto = getattr(element, kind)
+            self.widgets[proto.label] = (kind, proto, delta.fragment_id)
+
+    async def set(self, label, value):
+        """Setzt ein Widget und löst den Lauf aus, den der Browser auslösen würde."""
+        kind, element, fragment_id = self.widgets[label]
+        self.states[label] = _widget_state(kind, element, value)
+        return await self.rerun(fragment_id)
+
+
+async def measure_interaction(port, pill, kind, label, values, repeat):
+    session = Session(port)
+    await session.connect()
+    await session.rerun()
+    await session.set(PILL_LABEL, pill)
+
+    if values is None:
+        # Selectbox: Optionen der Reihe nach (aufeinanderfolgende Werte sind verschieden)
+        options = list(session.widgets[label][1].options)
+        values = options[1:] + options[:1]
+    runs = []
+    for i in range(repeat + 1):
+        runs.append(await session.set(label, values[i % len(values)]))
+
+    fragment = bool(session.widgets[label][2])
+    session.ws.close()
+    runs = runs[1:]     # erster Lauf kann noch Caches füllen
+    return {
+        "ms": statistics.median(r[0] for r in runs),
+        "deltas": statistics.median(r[1] for r in runs),
+        "kb": statistics.median(r[2] for r in runs) / 1024,
+        "fragment": fragment,
+    }
+
+
+def measure(script, repeat):
+    results = {}
+    with serve(script) as port:
+        for name, pill, kind, label, values in INTERACTIONS:
+            results[name] = asyncio.run(measure_interaction(port, pill, kind, label, values, repeat))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--ref", help="Git-Revision zum Vergleich")
+    parser.add_argument("--repeat", type=int, default=9)
+    args = parser.parse_args(argv)
+
+    variants = {}
+    if args.ref:
+        # alte Seite neben die aktuelle legen, damit die lokalen Imports funktionieren
+        old = subprocess.run(["git", "show", f"{args.ref}:{PAGE}"], cwd=ROOT, capture_output=True, check=True)
+        script = APP_DIR / "_bench_ref.py"
+        script.write_bytes(old.stdout)
+        try:
+            variants[args.ref] = measure(script, args.repeat)
+        finally:
+            script.unlink()
+    variants["aktuell"] = measure(APP_DIR / Path(PAGE).name, args.repeat)
+
+    print(f"{'Interaktion':32s} {'Variante':>10s} {'Lauf':>9s} {'Rerun':>10s} {'Deltas':>7s} {'Daten':>9s}")
+    for name, *_ in INTERACTIONS:
+        for variant, results in variants.items():
+            r = results[name]
+            print(f"{name:32s} {variant:>10s} {'Fragment' if r['fragment'] else 'Skript':>9s}"
+                  f" {r['ms']:7.1f} ms {r['deltas']:7.0f} {r['kb']:6.1f} KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Startup-Benchmark der Landing Page (Streamlit_App/HomePage.py).
+
+Misst pro Variante:
+  - Importzeit: alle Top-Level-Imports der Seite in einem frischen Interpreter
+  - Payload: Größe aller Elemente (serialisierte Protobufs), die pro Rerun
+    an den Browser gehen
+  - Laufzeit eines kompletten Skriptdurchlaufs (AppTest)
+
+    python benchmarks/homepage_startup.py                 # aktueller Stand
+    python benchmarks/homepage_startup.py --ref HEAD~1    # Vergleich mit einem älteren Commit
+"""
+
+import argparse
+import ast
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+APP_DIR = ROOT / "Streamlit_App"
+PAGE = "Streamlit_App/HomePage.py"
+
+
+def _imports(source):
+    """Top-Level-Import-Anweisungen der Seite als ausführbarer Code."""
+    tree = ast.parse(source)
+    return "\n".join(ast.unparse(node) for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom)))
+
+
+def import_time(source, repeat):
+    code = f"import time; t = time.perf_counter()\n{_imports(source)}\nprint(time.perf_counter() - t)"
+    runs = []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, "-c", code], cwd=APP_DIR, capture_output=True, text=True, check=True)
+        runs.append(float(out.stdout.strip().splitlines()[-1]))
+    return statistics.median(runs)
+
+
+def payload(script_path, repeat):
+    from streamlit.testing.v1 import AppTest
+
+    # wie bei "streamlit run": Skriptverzeichnis in sys.path, damit lokale Module gefunden werden
+    if str(APP_DIR) not in sys.path:
+        sys.path.insert(0, str(APP_DIR))
+
+    at = AppTest.from_file(str(script_path), default_timeout=60)
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        at.run()
+        runs.append(time.perf_counter() - start)
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+
+    size = sum(len(node.proto.SerializeToString()) for node in at.main.children.values())
+    return size, statistics.median(runs[1:] or runs)
+
+
+def measure(label, source, repeat):
+    # Skript neben die Originalseite legen, damit die lokalen Imports funktionieren
+    script = APP_DIR / f"_bench_{label}.py"
+    script.write_text(source)
+    try:
+        size, run_seconds = payload(script, repeat)
+    finally:
+        script.unlink()
+    return {
+        "variante": label,
+        "script_bytes": len(source.encode()),
+        "payload_bytes": size,
+        "import_ms": import_time(source, repeat) * 1e3,
+        "rerun_ms": run_seconds * 1e3,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--ref", help="Git-Revision zum Vergleich")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    results = []
+    if args.ref:
+        old = subprocess.run(["git", "show", f"{args.ref}:{PAGE}"], cwd=ROOT, capture_output=True, text=True, check=True)
+        results.append(measure("ref", old.stdout, args.repeat))
+    results.append(measure("aktuell", (ROOT / PAGE).read_text(), args.repeat))
+
+    print(f"{'Variante':10s} {'Skript':>10s} {'Payload':>10s} {'Import':>10s} {'Rerun':>10s}")
+    for r in results:
+        print(f"{r['variante']:10s} {r['script_bytes'] / 1024:8.1f}KB {r['payload_bytes'] / 1024:8.1f}KB"
+              f" {r['import_ms']:8.0f}ms {r['rerun_ms']:8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Lasttest für den Scoring-Service (Streamlit_App/scoring_service.py).
+
+    python Streamlit_App/scoring_service.py &
+    python benchmarks/load_test_scoring.py --url http://localhost:8502 --concurrency 32 --duration 10
+
+Schickt zufällige, gültige Datensätze (aus FEATURE_SCHEMA, BMI über die Körpergröße) mit fester
+Parallelität und meldet Durchsatz, Latenz-Quantile und die vom Service
+gebildeten Batchgrößen.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from tornado.httpclient import AsyncHTTPClient, HTTPClientError
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "Streamlit_App"))
+
+from risk_model import FEATURE_SCHEMA, GROESSE, GROESSE_FELD  # noqa: E402
+
+
+def random_record(rng):
+    # BMI wird vom Service aus Gewicht und Größe berechnet
+    record = {GROESSE_FELD: rng.randint(int(GROESSE.min), int(GROESSE.max))}
+    for name, spec in FEATURE_SCHEMA.items():
+        if spec.kind == "derived":
+            continue
+        if spec.kind == "choice":
+            record[name] = rng.choice(list(spec.choices.values()))
+        elif spec.kind in ("int", "bool"):
+            record[name] = rng.randint(int(spec.min), int(spec.max))
+        else:
+            record[name] = round(rng.uniform(spec.min, spec.max), 1)
+    return record
+
+
+async def worker(client, url, records_per_request, deadline, rng, latencies, errors):
+    while time.monotonic() < deadline:
+        body = json.dumps([random_record(rng) for _ in range(records_per_request)])
+        start = time.perf_counter()
+        try:
+            await client.fetch(url, method="POST", body=body, headers={"Content-Type": "application/json"})
+            latencies.append((time.perf_counter() - start) * 1e3)
+        except HTTPClientError as exc:
+            errors.append(exc.code)
+
+
+async def run(url, concurrency, duration, records_per_request, seed):
+    AsyncHTTPClient.configure(None, max_clients=concurrency)
+    client = AsyncHTTPClient()
+    latencies, errors = [], []
+    deadline = time.monotonic() + duration
+
+    start = time.perf_counter()
+    await asyncio.gather(*[
+        worker(client, f"{url}/score", records_per_request, deadline, random.Random(seed + i), latencies, errors)
+        for i in range(concurrency)
+    ])
+    elapsed = time.perf_counter() - start
+
+    metrics = (await client.fetch(f"{url}/metrics")).body.decode()
+    return latencies, errors, elapsed, metrics
+
+
+def _quantile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default="http://localhost:8502")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10.0, help="Sekunden")
+    parser.add_argument("--records", type=int, default=1, help="Datensätze pro Anfrage")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    latencies, errors, elapsed, metrics = asyncio.run(
+        run(args.url, args.concurrency, args.duration, args.records, args.seed))
+
+    if not latencies:
+        print(f"keine erfolgreichen Anfragen, Fehler: {errors[:10]}")
+        return 1
+
+    print(f"Anfragen:     {len(latencies)} ok, {len(errors)} Fehler in {elapsed:.1f} s")
+    print(f"Durchsatz:    {len(latencies) / elapsed:.0f} Anfragen/s, {len(latencies) * args.records / elapsed:.0f} Datensätze/s")
+    print(f"Latenz (ms):  p50 {_quantile(latencies, 0.5):.1f}  p95 {_quantile(latencies, 0.95):.1f}"
+          f"  p99 {_quantile(latencies, 0.99):.1f}  mittel {statistics.fmean(latencies):.1f}")
+
+    sizes = {}
+    for line in metrics.splitlines():
+        if line.startswith("scoring_batch_rows{"):
+            size = int(line.split('"')[1])
+            sizes[size] = int(line.rsplit(" ", 1)[1])
+    if sizes:
+        total = sum(sizes.values())
+        mean = sum(size * n for size, n in sizes.items()) / total
+        print(f"Batches:      {total}, mittlere Größe {mean:.1f} Zeilen, größte {max(sizes)}")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
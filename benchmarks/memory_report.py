@@ -0,0 +1,151 @@
+"""Speicherbericht: gemeinsame Datensätze vs. Zusatzbedarf pro Session.
+
+    python benchmarks/memory_report.py
+    python benchmarks/memory_report.py --sessions 1 2 4 8 16 32
+
+Teil 1 zeigt je Datensatz des Katalogs (data_store.catalog) die Größe, ob
+alle Spalten direkt auf den Arrow-Puffer der Memory-Map zeigen (keine Kopie)
+und ob jeder Zugriff dasselbe Objekt liefert.
+
+Teil 2 startet nacheinander immer mehr Sessions von
+streamlit_cancer_inzidence.py (AppTest, ein Prozess wie beim Streamlit-Server)
+und lässt jede Session alle Bereiche einmal aufrufen. Gemessen wird der per
+tracemalloc belegte Python-Speicher nach jedem Schritt. Der Zusatzbedarf pro
+Session sollte dabei konstant bleiben, weil die Datensätze nur einmal pro
+Prozess im Speicher liegen.
+"""
+
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+APP_DIR = ROOT / "Streamlit_App"
+
+os.chdir(APP_DIR)
+sys.path.insert(0, str(APP_DIR))
+
+from data_store import SOURCES, catalog, store_path  # noqa: E402
+
+SCRIPT = "streamlit_cancer_inzidence.py"
+PILLS = ["Inzidenz", "Mortalität", "Risikofaktoren", "Zusammenhang"]
+
+
+def _mb(n):
+    return n / 1024 ** 2
+
+
+def _rss_bytes():
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+# -------------------------------------------------
+# TEIL 1: GEMEINSAME DATENSÄTZE
+# -------------------------------------------------
+
+def _mapped_ranges(path):
+    """Adressbereiche, unter denen ``path`` in diesen Prozess eingeblendet ist."""
+    ranges = []
+    with open("/proc/self/maps") as f:
+        for line in f:
+            fields = line.split(maxsplit=5)
+            if len(fields) == 6 and fields[5].strip() == str(path):
+                lo, hi = (int(x, 16) for x in fields[0].split("-"))
+                ranges.append((lo, hi))
+    return ranges
+
+
+def dataset_report():
+    rows = []
+    for name in SOURCES:
+        df = catalog.get(name)
+        entry = catalog.stats()[name]
+        # liegen die Spaltendaten direkt in der Memory-Map der Arrow-Datei?
+        ranges = _mapped_ranges(store_path(name))
+        shared = sum(
+            any(lo <= df[col].to_numpy().__array_interface__["data"][0] < hi for lo, hi in ranges)
+            for col in df.columns
+        )
+        rows.append({
+            "name": name,
+            "mb": _mb(entry["memory_bytes"]),
+            "spalten": df.shape[1],
+            "zero_copy": df.shape[1] - len(entry["copied_columns"]),
+            "mmap": shared,
+            "gleiches_objekt": catalog.get(name) is df,
+        })
+    return rows
+
+# -------------------------------------------------
+# TEIL 2: SESSIONS
+# -------------------------------------------------
+
+def _new_session():
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(SCRIPT, default_timeout=120)
+    at.run()
+    # AppTest verliert den Zustand der Pills zwischen Läufen, daher vor jedem Lauf neu setzen
+    for pill in PILLS:
+        at.button_group[0].set_value([pill]).run()
+        if at.exception:
+            raise RuntimeError(f"{pill}: {at.exception[0].value}")
+    return at
+
+
+def session_report(steps):
+    # eine Session vorab: lädt Datensätze, Modelle und Caches, die pro Prozess einmal entstehen
+    _new_session()
+    gc.collect()
+
+    tracemalloc.start()
+    gc.collect()
+    baseline = tracemalloc.get_traced_memory()[0]
+
+    sessions, rows = [], []
+    previous_n, previous = 0, baseline
+    for n in steps:
+        while len(sessions) < n:
+            tracemalloc.reset_peak()
+            sessions.append(_new_session())
+        gc.collect()
+        current, peak = tracemalloc.get_traced_memory()
+        rows.append({
+            "sessions": n,
+            "mb": _mb(current - baseline),
+            "pro_session_mb": _mb(current - baseline) / n,
+            "zuwachs_mb": _mb(current - previous) / (n - previous_n),
+            "spitze_mb": _mb(peak - baseline),
+            "rss_mb": _mb(_rss_bytes()),
+        })
+        previous_n, previous = n, current
+    tracemalloc.stop()
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    args = parser.parse_args(argv)
+
+    print("Gemeinsame Datensätze (einmal pro Prozess)")
+    total = 0.0
+    for row in dataset_report():
+        total += row["mb"]
+        print(f"  {row['name']:22s} {row['mb']:7.2f} MB  zero-copy {row['zero_copy']:2d}/{row['spalten']:2d} Spalten"
+              f"  auf der Memory-Map {row['mmap']:2d}/{row['spalten']:2d}"
+              f"  {'dasselbe Objekt je Zugriff' if row['gleiches_objekt'] else 'NEUES OBJEKT je Zugriff'}")
+    print(f"  {'gesamt':22s} {total:7.2f} MB")
+
+    print(f"\nSessions von {SCRIPT} (alle Bereiche besucht), Speicher über dem Grundstand")
+    print(f"  {'Sessions':>8s} {'gesamt':>10s} {'pro Session':>12s} {'je neue Session':>16s} {'Spitze':>10s} {'RSS':>10s}")
+    for row in session_report(sorted(set(args.sessions))):
+        print(f"  {row['sessions']:8d} {row['mb']:7.2f} MB {row['pro_session_mb']:9.3f} MB"
+              f" {row['zuwachs_mb']:13.3f} MB {row['spitze_mb']:7.2f} MB {row['rss_mb']:7.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,365 @@
+"""Benchmark-Suite für die heißen Pfade der App.
+
+Einzeln gemessen werden:
+  - Laden der Daten (CSV-Parsing wie früher in load_data(), Arrow-Store, Katalog)
+  - Trendanalyse, Korrelationsblock, LOWESS (einzelner Fit und vorberechnetes Gitter)
+  - Risikomodell: Laden (joblib/JSON) und predict_proba (Einzelfall und Batch)
+  - komplette Skriptläufe per Streamlit-AppTest (headless) je Pill/Interaktion
+    von streamlit_cancer_inzidence.py, pages/4_Risikoabschaetzung.py und HomePage.py
+
+Die Ergebnisse landen als JSON unter benchmarks/results/<commit>-<zeit>.json
+und lassen sich vergleichen:
+
+    python benchmarks/run_benchmarks.py                          # alles messen
+    python benchmarks/run_benchmarks.py --only app.              # nur AppTest-Läufe
+    python benchmarks/run_benchmarks.py --compare alt.json       # messen + mit alt.json vergleichen
+    python benchmarks/run_benchmarks.py --compare alt.json neu.json
+
+Bei --compare endet das Skript mit Exit-Code 1, wenn ein Median um mehr als
+--threshold (Standard 20 %) langsamer geworden ist.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from importlib import metadata
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+APP_DIR = ROOT / "Streamlit_App"
+RESULTS_DIR = ROOT / "benchmarks" / "results"
+
+# Pfade auf der Kommandozeile beziehen sich auf das Aufrufverzeichnis
+CALLER_DIR = Path.cwd()
+
+# wie bei "streamlit run": Skripte laufen im App-Verzeichnis mit flachen Imports
+os.chdir(APP_DIR)
+sys.path.insert(0, str(APP_DIR))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+PILLS = ['Inzidenz', 'Mortalität', 'Risikofaktoren', 'Zusammenhang']
+PACKAGES = ["streamlit", "pandas", "numpy", "scipy", "statsmodels", "scikit-learn", "pyarrow", "plotly"]
+
+# -------------------------------------------------
+# MESSHILFEN
+# -------------------------------------------------
+
+def _summary(samples, unit="ms"):
+    return {
+        "unit": unit,
+        "n": len(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.fmean(samples),
+        "min": min(samples),
+        "max": max(samples),
+        "samples": samples,
+    }
+
+
+def timeit(fn, repeat, warmup=1):
+    """Laufzeit von fn() in ms (nach ``warmup`` nicht gemessenen Aufrufen)."""
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1e3)
+    return _summary(samples)
+
+
+def _timed_run(at, before=None):
+    if before is not None:
+        before(at)
+    start = time.perf_counter()
+    at.run()
+    elapsed = (time.perf_counter() - start) * 1e3
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+    return elapsed
+
+# -------------------------------------------------
+# EINZELNE PFADE
+# -------------------------------------------------
+
+def bench_data(repeat):
+    from data_store import SOURCES, _READERS, catalog, load_dataset
+
+    cases = {}
+    for name, (source, fmt) in SOURCES.items():
+        cases[f"data.csv_parse.{name}"] = timeit(lambda: _READERS[fmt](source), repeat)
+        cases[f"data.store_load.{name}"] = timeit(lambda: load_dataset(name), repeat)
+        cases[f"data.catalog_get.{name}"] = timeit(lambda: catalog.get(name), repeat)
+    return cases
+
+
+def bench_trends(repeat):
+    from trend_engine import trend_table
+
+    return {
+        "trends.inzidenz": timeit(lambda: trend_table("inzidenz"), repeat),
+        "trends.alle": timeit(trend_table, repeat),
+    }
+
+
+def bench_correlation(repeat):
+    from correlation_engine import korrelation
+    from data_store import catalog
+
+    cases = {}
+    for g in ("w", "m"):
+        df_cancer, df_rf = catalog.get(f"krebs_inzidenz_{g}"), catalog.get(f"risikofaktoren_{g}")
+        cases[f"correlation.{g}"] = timeit(lambda: korrelation(df_cancer, df_rf), repeat)
+    return cases
+
+
+def bench_lowess(repeat):
+    import numpy as np
+    from statsmodels.nonparametric.smoothers_lowess import lowess
+
+    from correlation_engine import align_years
+    from data_store import catalog
+    from lowess_grid import GRID_PATH, LowessGrid, load_grid
+
+    df_cancer, df_rf = align_years(catalog.get("krebs_inzidenz_w"), catalog.get("risikofaktoren_w"))
+    krebs, rf = df_cancer.columns[0], df_rf.columns[0]
+    x, y = df_rf[rf], df_cancer[krebs]
+    order = np.argsort(x)
+
+    grid = load_grid()
+    return {
+        "lowess.fit_einzeln": timeit(lambda: lowess(y.iloc[order], x.iloc[order], frac=0.5), repeat),
+        "lowess.grid_laden": timeit(lambda: LowessGrid.load(GRID_PATH), repeat),
+        "lowess.grid_lookup": timeit(lambda: (grid.curve("w", krebs, rf, 0.5), grid.kennwerte("w", krebs, rf, 0.5)), repeat),
+    }
+
+
+def bench_model(repeat):
+    import joblib
+    import numpy as np
+    import pandas as pd
+
+    from data_store import catalog
+    from model_registry import registry
+    from risk_model import ARTIFACT_PATH, MODEL_PATH, NumpyRiskModel, expected_features
+
+    X = catalog.get("nhanes")[expected_features].astype("float64")
+    einzeln = X.iloc[[0]]
+    batch = pd.concat([X] * max(1, 10_000 // len(X) + 1), ignore_index=True).iloc[:10_000]
+
+    sklearn_model = joblib.load(MODEL_PATH)
+    numpy_model = NumpyRiskModel.load(ARTIFACT_PATH)
+    registry.get()
+
+    return {
+        "model.joblib_load": timeit(lambda: joblib.load(MODEL_PATH), repeat),
+        "model.json_load": timeit(lambda: NumpyRiskModel.load(ARTIFACT_PATH), repeat),
+        "model.registry_get": timeit(registry.get, repeat),
+        "model.sklearn_predict_einzeln": timeit(lambda: sklearn_model.predict_proba(einzeln), repeat),
+        "model.numpy_predict_einzeln": timeit(lambda: numpy_model.predict_proba(einzeln), repeat),
+        "model.sklearn_predict_10k": timeit(lambda: sklearn_model.predict_proba(batch), repeat),
+        "model.numpy_predict_10k": timeit(lambda: numpy_model.predict_proba(np.asarray(batch)), repeat),
+    }
+
+# -------------------------------------------------
+# KOMPLETTE SKRIPTLÄUFE (AppTest)
+# -------------------------------------------------
+
+def _app(script):
+    from streamlit.testing.v1 import AppTest
+
+    return AppTest.from_file(script, default_timeout=120)
+
+
+def _series(at, before, repeat):
+    """Erster Lauf (kalt) und Median der folgenden Wiederholungen (warm)."""
+    cold = _timed_run(at, before)
+    warm = [_timed_run(at, before) for _ in range(repeat)]
+    return _summary([cold]), _summary(warm)
+
+
+def bench_app_cancer(repeat):
+    cases = {}
+
+    # AppTest verliert den Zustand der Pills zwischen Läufen, daher vor jedem Lauf neu setzen
+    keine_auswahl = lambda at: at.button_group[0].set_value([]) if at.button_group else None
+    at = _app("streamlit_cancer_inzidence.py")
+    cases["app.cancer.start.kalt"], cases["app.cancer.start.warm"] = _series(at, keine_auswahl, repeat)
+
+    for pill in PILLS:
+        select = lambda at, pill=pill: at.button_group[0].set_value([pill])
+        at = _app("streamlit_cancer_inzidence.py")
+        at.run()
+        cases[f"app.cancer.{pill}.kalt"], cases[f"app.cancer.{pill}.warm"] = _series(at, select, repeat)
+
+    # Interaktionen im Bereich Zusammenhang
+    select = lambda at: at.button_group[0].set_value(['Zusammenhang'])
+    at = _app("streamlit_cancer_inzidence.py")
+    at.run()
+    _timed_run(at, select)
+
+    fracs = iter([0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9] * (repeat + 1))
+    cases["app.cancer.Zusammenhang.slider"] = _summary(
+        [_timed_run(at, lambda at: (at.slider[0].set_value(next(fracs)), select(at))) for _ in range(repeat)])
+
+    geschlechter = iter(["Männer", "Frauen"] * (repeat + 1))
+    cases["app.cancer.Zusammenhang.geschlecht"] = _summary(
+        [_timed_run(at, lambda at: (at.radio[0].set_value(next(geschlechter)), select(at))) for _ in range(repeat)])
+    return cases
+
+
+def bench_app_risiko(repeat):
+    cases = {}
+    script = "pages/4_Risikoabschaetzung.py"
+
+    at = _app(script)
+    cases["app.risiko.start.kalt"], cases["app.risiko.start.warm"] = _series(at, None, repeat)
+
+    at = _app(script)
+    at.run()
+    click = lambda at: at.button[0].click()
+    cases["app.risiko.berechnen.kalt"], cases["app.risiko.berechnen.warm"] = _series(at, click, repeat)
+
+    ages = iter(range(30, 30 + repeat + 1))
+    cases["app.risiko.alter_aendern"] = _summary(
+        [_timed_run(at, lambda at: (at.number_input[0].set_value(next(ages)), at.button[0].click()))
+         for _ in range(repeat)])
+    return cases
+
+
+def bench_app_homepage(repeat):
+    from homepage_startup import measure
+
+    source = (APP_DIR / "HomePage.py").read_text()
+    result = measure("suite", source, repeat)
+    return {
+        "app.homepage.rerun": _summary([result["rerun_ms"]]),
+        "app.homepage.import": _summary([result["import_ms"]]),
+        "app.homepage.payload": _summary([result["payload_bytes"]], unit="bytes"),
+    }
+
+
+GROUPS = {
+    "data": bench_data,
+    "trends": bench_trends,
+    "correlation": bench_correlation,
+    "lowess": bench_lowess,
+    "model": bench_model,
+    "app.cancer": bench_app_cancer,
+    "app.risiko": bench_app_risiko,
+    "app.homepage": bench_app_homepage,
+}
+
+# -------------------------------------------------
+# ERGEBNISSE
+# -------------------------------------------------
+
+def _git(*args):
+    out = subprocess.run(["git", *args], cwd=ROOT, capture_output=True, text=True)
+    return out.stdout.strip()
+
+
+def environment():
+    versions = {}
+    for package in PACKAGES:
+        try:
+            versions[package] = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            versions[package] = None
+    return {
+        "commit": _git("rev-parse", "HEAD"),
+        "subject": _git("log", "-1", "--format=%s"),
+        "dirty": bool(_git("status", "--porcelain", "--untracked-files=no")),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "packages": versions,
+    }
+
+
+def run(only=None, repeat=5):
+    import warnings
+
+    from streamlit import logger
+
+    # Streamlit warnt im Bare-Mode und bei Deprecations bei jedem Lauf
+    logger.set_log_level("error")
+    warnings.simplefilter("ignore")
+
+    cases = {}
+    for group, bench in GROUPS.items():
+        if only and not any(group.startswith(o) or o.startswith(group) for o in only):
+            continue
+        print(f"[{group}]", file=sys.stderr)
+        for name, result in bench(repeat).items():
+            if not only or any(name.startswith(o) for o in only):
+                cases[name] = result
+    return {"environment": environment(), "repeat": repeat, "cases": cases}
+
+
+def save(results):
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    env = results["environment"]
+    stamp = env["timestamp"].replace(":", "").replace("-", "")[:15]
+    path = RESULTS_DIR / f"{env['commit'][:10]}{'-dirty' if env['dirty'] else ''}-{stamp}.json"
+    path.write_text(json.dumps(results, indent=2, ensure_ascii=False))
+    return path
+
+
+def report(results):
+    for name, case in results["cases"].items():
+        value = case["median"]
+        formatted = f"{value / 1024:10.1f} KB" if case["unit"] == "bytes" else f"{value:10.2f} ms"
+        print(f"{name:55s} {formatted}  (n={case['n']})")
+
+
+def compare(old, new, threshold):
+    """Gibt die Anzahl der Fälle zurück, deren Median um mehr als ``threshold`` gestiegen ist."""
+    print(f"alt: {old['environment']['commit'][:10]} {old['environment']['subject']}")
+    print(f"neu: {new['environment']['commit'][:10]} {new['environment']['subject']}")
+    regressions = 0
+    for name, case in new["cases"].items():
+        if name not in old["cases"]:
+            continue
+        before, after = old["cases"][name]["median"], case["median"]
+        ratio = after / before if before else float("inf")
+        flag = ""
+        if ratio > 1 + threshold:
+            flag = "  <-- langsamer"
+            regressions += 1
+        elif ratio < 1 / (1 + threshold):
+            flag = "  schneller"
+        print(f"{name:55s} {before:10.2f} -> {after:10.2f}  x{ratio:5.2f}{flag}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--only", nargs="+", help="nur Fälle mit diesem Präfix (z.B. model. app.cancer)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--compare", nargs="+", metavar="JSON", help="alt.json [neu.json]")
+    parser.add_argument("--threshold", type=float, default=0.20)
+    args = parser.parse_args(argv)
+
+    if args.compare and len(args.compare) == 2:
+        old, new = (json.loads((CALLER_DIR / p).read_text()) for p in args.compare)
+    else:
+        new = run(args.only, args.repeat)
+        print(f"gespeichert: {save(new)}", file=sys.stderr)
+        report(new)
+        if not args.compare:
+            return 0
+        old = json.loads((CALLER_DIR / args.compare[0]).read_text())
+
+    return 1 if compare(old, new, args.threshold) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
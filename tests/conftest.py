@@ -0,0 +1,9 @@
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+APP_DIR = ROOT / "Streamlit_App"
+
+# wie bei "streamlit run": App-Verzeichnis in sys.path, damit die lokalen Module gefunden werden
+if str(APP_DIR) not in sys.path:
+    sys.path.insert(0, str(APP_DIR))
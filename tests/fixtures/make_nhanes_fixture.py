@@ -0,0 +1,80 @@
+"""Erzeugt die NHANES-Testdaten unter ``tests/fixtures/nhanes``.
+
+Je Komponente aus nhanes_etl.CLEAN_COLUMNS eine kleine XPT-Datei (SAS-
+Transportformat Version 5, wie die NHANES-Downloads) mit wenigen SEQNs, dazu
+``expected.csv`` mit den Zeilen, die ``build_clean`` daraus machen muss. Die
+Dateien sind eingecheckt; neu erzeugen nur, wenn sich die Variablenliste
+ändert (benötigt pyreadstat, nicht Teil von requirements.txt):
+
+    python tests/fixtures/make_nhanes_fixture.py
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyreadstat
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "Streamlit_App"))
+
+from nhanes_etl import CLEAN_COLUMNS, component_path, components  # noqa: E402
+
+FIXTURE_DIR = Path(__file__).resolve().parent / "nhanes"
+CYCLE = "L"
+
+# SEQN -> abweichende Werte (NHANES-Variable -> Wert); Kommentar = erwartetes Ergebnis
+PERSONEN = {
+    130383: {},                                      # vollständig, bleibt
+    130378: {"MCQ220": 1.0, "MCQ230A": 30.0},        # Krebsdiagnose mit Krebstyp, bleibt
+    130379: {"DMDEDUC2": 9.0, "ALQ121": 77.0},       # Antwortcodes 9/77 bleiben erhalten
+    130380: {"RIDAGEYR": 17.0},                      # unter MIN_AGE, entfällt
+    130381: {"BMXBMI": np.nan},                      # Pflichtwert fehlt, entfällt
+    130382: {},                                      # fehlt in BPXO (inner join), entfällt
+}
+FEHLT_IN = {130382: "BPXO"}
+# zweite Zeile derselben Person (z.B. Ernährungs-Tag 2), nur die erste zählt
+DOPPELT_IN = {130383: "DR1TOT"}
+ERWARTET = [130378, 130379, 130383]
+
+
+def grundwert(seqn, i):
+    return (seqn % 100) + i / 4
+
+
+def person(seqn):
+    """NHANES-Variable -> Wert für eine Person."""
+    values = {variable: grundwert(seqn, i) for i, (_, variable) in enumerate(CLEAN_COLUMNS.values())}
+    values.update({"SEQN": float(seqn), "RIDAGEYR": 40.0, "MCQ220": 2.0, "MCQ230A": np.nan})
+    values.update(PERSONEN[seqn])
+    return values
+
+
+def main():
+    FIXTURE_DIR.mkdir(parents=True, exist_ok=True)
+    werte = {seqn: person(seqn) for seqn in PERSONEN}
+
+    for component, columns in components().items():
+        variables = ["SEQN", *columns]
+        rows = []
+        # absteigend, damit der Test auch die Sortierung nach SEQN prüft
+        for seqn in sorted(PERSONEN, reverse=True):
+            if FEHLT_IN.get(seqn) == component:
+                continue
+            rows.append([werte[seqn][v] for v in variables])
+            if DOPPELT_IN.get(seqn) == component:
+                rows.append([werte[seqn]["SEQN"], *(werte[seqn][v] + 1000 for v in variables[1:])])
+        df = pd.DataFrame(rows, columns=variables)
+        pyreadstat.write_xport(df, str(component_path(FIXTURE_DIR, component, CYCLE)),
+                               file_format_version=5, table_name=f"{component}_{CYCLE}")
+
+    expected = pd.DataFrame([[werte[seqn][v] for _, v in CLEAN_COLUMNS.values()] for seqn in ERWARTET],
+                            columns=list(CLEAN_COLUMNS))
+    expected["SEQN"] = expected["SEQN"].astype("int64")
+    expected.to_csv(FIXTURE_DIR / "expected.csv", index=False)
+    print(f"{len(components())} Komponenten, {len(PERSONEN)} Personen -> {FIXTURE_DIR}")
+
+
+if __name__ == "__main__":
+    main()
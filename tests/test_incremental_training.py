@@ -0,0 +1,58 @@
+"""incremental_training.run mit an nhanes_clean.csv angehängten Zeilen (Kopie unter tmp_path)."""
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import data_store
+import incremental_training
+from train_model import TARGET, load_split
+
+N_NEU = 500
+
+
+@pytest.fixture
+def angehaengt(tmp_path, monkeypatch):
+    """nhanes_clean.csv mit N_NEU zusätzlichen Personen (neue SEQNs) als Datenquelle der App."""
+    source, fmt = data_store.SOURCES["nhanes"]
+    df = pd.read_csv(source)
+    neu = df.sample(N_NEU, random_state=0).assign(SEQN=df["SEQN"].max() + 1 + np.arange(N_NEU))
+    path = tmp_path / source.name
+    pd.concat([df, neu]).to_csv(path, index=False)
+
+    monkeypatch.setitem(data_store.SOURCES, "nhanes", (path, fmt))
+    monkeypatch.setattr(data_store, "STORE_DIR", tmp_path / "store")
+    monkeypatch.setattr(incremental_training, "INCREMENTAL_DIR", tmp_path / "incremental")
+    return neu
+
+
+def test_first_run_trains_appended_rows(angehaengt):
+    target, report = incremental_training.run()
+
+    assert target.name == "risk_model_lvl2_v0001.json"
+    assert report["parent_version"] == 0
+    assert report["new_rows"] == angehaengt[TARGET].isin([1, 2]).sum()
+    # Holdout des ursprünglichen Fits, nicht neu aus der erweiterten Datei gezogen
+    assert report["n_holdout"] == len(load_split()["holdout_seqn"])
+
+    artifact = json.loads(target.read_text(encoding="utf-8"))
+    assert artifact["incremental"]["max_seqn"] == angehaengt["SEQN"].max()
+
+    # zweiter Lauf: nichts Neues
+    assert incremental_training.run() == (None, None)
+
+
+def test_restarts_from_pipeline_after_redeploy(angehaengt):
+    target, _ = incremental_training.run()
+
+    # v0001 stammt von einer anderen (früher ausgelieferten) Pipeline
+    artifact = json.loads(target.read_text(encoding="utf-8"))
+    artifact["incremental"]["base_sha256"] = "0" * 64
+    target.write_text(json.dumps(artifact), encoding="utf-8")
+
+    target, report = incremental_training.run()
+    assert target.name == "risk_model_lvl2_v0002.json"
+    assert report["parent_version"] == 0
+    assert report["new_rows"] == angehaengt[TARGET].isin([1, 2]).sum()
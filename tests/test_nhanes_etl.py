@@ -0,0 +1,35 @@
+"""nhanes_etl.build_clean auf den eingecheckten XPT-Testdaten (tests/fixtures/nhanes)."""
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from nhanes_etl import OUTPUT_PATH, build_clean, write_clean
+
+FIXTURE_DIR = Path(__file__).resolve().parent / "fixtures" / "nhanes"
+
+
+@pytest.fixture(scope="module")
+def clean():
+    # kleine Blöcke, damit mehrere Chunks je Datei gelesen werden
+    return build_clean(FIXTURE_DIR, cycle="L", workers=2, chunksize=2)
+
+
+def test_columns_match_nhanes_clean_csv(clean):
+    assert list(clean.columns) == list(pd.read_csv(OUTPUT_PATH, nrows=0).columns)
+
+
+def test_rows(clean):
+    expected = pd.read_csv(FIXTURE_DIR / "expected.csv")
+    pd.testing.assert_frame_equal(clean, expected, check_dtype=False)
+
+
+def test_written_csv_round_trip(clean, tmp_path):
+    path = write_clean(clean, tmp_path / "nhanes_clean.csv")
+    pd.testing.assert_frame_equal(pd.read_csv(path), pd.read_csv(FIXTURE_DIR / "expected.csv"))
+
+
+def test_missing_component(tmp_path):
+    with pytest.raises(FileNotFoundError, match="DEMO_L.xpt"):
+        build_clean(tmp_path)
@@ -0,0 +1,52 @@
+"""default_model_path: das JSON-Artefakt nur, solange es zur Pipeline passt."""
+
+import json
+import shutil
+
+import joblib
+import pytest
+
+import risk_model
+from model_registry import ModelRegistry
+
+
+@pytest.fixture
+def models(tmp_path, monkeypatch):
+    """Kopie von Pipeline und Artefakt unter tmp_path."""
+    model_path = tmp_path / risk_model.MODEL_PATH.name
+    artifact_path = tmp_path / risk_model.ARTIFACT_PATH.name
+    shutil.copyfile(risk_model.MODEL_PATH, model_path)
+    shutil.copyfile(risk_model.ARTIFACT_PATH, artifact_path)
+    monkeypatch.setattr(risk_model, "MODEL_PATH", model_path)
+    monkeypatch.setattr(risk_model, "ARTIFACT_PATH", artifact_path)
+    return model_path, artifact_path
+
+
+def test_matching_artifact(models):
+    _, artifact_path = models
+    before = artifact_path.read_bytes()
+    assert risk_model.default_model_path() == artifact_path
+    assert artifact_path.read_bytes() == before
+
+
+def test_replaced_pipeline_is_exported(models):
+    model_path, artifact_path = models
+    registry = ModelRegistry()
+    old = registry.get()
+
+    # andere Pipeline ausgeliefert, Artefakt nicht neu geschrieben
+    pipeline = joblib.load(model_path)
+    pipeline.named_steps["model"].intercept_ = pipeline.named_steps["model"].intercept_ + 1.0
+    joblib.dump(pipeline, model_path)
+
+    assert risk_model.default_model_path() == artifact_path
+    artifact = json.loads(artifact_path.read_text(encoding="utf-8"))
+    assert artifact["intercept"] == pytest.approx(old.intercept + 1.0)
+    assert registry.get().intercept == pytest.approx(old.intercept + 1.0)
+
+
+def test_falls_back_to_pipeline(models):
+    model_path, _ = models
+    # kein StandardScaler + LogisticRegression: kein Koeffizienten-Export möglich
+    joblib.dump({"kein": "Modell"}, model_path)
+    assert risk_model.default_model_path() == model_path